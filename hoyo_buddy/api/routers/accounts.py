@@ -8,6 +8,7 @@ from loguru import logger
 
 from hoyo_buddy.api.utils import decrypt_string
 from hoyo_buddy.constants import GPY_GAME_TO_HB_GAME, locale_to_hoyo_lang
+from hoyo_buddy.db.account_cache import AccountCache
 from hoyo_buddy.db.models import AccountNotifSettings, HoyoAccount, Settings, User
 from hoyo_buddy.enums import Locale, Platform
 from hoyo_buddy.hoyo.clients.gpy import ProxyGenshinClient
@@ -204,6 +205,7 @@ async def submit_accounts(
     if last_account is not None:
         await HoyoAccount.filter(user_id=user_id).update(current=False)
         await HoyoAccount.filter(id=last_account.id).update(current=True)
+        AccountCache.invalidate(user_id)
 
     # Clear login flow from session
     session.pop("login_flow", None)
@@ -19,12 +19,14 @@ from discord.ext import commands
 from loguru import logger
 from seria.utils import write_json
 
+from hoyo_buddy.bot.dm import DMSender
 from hoyo_buddy.bot.error_handler import get_error_embed
 from hoyo_buddy.cache import OrjsonSerializer, image_cache
 from hoyo_buddy.commands.configs import COMMANDS
 from hoyo_buddy.commands.leaderboard import LeaderboardCommand
 from hoyo_buddy.constants import (
     GUILD_ID,
+    PLATFORM_TO_REGION,
     POOL_MAX_WORKERS,
     ZENLESS_DATA_LANGS,
     ZZZ_AVATAR_BATTLE_TEMP_JSON,
@@ -34,13 +36,22 @@ from hoyo_buddy.constants import (
     ZZZ_TEXT_MAP_URL,
 )
 from hoyo_buddy.db import get_locale, models
+from hoyo_buddy.db.account_cache import AccountCache
 from hoyo_buddy.db.models import Settings
 from hoyo_buddy.db.utils import build_account_query
 from hoyo_buddy.draw.card_data import CARD_DATA
 from hoyo_buddy.enums import Game, LeaderboardType
 from hoyo_buddy.exceptions import NoAccountFoundError
+from hoyo_buddy.hoyo.character_choices import CharacterChoices
 from hoyo_buddy.hoyo.clients.novel_ai import NAIClient
-from hoyo_buddy.l10n import BOT_DATA_PATH, AppCommandTranslator, EnumStr, LocaleStr, translator
+from hoyo_buddy.l10n import (
+    BOT_DATA_PATH,
+    CATALOG_PATH,
+    AppCommandTranslator,
+    EnumStr,
+    LocaleStr,
+    translator,
+)
 from hoyo_buddy.utils import (
     capture_exception,
     fetch_json,
@@ -54,6 +65,7 @@ from .command_tree import CommandTree
 
 if TYPE_CHECKING:
     import concurrent.futures
+    import pathlib
     from collections.abc import Sequence
     from enum import StrEnum
 
@@ -68,10 +80,17 @@ if TYPE_CHECKING:
 __all__ = ("HoyoBuddy",)
 
 
-def init_worker() -> None:
-    """Initializes the translator in a new process."""
+def init_worker(catalog_path: pathlib.Path | None = None) -> None:
+    """Initializes the translator in a new process.
+
+    The translation catalog dumped by the main process is memory-mapped when given,
+    so workers share its pages instead of each loading and compiling their own copy.
+    """
     logger.info(f"Initializing worker process {os.getpid()}...")
-    translator.load_sync()
+    if catalog_path is not None and catalog_path.exists():
+        translator.map_catalog(catalog_path)
+    if not translator.loaded:
+        translator.load_sync()
     if image_cache is not None:
         image_cache.connect()
 
@@ -139,9 +158,11 @@ class HoyoBuddy(commands.AutoShardedBot):
         )
 
         self.geetest_command_task: asyncio.Task | None = None
+        self.account_cache_task: asyncio.Task | None = None
         self.farm_check_running: bool = False
 
         self.executor = executor
+        self.dm_sender = DMSender(self)
 
     @staticmethod
     def get_command_name(command: app_commands.Command) -> str:
@@ -170,8 +191,16 @@ class HoyoBuddy(commands.AutoShardedBot):
 
     async def start_process_pool(self) -> None:
         """Starts the process pool and initializes the translators."""
+        catalog_path: pathlib.Path | None = CATALOG_PATH
+        try:
+            await asyncio.to_thread(translator.dump_catalog, CATALOG_PATH)
+        except OSError:
+            logger.exception("Failed to dump translation catalog, workers will load their own")
+            catalog_path = None
+
         tasks = [
-            self.loop.run_in_executor(self.executor, init_worker) for _ in range(POOL_MAX_WORKERS)
+            self.loop.run_in_executor(self.executor, init_worker, catalog_path)
+            for _ in range(POOL_MAX_WORKERS)
         ]
         await asyncio.gather(*tasks)
 
@@ -204,7 +233,7 @@ class HoyoBuddy(commands.AutoShardedBot):
         return synced_commands
 
     async def setup_hook(self) -> None:
-        await self.start_process_pool()
+        self.account_cache_task = asyncio.create_task(AccountCache.listen())
 
         # Initialize genshin.py sqlite cache
         async with aiosqlite.connect("genshin_py.db") as conn:
@@ -218,7 +247,9 @@ class HoyoBuddy(commands.AutoShardedBot):
         if not translator.loaded:
             await self.update_assets()
             await translator.load()
-            await self.start_process_pool()
+        await self.start_process_pool()
+
+        await CharacterChoices.build()
 
         await self._load_cogs()
         await self.load_extension("jishaku")
@@ -261,22 +292,7 @@ class HoyoBuddy(commands.AutoShardedBot):
     async def dm_user(
         self, user_id: int, *, content: str | None = None, **kwargs
     ) -> tuple[discord.Message | None, bool]:
-        logger.debug(f"DMing user {user_id}")
-
-        try:
-            channel = await models.DMChannel.get_or_none(user_id=user_id)
-            if channel is None:
-                user = self.get_user(user_id) or await self.fetch_user(user_id)
-                dm_channel = user.dm_channel or await user.create_dm()
-                channel = await models.DMChannel.create(user_id=user_id, id=dm_channel.id)
-            message = await self.get_partial_messageable(channel.id).send(content, **kwargs)
-        except discord.Forbidden:
-            return None, False
-        except Exception as e:
-            self.capture_exception(e)
-            return None, True
-        else:
-            return message, False
+        return await self.dm_sender.send(user_id, content, **kwargs)
 
     def get_error_choice(
         self, error_message: LocaleStr | str | Exception, locale: Locale
@@ -331,6 +347,9 @@ class HoyoBuddy(commands.AutoShardedBot):
     ) -> list[discord.app_commands.Choice[str]]:
         """Get autocomplete choices for a user's accounts.
 
+        Accounts and formatted choices are cached per user by AccountCache, so only the
+        first keystroke queries the database.
+
         Args:
             user: The user object to query the accounts with.
             author_id: The interaction author's ID.
@@ -341,15 +360,35 @@ class HoyoBuddy(commands.AutoShardedBot):
             show_id: Whether to show the account ID.
         """
         is_author = user is None or user.id == author_id
+        user_id = author_id if user is None else user.id
+
+        entry = AccountCache.get(user_id)
+        if entry is None:
+            entry = AccountCache.set(user_id, await models.HoyoAccount.filter(user_id=user_id))
 
-        query = build_account_query(
-            games=games, platform=platform, user_id=author_id if user is None else user.id
+        key = (locale, tuple(games), platform, is_author, show_id)
+        choices: tuple[tuple[str, discord.app_commands.Choice[str]], ...] | None = (
+            entry.choices.get(key)
         )
-        accounts = await models.HoyoAccount.filter(query)
-        if not is_author:
-            accounts = [account for account in accounts if account.public]
+        if choices is None:
+            region = None if platform is None else PLATFORM_TO_REGION[platform]
+            choices = entry.choices[key] = tuple(
+                (
+                    str(account).lower(),
+                    discord.app_commands.Choice(
+                        name=self._get_account_choice_name(
+                            account, locale, is_author=is_author, show_id=show_id
+                        ),
+                        value=str(account.id),
+                    ),
+                )
+                for account in entry.accounts
+                if account.game in games
+                and (region is None or account.region == region)
+                and (is_author or account.public)
+            )
 
-        if not accounts:
+        if not choices:
             if is_author:
                 return self.get_error_choice(
                     LocaleStr(key="no_accounts_autocomplete_choice"), locale
@@ -358,16 +397,8 @@ class HoyoBuddy(commands.AutoShardedBot):
                 LocaleStr(key="user_no_accounts_autocomplete_choice"), locale
             )
 
-        return [
-            discord.app_commands.Choice(
-                name=self._get_account_choice_name(
-                    account, locale, is_author=is_author, show_id=show_id
-                ),
-                value=str(account.id),
-            )
-            for account in accounts
-            if current.lower() in str(account).lower()
-        ]
+        current = current.lower()
+        return [choice for name, choice in choices if current in name]
 
     async def get_game_account_choices(
         self, i: Interaction, current: str, *, show_id: bool = False
@@ -464,11 +495,13 @@ class HoyoBuddy(commands.AutoShardedBot):
         current_accounts = [account for account in accounts if account.current]
         if not current_accounts and accounts:
             await models.HoyoAccount.filter(id=accounts[0].id).update(current=True)
+            AccountCache.invalidate(user_id)
             return
 
         if len(current_accounts) > 1:
             await models.HoyoAccount.filter(user_id=user_id).update(current=False)
             await models.HoyoAccount.filter(id=current_accounts[0].id).update(current=True)
+            AccountCache.invalidate(user_id)
 
     async def update_assets(self) -> None:
         # Update enka.py assets
@@ -499,6 +532,8 @@ class HoyoBuddy(commands.AutoShardedBot):
                 zzz_client.download(force=True),
             )
 
+        await CharacterChoices.build()
+
     async def update_zzz_assets(self) -> None:
         async with asyncio.TaskGroup() as tg:
             item_temp_task = tg.create_task(fetch_json(self.session, ZZZ_ITEM_TEMPLATE_URL))
@@ -555,11 +590,17 @@ class HoyoBuddy(commands.AutoShardedBot):
             logger.error(f"Unhandled exception in task {task!r} with message {message!r}")
 
     async def close(self) -> None:
+        # ruff:ignore[import-outside-top-level]
+        from hoyo_buddy.hoyo.clients.gpy import GenshinClientFactory
+
         logger.info("Bot shutting down...")
         if self.geetest_command_task is not None:
             self.geetest_command_task.cancel()
+        if self.account_cache_task is not None:
+            self.account_cache_task.cancel()
 
         await Settings.close_redis_pool()
+        await GenshinClientFactory.close()
 
         await super().close()
 
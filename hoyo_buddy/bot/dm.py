@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Final
+
+import discord
+from loguru import logger
+from prometheus_client import Counter, Histogram
+
+from hoyo_buddy.constants import DM_CHANNEL_CACHE_SIZE, DM_CLOSED_TTL, DM_CONCURRENCY
+from hoyo_buddy.db import models
+
+if TYPE_CHECKING:
+    from .bot import HoyoBuddy
+
+__all__ = ("DMMetrics", "DMSender")
+
+
+class DMMetrics:
+    """Direct message delivery metrics, exported by the Prometheus cog when it is enabled."""
+
+    PREFIX: Final[str] = "hoyo_buddy_dm_"
+    """Metric's prefix"""
+
+    SENT: Final[Counter] = Counter(PREFIX + "sent", "Direct messages sent", ["outcome"])
+    """DMs by outcome (ok, closed, skipped, error)"""
+
+    LATENCY: Final[Histogram] = Histogram(
+        PREFIX + "latency_seconds",
+        "Time taken to deliver a direct message",
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    )
+    """Time from a send call to Discord's response, including rate limit waits (unit: seconds)"""
+
+    CHANNEL_LOOKUPS: Final[Counter] = Counter(
+        PREFIX + "channel_lookups", "DM channel lookups", ["source"]
+    )
+    """DM channel lookups by source (cache, db, discord)"""
+
+
+class DMSender:
+    """Sends direct messages concurrently.
+
+    DM channel IDs are kept in an LRU cache backed by the DMChannel table, and users
+    whose DMs are closed are skipped until DM_CLOSED_TTL passes. Messages to the same
+    user are sent one at a time so they keep their order, which also keeps a single
+    caller from hogging a channel's rate limit bucket; discord.py waits on the buckets.
+    """
+
+    def __init__(self, bot: HoyoBuddy) -> None:
+        self._bot = bot
+        self._channels: OrderedDict[int, int] = OrderedDict()
+        """User ID -> DM channel ID"""
+        self._closed: dict[int, float] = {}
+        """User ID -> monotonic time until which their DMs are considered closed"""
+        self._user_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._semaphore = asyncio.Semaphore(DM_CONCURRENCY)
+
+    def _remember_channel(self, user_id: int, channel_id: int) -> None:
+        self._channels[user_id] = channel_id
+        self._channels.move_to_end(user_id)
+        while len(self._channels) > DM_CHANNEL_CACHE_SIZE:
+            self._channels.popitem(last=False)
+
+    async def _get_channel_id(self, user_id: int) -> int:
+        channel_id = self._channels.get(user_id)
+        if channel_id is not None:
+            self._channels.move_to_end(user_id)
+            DMMetrics.CHANNEL_LOOKUPS.labels(source="cache").inc()
+            return channel_id
+
+        channel = await models.DMChannel.filter(user_id=user_id).first()
+        if channel is None:
+            user = self._bot.get_user(user_id) or await self._bot.fetch_user(user_id)
+            dm_channel = user.dm_channel or await user.create_dm()
+            channel = await models.DMChannel.create(user_id=user_id, id=dm_channel.id)
+            DMMetrics.CHANNEL_LOOKUPS.labels(source="discord").inc()
+        else:
+            DMMetrics.CHANNEL_LOOKUPS.labels(source="db").inc()
+
+        self._remember_channel(user_id, channel.id)
+        return channel.id
+
+    async def _forget_channel(self, user_id: int) -> None:
+        self._channels.pop(user_id, None)
+        await models.DMChannel.filter(user_id=user_id).delete()
+
+    def is_closed(self, user_id: int) -> bool:
+        """Whether the user's DMs were found closed within DM_CLOSED_TTL."""
+        until = self._closed.get(user_id)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            del self._closed[user_id]
+            return False
+        return True
+
+    def _get_user_lock(self, user_id: int) -> asyncio.Lock:
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        return lock
+
+    async def send(
+        self, user_id: int, content: str | None = None, **kwargs: Any
+    ) -> tuple[discord.Message | None, bool]:
+        """Send a DM to a user.
+
+        Returns:
+            The sent message, and whether an error other than closed DMs occurred.
+        """
+        if self.is_closed(user_id):
+            DMMetrics.SENT.labels(outcome="skipped").inc()
+            return None, False
+
+        logger.debug(f"DMing user {user_id}")
+        start = time.monotonic()
+
+        async with self._get_user_lock(user_id), self._semaphore:
+            try:
+                channel_id = await self._get_channel_id(user_id)
+                message = await self._bot.get_partial_messageable(channel_id).send(
+                    content, **kwargs
+                )
+            except discord.Forbidden:
+                self._closed[user_id] = time.monotonic() + DM_CLOSED_TTL
+                DMMetrics.SENT.labels(outcome="closed").inc()
+                return None, False
+            except discord.NotFound as e:
+                # The saved channel no longer exists, a new one is created on the next DM
+                await self._forget_channel(user_id)
+                DMMetrics.SENT.labels(outcome="error").inc()
+                self._bot.capture_exception(e)
+                return None, True
+            except Exception as e:
+                DMMetrics.SENT.labels(outcome="error").inc()
+                self._bot.capture_exception(e)
+                return None, True
+            else:
+                DMMetrics.SENT.labels(outcome="ok").inc()
+                DMMetrics.LATENCY.observe(time.monotonic() - start)
+                return message, False
@@ -13,7 +13,7 @@ from tortoise import Tortoise
 from tortoise.functions import Count
 
 from hoyo_buddy.constants import AUTO_TASK_TOGGLE_FIELDS, NOTIF_SETTING_FIELDS
-from hoyo_buddy.db import DiscordEmbed, HoyoAccount, Settings, User
+from hoyo_buddy.db import DiscordEmbed, HoyoAccount, Settings, TaskRunItem, User, update_gacha_nums
 from hoyo_buddy.db.models.gacha_history import GachaHistory
 from hoyo_buddy.draw.card_data import CARD_DATA
 from hoyo_buddy.embeds import DefaultEmbed, ErrorEmbed
@@ -337,6 +337,30 @@ class Admin(commands.Cog):
 
         await message.edit(content="Gacha rarities updated successfully.")
 
+    @commands.command(name="fix-gacha-nums", aliases=["fgn"])
+    async def fix_gacha_nums_command(self, ctx: commands.Context, account_id: int) -> Any:
+        account = await HoyoAccount.get_or_none(id=account_id)
+        if account is None:
+            return await ctx.send("Account not found.")
+
+        message = await ctx.send("Renumbering gacha history...")
+        await update_gacha_nums(self.bot.pool, account=account)
+        await message.edit(content="Gacha history renumbered successfully.")
+
+    @commands.command(name="task-progress", aliases=["tp"])
+    async def task_progress_command(
+        self, ctx: commands.Context, task_type: str, run_id: str | None = None
+    ) -> Any:
+        """Show the progress of an auto task run, the latest one by default."""
+        if run_id is None:
+            item = await TaskRunItem.filter(task_type=task_type).order_by("-id").first()
+            if item is None:
+                return await ctx.send("No runs found.")
+            run_id = item.run_id
+
+        progress = await TaskRunItem.get_progress(run_id)
+        await ctx.send(f"{run_id}: {', '.join(f'{k}={v}' for k, v in progress.items())}")
+
     @commands.command(name="clear-cache", aliases=["cc"])
     async def clear_cache_command(self, ctx: commands.Context) -> Any:
         await self.bot.cache_session.cache.clear()
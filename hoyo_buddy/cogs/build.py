@@ -12,11 +12,7 @@ from hoyo_buddy.commands.configs import COMMANDS
 from hoyo_buddy.db import get_locale
 from hoyo_buddy.dismissibles import show_anniversary_dismissible
 from hoyo_buddy.enums import Game, Locale
-from hoyo_buddy.hoyo.character_choices import (
-    get_gi_character_choices,
-    get_hsr_character_choices,
-    get_zzz_character_choices,
-)
+from hoyo_buddy.hoyo.character_choices import CharacterChoices
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.types import Interaction
 
@@ -39,20 +35,19 @@ class Build(commands.GroupCog):
                 await client.download_guides()
             self.guides = await client.read_guides()
 
-    async def _get_choices(self, locale: Locale, game: Game) -> list[app_commands.Choice[str]]:
-        if game is Game.GENSHIN:
-            # The command passes the chosen value to AmbrAPI's character guide endpoint,
-            # which only knows per-element Traveler IDs (e.g. 10000005-anemo)
-            characters = await get_gi_character_choices(locale, ambr_traveler_ids=True)
-        elif game is Game.STARRAIL:
-            characters = await get_hsr_character_choices(locale)
-        else:
-            characters = []
-
-        if not characters:
+    async def _get_choices(
+        self, locale: Locale, game: Game, current: str
+    ) -> list[app_commands.Choice[str]]:
+        if game not in {Game.GENSHIN, Game.STARRAIL}:
+            return self.bot.get_error_choice(LocaleStr(key="search_autocomplete_not_setup"), locale)
+
+        # The command passes the chosen value to AmbrAPI's character guide endpoint,
+        # which only knows per-element Traveler IDs (e.g. 10000005-anemo)
+        index = await CharacterChoices.get(game, locale, ambr_traveler_ids=True)
+        if not index.choices:
             return self.bot.get_error_choice(LocaleStr(key="search_autocomplete_not_setup"), locale)
 
-        return characters
+        return index.search(current)
 
     @app_commands.command(
         name=app_commands.locale_str("genshin"), description=COMMANDS["build genshin"].description
@@ -76,11 +71,7 @@ class Build(commands.GroupCog):
         self, i: Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
         locale = await get_locale(i)
-        return [
-            c
-            for c in await self._get_choices(locale, Game.GENSHIN)
-            if current.lower() in c.name.lower()
-        ][:25]
+        return await self._get_choices(locale, Game.GENSHIN, current)
 
     @app_commands.command(
         name=app_commands.locale_str("zzz"), description=COMMANDS["build zzz"].description
@@ -104,11 +95,11 @@ class Build(commands.GroupCog):
         self, i: Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
         locale = await get_locale(i)
-        choices = await get_zzz_character_choices(locale)
+        index = await CharacterChoices.get(Game.ZZZ, locale)
 
-        return [c for c in choices if current.lower() in c.name.lower() and c.value in self.guides][
-            :25
-        ]
+        # Rank every match so the ones without a guide don't push out the ones with
+        choices = index.search(current, limit=len(index.choices))
+        return [c for c in choices if c.value in self.guides][:25]
 
     @commands.is_owner()
     @commands.command(name="rguides")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING
 
 from discord import app_commands
@@ -15,6 +14,7 @@ from hoyo_buddy.utils.misc import handle_autocomplete_errors
 from ..commands.farm import Action, FarmCommand
 from ..enums import Game, Locale
 from ..hoyo.clients.ambr import ItemCategory
+from ..hoyo.search_index import ChoiceIndex
 from ..hoyo.transformers import HoyoAccountTransformer
 from ..l10n import LocaleStr
 from ..types import Interaction
@@ -22,6 +22,7 @@ from ..ui.hoyo.genshin.farm import FarmView
 
 if TYPE_CHECKING:
     from ..bot import HoyoBuddy
+    from ..types import AutocompleteChoices
 
 
 class Farm(
@@ -31,18 +32,30 @@ class Farm(
 ):
     def __init__(self, bot: HoyoBuddy) -> None:
         self.bot = bot
+        self._indexes: dict[Locale, ChoiceIndex[app_commands.Choice[str]]] = {}
+        self._indexed_autofill: AutocompleteChoices | None = None
+
+    def _get_index(self, locale: Locale) -> ChoiceIndex[app_commands.Choice[str]] | None:
+        """Get the characters and weapons choice index, None if the autofill is not set up."""
+        if self.bot.search_autofill is not self._indexed_autofill:
+            # The autofill was refreshed
+            self._indexes.clear()
+            self._indexed_autofill = self.bot.search_autofill
+
+        index = self._indexes.get(locale)
+        if index is not None:
+            return index
 
-    def _get_choices(self, locale: Locale) -> list[app_commands.Choice[str]]:
-        """Get characters and weapons autocomplete choices."""
         characters = self.bot.search_autofill[Game.GENSHIN][ItemCategory.CHARACTERS]
         weapons = self.bot.search_autofill[Game.GENSHIN][ItemCategory.WEAPONS]
-
         if not characters or not weapons:
-            return self.bot.get_error_choice(LocaleStr(key="search_autocomplete_not_setup"), locale)
+            return None
 
-        return characters.get(locale, characters[Locale.american_english]) + weapons.get(
-            locale, weapons[Locale.american_english]
+        index = self._indexes[locale] = ChoiceIndex(
+            characters.get(locale, characters[Locale.american_english])
+            + weapons.get(locale, weapons[Locale.american_english])
         )
+        return index
 
     @app_commands.command(
         name=app_commands.locale_str("view"), description=COMMANDS["farm view"].description
@@ -169,9 +182,10 @@ class Farm(
     @handle_autocomplete_errors
     async def query_autocomplete(self, i: Interaction, current: str) -> list[app_commands.Choice]:
         locale = await get_locale(i)
-        choices = [c for c in self._get_choices(locale) if current.lower() in c.name.lower()]
-        random.shuffle(choices)
-        return choices[:25]
+        index = self._get_index(locale)
+        if index is None:
+            return self.bot.get_error_choice(LocaleStr(key="search_autocomplete_not_setup"), locale)
+        return index.search(current)
 
     @farm_remove_command.autocomplete("query")
     @handle_autocomplete_errors
@@ -193,17 +207,12 @@ class Farm(
         if farm_notify is None:
             return []
 
-        choices = self._get_choices(locale)
-        choices = [
-            c
-            for c in choices
-            if current.lower() in c.name.lower() and c.value in farm_notify.item_ids
-        ]
-
-        if not choices:
+        index = self._get_index(locale)
+        if index is None:
             return []
 
-        return choices[:25]
+        choices = index.search(current, limit=len(index.choices))
+        return [c for c in choices if c.value in farm_notify.item_ids][:25]
 
 
 async def setup(bot: HoyoBuddy) -> None:
@@ -20,7 +20,7 @@ from hoyo_buddy.exceptions import (
     LeaderboardNotFoundError,
     NoAccountFoundError,
 )
-from hoyo_buddy.hoyo.character_choices import get_gi_character_choices
+from hoyo_buddy.hoyo.character_choices import CharacterChoices
 from hoyo_buddy.hoyo.transformers import HoyoAccountTransformer
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.types import Interaction, User
@@ -218,12 +218,12 @@ class LeaderboardCog(commands.GroupCog, name=app_commands.locale_str("lb")):
         self, i: Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
         locale = await get_locale(i)
-        choices = await get_gi_character_choices(locale)
+        index = await CharacterChoices.get(Game.GENSHIN, locale)
 
-        if not choices:
+        if not index.choices:
             return self.bot.get_error_choice(LocaleStr(key="search_autocomplete_not_setup"), locale)
 
-        return [choice for choice in choices if current.lower() in choice.name.lower()][:25]
+        return index.search(current)
 
     @akasha_command.autocomplete("category_")
     @handle_autocomplete_errors
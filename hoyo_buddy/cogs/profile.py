@@ -14,11 +14,7 @@ from hoyo_buddy.db import HoyoAccount, get_locale
 from hoyo_buddy.dismissibles import show_anniversary_dismissible, show_dismissible
 from hoyo_buddy.enums import Game
 from hoyo_buddy.exceptions import FeatureNotImplementedError
-from hoyo_buddy.hoyo.character_choices import (
-    get_gi_character_choices,
-    get_hsr_character_choices,
-    get_zzz_character_choices,
-)
+from hoyo_buddy.hoyo.character_choices import CharacterChoices
 from hoyo_buddy.hoyo.transformers import HoyoAccountTransformer
 from hoyo_buddy.types import Interaction, User
 from hoyo_buddy.utils import ephemeral
@@ -237,19 +233,7 @@ class Profile(
     ) -> list[app_commands.Choice[str]]:
         locale = await get_locale(i)
 
-        if game is Game.GENSHIN:
-            choices = await get_gi_character_choices(locale)
-        elif game is Game.STARRAIL:
-            choices = await get_hsr_character_choices(locale)
-        elif game is Game.ZZZ:
-            choices = await get_zzz_character_choices(locale)
-        else:
-            return []
-
-        if not choices:
-            return []
-
-        return [choice for choice in choices if current.lower() in choice.name.lower()][:25]
+        return await CharacterChoices.search(game, locale, current)
 
     @profile_gi_command.autocomplete("character_id1")
     @profile_gi_command.autocomplete("character_id2")
@@ -80,6 +80,7 @@ class Schedule(commands.Cog):
         self.update_assets.start()
 
     async def cog_unload(self) -> None:
+        await EmbedSender.stop_listening()
         self.run_send_embeds.cancel()
         self.run_farm_checks.cancel()
         self.run_notes_check.cancel()
@@ -121,8 +122,9 @@ class Schedule(commands.Cog):
     async def run_notes_check(self) -> None:
         await NotesChecker.execute(self.bot)
 
-    @tasks.loop(minutes=1)
+    @tasks.loop(minutes=10)
     async def run_send_embeds(self) -> None:
+        # Embeds are pushed through EmbedSender.listen, this also (re)starts the listener
         await EmbedSender.execute(self.bot)
 
     @tasks.loop(time=[datetime.time(hour, 0, 0, tzinfo=UTC_8) for hour in range(0, 24, 1)])
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-import random
 from typing import TYPE_CHECKING, Any
 
 from discord import app_commands
@@ -12,16 +11,16 @@ from loguru import logger
 from hoyo_buddy.commands.configs import COMMANDS
 from hoyo_buddy.constants import UTC_8
 from hoyo_buddy.db import get_locale
-from hoyo_buddy.db.models.json_file import JSONFile
 from hoyo_buddy.dismissibles import show_anniversary_dismissible
 from hoyo_buddy.utils import ephemeral
-from hoyo_buddy.utils.misc import get_now, handle_autocomplete_errors
+from hoyo_buddy.utils.misc import handle_autocomplete_errors
 
 from ..emojis import PROJECT_AMBER
-from ..enums import Game, Locale
+from ..enums import Game
 from ..exceptions import InvalidQueryError
 from ..hoyo.clients import ambr, yatta
 from ..hoyo.search_autocomplete import AutocompleteSetup
+from ..hoyo.search_index import SearchIndex
 from ..l10n import LocaleStr
 from ..types import Interaction
 from ..ui import URLButtonView
@@ -38,6 +37,7 @@ if TYPE_CHECKING:
 class Search(commands.Cog):
     def __init__(self, bot: HoyoBuddy) -> None:
         self.bot = bot
+        self._index = SearchIndex(bot.search_autofill)
 
         self._search_categories: dict[Game, list[StrEnum]] = {
             Game.GENSHIN: list(ambr.ItemCategory),
@@ -69,74 +69,30 @@ class Search(commands.Cog):
     async def before_update_search_autofill(self) -> None:
         await self.bot.wait_until_ready()
 
-    def _serialize_search_autofill(self) -> dict[str, Any]:
-        original = dict(self.bot.search_autofill)
-        new: dict[str, Any] = {}
-        for game, categories in original.items():
-            new[game.value] = {}
-            for category, locales in categories.items():
-                new[game.value][category.value] = {}
-                for locale, choices in locales.items():
-                    new[game.value][category.value][locale.value] = [
-                        {"name": choice.name, "value": choice.value} for choice in choices
-                    ]
-        return new
-
-    def _deserialize_search_autofill(
-        self, data: dict[str, Any]
-    ) -> dict[Game, dict[StrEnum, dict[Locale, list[app_commands.Choice[str]]]]]:
-        new: dict[Game, dict[StrEnum, dict[Locale, list[app_commands.Choice[str]]]]] = {}
-        for game_str, categories in data.items():
-            game = Game(game_str)
-            new[game] = {}
-            for category_str, locales in categories.items():
-                if game is Game.GENSHIN:
-                    category = ambr.ItemCategory(category_str)
-                elif game is Game.STARRAIL:
-                    category = yatta.ItemCategory(category_str)
-                else:
-                    continue
-
-                new[game][category] = {}
-                for locale_str, choices in locales.items():
-                    locale = Locale(locale_str)
-                    new[game][category][locale] = [
-                        app_commands.Choice[str](name=choice["name"], value=choice["value"])
-                        for choice in choices
-                    ]
-        return new
-
     async def _load_search_autofill(self) -> None:
-        data = await JSONFile.read("search_autofill.json")
-        if not data:
-            return
-
         try:
-            self.bot.search_autofill = self._deserialize_search_autofill(data["search_autofill"])  # pyright: ignore[reportAttributeAccessIssue]
-        except KeyError:
-            pass
+            search_autofill = await AutocompleteSetup.load()
         except Exception as e:
             logger.warning("Failed to load search autocomplete choices from disk cache")
             self.bot.capture_exception(e)
             return
-        else:
-            logger.info("Loaded search autocomplete choices from disk cache")
 
-    async def _save_search_autofill(self) -> None:
-        await JSONFile.write(
-            "search_autofill.json",
-            {
-                "search_autofill": self._serialize_search_autofill(),
-                "last_updated": get_now().isoformat(),
-            },
-        )
+        if not search_autofill:
+            return
+
+        self.bot.search_autofill = search_autofill
+        self._index.reset(self.bot.search_autofill)
+        logger.info("Loaded search autocomplete choices from disk cache")
 
     async def _setup_search_autofill(self) -> None:
         logger.info("Setting up search autocomplete choices")
         start = self.bot.loop.time()
 
         try:
-            self.bot.search_autofill = await AutocompleteSetup.start(self.bot.cache_session)
+            self.bot.search_autofill = await AutocompleteSetup.start(
+                self.bot.cache_session, self.bot.search_autofill
+            )
+            self._index.reset(self.bot.search_autofill)
         except Exception as e:
             logger.warning("Failed to set up search autocomplete choices")
             self.bot.capture_exception(e)
@@ -144,7 +100,7 @@ class Search(commands.Cog):
             logger.info(
                 f"Finished setting up search autocomplete choices, took {self.bot.loop.time() - start:.2f} seconds"
             )
-            await self._save_search_autofill()
+            await AutocompleteSetup.save()
 
     @staticmethod
     def _ensure_query_is_int(query: str) -> None:
@@ -190,6 +146,7 @@ class Search(commands.Cog):
                 category = ambr.ItemCategory(category_value)
             except ValueError as e:
                 raise InvalidQueryError from e
+            self._index.record_use(game, category, query)
 
             match category:
                 case ambr.ItemCategory.CHARACTERS:
@@ -307,6 +264,7 @@ class Search(commands.Cog):
                 category = yatta.ItemCategory(category_value)
             except ValueError as e:
                 raise InvalidQueryError from e
+            self._index.record_use(game, category, query)
 
             match category:
                 case yatta.ItemCategory.ITEMS:
@@ -393,18 +351,7 @@ class Search(commands.Cog):
         # if category is ambr.ItemCategory.SPIRAL_ABYSS:
         #     return await AbyssEnemyView.get_autocomplete_choices()
 
-        choices = self.bot.search_autofill[game][category].get(
-            locale, self.bot.search_autofill[game][category][Locale.american_english]
-        )
-        if not choices:
-            return []
-
-        choices = [c for c in choices if current.lower() in c.name.lower()]
-        if not choices:
-            return []
-
-        random.shuffle(choices)
-        return choices[:25]
+        return self._index.search(game, category, locale, current)
 
 
 async def setup(bot: HoyoBuddy) -> None:
@@ -13,11 +13,7 @@ from hoyo_buddy.db.models.json_file import JSONFile
 from hoyo_buddy.db.utils import get_card_settings, get_locale, set_highlight_substats
 from hoyo_buddy.enums import Game, Locale
 from hoyo_buddy.exceptions import InvalidQueryError
-from hoyo_buddy.hoyo.character_choices import (
-    get_gi_character_choices,
-    get_hsr_character_choices,
-    get_zzz_character_choices,
-)
+from hoyo_buddy.hoyo.character_choices import CharacterChoices
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.ui.settings.view import CardSettingsView, SettingsView
 from hoyo_buddy.utils.misc import handle_autocomplete_errors
@@ -32,30 +28,24 @@ class Settings(commands.Cog):
     def __init__(self, bot: HoyoBuddy) -> None:
         self.bot = bot
 
-    async def _get_choices(self, locale: Locale, game: Game) -> list[app_commands.Choice[str]]:
+    async def _get_choices(
+        self, locale: Locale, game: Game, current: str
+    ) -> list[app_commands.Choice[str]]:
         """Get character autocomplete choices."""
-        if game is Game.GENSHIN:
-            choices = await get_gi_character_choices(locale)
-        elif game is Game.STARRAIL:
-            choices = await get_hsr_character_choices(locale)
-        elif game is Game.ZZZ:
-            choices = await get_zzz_character_choices(locale)
-        else:
+        if game not in {Game.GENSHIN, Game.STARRAIL, Game.ZZZ}:
             return self.bot.get_error_choice(LocaleStr(key="invalid_game_selected"), locale)
 
-        if not choices:
+        index = await CharacterChoices.get(game, locale)
+        if not index.choices:
             return self.bot.get_error_choice(LocaleStr(key="search_autocomplete_not_setup"), locale)
 
-        return choices
+        return index.search(current)
 
-    async def _get_character_name(
-        self, game: Game, character_id: str, locale: Locale
-    ) -> str | None:
-        choices = await self._get_choices(locale, game)
-        for choice in choices:
-            if choice.value == character_id:
-                return choice.name
-        return None
+    @staticmethod
+    async def _get_character_name(game: Game, character_id: str, locale: Locale) -> str | None:
+        index = await CharacterChoices.get(game, locale)
+        choice = index.get(character_id)
+        return None if choice is None else choice.name
 
     @app_commands.command(name=locale_str("settings"), description=COMMANDS["settings"].description)
     async def settings_command(self, i: Interaction) -> Any:
@@ -148,12 +138,7 @@ class Settings(commands.Cog):
         self, i: Interaction, current: str
     ) -> list[app_commands.Choice]:
         locale = await get_locale(i)
-        choices = [
-            c
-            for c in await self._get_choices(locale, Game.GENSHIN)
-            if current.lower() in c.name.lower()
-        ]
-        return choices[:25]
+        return await self._get_choices(locale, Game.GENSHIN, current)
 
     @hsr_card_settings_command.autocomplete("character_id")
     @handle_autocomplete_errors
@@ -161,12 +146,7 @@ class Settings(commands.Cog):
         self, i: Interaction, current: str
     ) -> list[app_commands.Choice]:
         locale = await get_locale(i)
-        choices = [
-            c
-            for c in await self._get_choices(locale, Game.STARRAIL)
-            if current.lower() in c.name.lower()
-        ]
-        return choices[:25]
+        return await self._get_choices(locale, Game.STARRAIL, current)
 
     @zzz_card_settings_command.autocomplete("character_id")
     @handle_autocomplete_errors
@@ -174,12 +154,7 @@ class Settings(commands.Cog):
         self, i: Interaction, current: str
     ) -> list[app_commands.Choice]:
         locale = await get_locale(i)
-        choices = [
-            c
-            for c in await self._get_choices(locale, Game.ZZZ)
-            if current.lower() in c.name.lower()
-        ]
-        return choices[:25]
+        return await self._get_choices(locale, Game.ZZZ, current)
 
 
 async def setup(bot: HoyoBuddy) -> None:
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import csv
 import io
 from typing import TYPE_CHECKING, Any
 
 import hb_data
 import orjson
-import pandas as pd
 
 from hoyo_buddy.bot.error_handler import get_error_embed
 from hoyo_buddy.constants import UIGF_GAME_KEYS
-from hoyo_buddy.db import GachaHistory, get_dyk, get_locale, update_gacha_nums
+from hoyo_buddy.db import get_dyk, get_locale, import_gacha_records
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import LOADING
 from hoyo_buddy.enums import GachaImportSource, Game
@@ -37,9 +37,13 @@ from hoyo_buddy.ui.hoyo.gacha.view import ViewGachaLogView
 from hoyo_buddy.utils import ephemeral
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import asyncpg
     import discord
 
     from hoyo_buddy.db import HoyoAccount
+    from hoyo_buddy.db.utils import GachaRecordRow
     from hoyo_buddy.types import Interaction
 
 
@@ -79,6 +83,29 @@ class GachaCommand:
 
         return records
 
+    @staticmethod
+    def _to_rows(
+        records: Iterable[
+            StarRailStationRecord | ZZZRngMoeRecord | UIGFRecord | SRGFRecord | StarwardZZZRecord
+        ],
+    ) -> Iterator[GachaRecordRow]:
+        for record in records:
+            yield (record.id, record.rarity, record.time, record.item_id, record.banner_type, None)
+
+    @staticmethod
+    def _stardb_to_rows(
+        records: Iterable[StarDBRecord], rarity_map: dict[int, int]
+    ) -> Iterator[GachaRecordRow]:
+        for record in records:
+            yield (
+                record.id,
+                rarity_map[record.item_id],
+                record.time,
+                record.item_id,
+                record.banner_type,
+                None,
+            )
+
     @classmethod
     async def _srs_import(
         cls, i: Interaction, *, account: HoyoAccount, file: discord.Attachment
@@ -90,34 +117,11 @@ class GachaCommand:
             raise AccountGameMismatchError(Game.STARRAIL)
 
         bytes_ = await file.read()
-        records_df = await i.client.loop.run_in_executor(
-            i.client.executor, pd.read_csv, io.BytesIO(bytes_)
-        )
-        data = records_df.to_dict(orient="records")
-        records = [
-            StarRailStationRecord(**{str(k): v for k, v in record.items()}) for record in data
-        ]
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.STARRAIL,
-                )
-                for record in records
-            ]
+        reader = csv.DictReader(io.StringIO(bytes_.decode("utf-8-sig")))
+        records = (StarRailStationRecord(**record) for record in reader)
+        return await import_gacha_records(
+            i.client.pool, account=account, records=cls._to_rows(records)
         )
-        after = await GachaHistory.get_wish_count(account)
-
-        return after - before
 
     @classmethod
     async def _zzz_rng_moe_import(
@@ -147,34 +151,15 @@ class GachaCommand:
             tz_hour = 8
 
         gacha_types = ("1001", "2001", "3001", "5001")
-        records: list[ZZZRngMoeRecord] = []
-        for gacha_type in gacha_types:
-            records.extend(
-                [
-                    ZZZRngMoeRecord(tz_hour=tz_hour, **record)
-                    for record in first_profile["stores"]["0"]["items"][gacha_type]
-                ]
-            )
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.ZZZ,
-                )
-                for record in records
-            ]
+        items = first_profile["stores"]["0"]["items"]
+        records = (
+            ZZZRngMoeRecord(tz_hour=tz_hour, **record)
+            for gacha_type in gacha_types
+            for record in items[gacha_type]
+        )
+        return await import_gacha_records(
+            i.client.pool, account=account, records=cls._to_rows(records)
         )
-        after = await GachaHistory.get_wish_count(account)
-        return after - before
 
     @classmethod
     async def _stardb_import(
@@ -187,167 +172,116 @@ class GachaCommand:
         data = await i.client.loop.run_in_executor(i.client.executor, orjson.loads, bytes_)
 
         if account.game is Game.STARRAIL:
-            return await cls._stardb_hsr_import(account, data)
+            return await cls._stardb_hsr_import(i.client.pool, account, data)
         if account.game is Game.GENSHIN:
-            return await cls._stardb_gi_import(account, data)
+            return await cls._stardb_gi_import(i.client.pool, account, data)
         if account.game is Game.ZZZ:
-            return await cls._stardb_zzz_import(account, data)
+            return await cls._stardb_zzz_import(i.client.pool, account, data)
 
         raise FeatureNotImplementedError(game=account.game)
 
-    @staticmethod
-    async def _stardb_hsr_import(account: HoyoAccount, data: dict[str, Any]) -> int:
+    @classmethod
+    async def _stardb_hsr_import(
+        cls, pool: asyncpg.Pool, account: HoyoAccount, data: dict[str, Any]
+    ) -> int:
         if account.game is not Game.STARRAIL:
             raise AccountGameMismatchError(Game.STARRAIL)
 
         hsr_data = next(
             (d["warps"] for d in data["user"]["hsr"]["uids"] if d["uid"] == account.uid), None
         )
-        if hsr_data is not None:
-            banner_types: dict[str, int] = {
-                "departure": 2,
-                "standard": 1,
-                "character": 11,
-                "light_cone": 12,
-            }
-            records: list[StarDBRecord] = []
-            for banner_name, banner_type in banner_types.items():
-                records.extend(
-                    [
-                        StarDBRecord(banner_type=banner_type, **record)
-                        for record in hsr_data[banner_name]
-                    ]
-                )
-            records.sort(key=lambda x: x.id)
-
-            if records:
-                # Fetch rarity map with Yatta API
-                async with YattaAPIClient() as client:
-                    rarity_map = await client.fetch_rarity_map()
-
-                before = await GachaHistory.get_wish_count(account)
-                await GachaHistory.bulk_create(
-                    [
-                        GachaHistory(
-                            wish_id=record.id,
-                            rarity=rarity_map[record.item_id],
-                            item_id=record.item_id,
-                            banner_type=record.banner_type,
-                            account=account,
-                            time=record.time,
-                            banner_id=None,
-                            game=Game.STARRAIL,
-                        )
-                        for record in records
-                    ]
-                )
-                after = await GachaHistory.get_wish_count(account)
-                return after - before
-
-        return 0
+        if hsr_data is None:
+            return 0
+
+        banner_types: dict[str, int] = {
+            "departure": 2,
+            "standard": 1,
+            "character": 11,
+            "light_cone": 12,
+        }
+        if not any(hsr_data[banner_name] for banner_name in banner_types):
+            return 0
+
+        records = (
+            StarDBRecord(banner_type=banner_type, **record)
+            for banner_name, banner_type in banner_types.items()
+            for record in hsr_data[banner_name]
+        )
 
-    @staticmethod
-    async def _stardb_gi_import(account: HoyoAccount, data: dict[str, Any]) -> int:
+        # Fetch rarity map with Yatta API
+        async with YattaAPIClient() as client:
+            rarity_map = await client.fetch_rarity_map()
+
+        return await import_gacha_records(
+            pool, account=account, records=cls._stardb_to_rows(records, rarity_map)
+        )
+
+    @classmethod
+    async def _stardb_gi_import(
+        cls, pool: asyncpg.Pool, account: HoyoAccount, data: dict[str, Any]
+    ) -> int:
         if account.game is not Game.GENSHIN:
             raise AccountGameMismatchError(Game.GENSHIN)
 
         gi_data = next(
             (d["wishes"] for d in data["user"]["gi"]["uids"] if d["uid"] == account.uid), None
         )
-        if gi_data is not None:
-            banner_types: dict[str, int] = {
-                "beginner": 100,
-                "standard": 200,
-                "character": 301,
-                "weapon": 302,
-                "chronicled": 500,
-            }
-
-            records: list[StarDBRecord] = []
-            for banner_name, banner_type in banner_types.items():
-                records.extend(
-                    [
-                        StarDBRecord(banner_type=banner_type, **record)
-                        for record in gi_data[banner_name]
-                    ]
-                )
-            records.sort(key=lambda x: x.id)
-
-            if records:
-                # Fetch rarity map with Ambr API
-                async with AmbrAPIClient() as client:
-                    rarity_map = await client.fetch_rarity_map()
-
-                before = await GachaHistory.get_wish_count(account)
-                await GachaHistory.bulk_create(
-                    [
-                        GachaHistory(
-                            wish_id=record.id,
-                            rarity=rarity_map[record.item_id],
-                            item_id=record.item_id,
-                            banner_type=record.banner_type,
-                            account=account,
-                            time=record.time,
-                            banner_id=None,
-                            game=Game.GENSHIN,
-                        )
-                        for record in records
-                    ]
-                )
-                after = await GachaHistory.get_wish_count(account)
-                return after - before
-
-        return 0
+        if gi_data is None:
+            return 0
+
+        banner_types: dict[str, int] = {
+            "beginner": 100,
+            "standard": 200,
+            "character": 301,
+            "weapon": 302,
+            "chronicled": 500,
+        }
+        if not any(gi_data[banner_name] for banner_name in banner_types):
+            return 0
+
+        records = (
+            StarDBRecord(banner_type=banner_type, **record)
+            for banner_name, banner_type in banner_types.items()
+            for record in gi_data[banner_name]
+        )
 
-    @staticmethod
-    async def _stardb_zzz_import(account: HoyoAccount, data: dict[str, Any]) -> int:
+        # Fetch rarity map with Ambr API
+        async with AmbrAPIClient() as client:
+            rarity_map = await client.fetch_rarity_map()
+
+        return await import_gacha_records(
+            pool, account=account, records=cls._stardb_to_rows(records, rarity_map)
+        )
+
+    @classmethod
+    async def _stardb_zzz_import(
+        cls, pool: asyncpg.Pool, account: HoyoAccount, data: dict[str, Any]
+    ) -> int:
         if account.game is not Game.ZZZ:
             raise AccountGameMismatchError(Game.ZZZ)
 
         zzz_data = next(
             (d["signals"] for d in data["user"]["zzz"]["uids"] if d["uid"] == account.uid), None
         )
-        if zzz_data is not None:
-            banner_types: dict[str, int] = {
-                "standard": 1,
-                "character": 2,
-                "w_engine": 3,
-                "bangboo": 5,
-            }
-            records: list[StarDBRecord] = []
-            for banner_name, banner_type in banner_types.items():
-                records.extend(
-                    [
-                        StarDBRecord(banner_type=banner_type, **record)
-                        for record in zzz_data[banner_name]
-                    ]
-                )
-            records.sort(key=lambda x: x.id)
-
-            if records:
-                async with hb_data.ZZZClient() as client:
-                    rarity_map = client.get_rarity_map()
-
-                before = await GachaHistory.get_wish_count(account)
-                await GachaHistory.bulk_create(
-                    [
-                        GachaHistory(
-                            wish_id=record.id,
-                            rarity=rarity_map[record.item_id],
-                            item_id=record.item_id,
-                            banner_type=record.banner_type,
-                            account=account,
-                            time=record.time,
-                            banner_id=None,
-                            game=Game.ZZZ,
-                        )
-                        for record in records
-                    ]
-                )
-                after = await GachaHistory.get_wish_count(account)
-                return after - before
-
-        return 0
+        if zzz_data is None:
+            return 0
+
+        banner_types: dict[str, int] = {"standard": 1, "character": 2, "w_engine": 3, "bangboo": 5}
+        if not any(zzz_data[banner_name] for banner_name in banner_types):
+            return 0
+
+        records = (
+            StarDBRecord(banner_type=banner_type, **record)
+            for banner_name, banner_type in banner_types.items()
+            for record in zzz_data[banner_name]
+        )
+
+        async with hb_data.ZZZClient() as client:
+            rarity_map = client.get_rarity_map()
+
+        return await import_gacha_records(
+            pool, account=account, records=cls._stardb_to_rows(records, rarity_map)
+        )
 
     @classmethod
     async def _uigf_import(
@@ -376,8 +310,7 @@ class GachaCommand:
                 raise UIDMismatchError(account.uid)
 
             tz_hour = game_data["timezone"]
-            records = await cls._uigf_fill_item_rarities(game_data["list"], account.game)
-            records = [UIGFRecord(timezone=tz_hour, **record) for record in records]
+            raw_records = await cls._uigf_fill_item_rarities(game_data["list"], account.game)
         else:
             uid = str(data["info"]["uid"])
             if uid != str(account.uid):
@@ -405,29 +338,12 @@ class GachaCommand:
                         raise ValueError(msg)
                     record["item_id"] = item_id
 
-            records = await cls._uigf_fill_item_rarities(data["list"], account.game)
-            records = [UIGFRecord(timezone=tz_hour, **record) for record in records]
-
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=account.game,
-                )
-                for record in records
-            ]
+            raw_records = await cls._uigf_fill_item_rarities(data["list"], account.game)
+
+        records = (UIGFRecord(timezone=tz_hour, **record) for record in raw_records)
+        return await import_gacha_records(
+            i.client.pool, account=account, records=cls._to_rows(records)
         )
-        after = await GachaHistory.get_wish_count(account)
-        return after - before
 
     @classmethod
     async def _srgf_import(
@@ -447,27 +363,10 @@ class GachaCommand:
             raise UIDMismatchError(uid)
 
         tz_hour = data["info"]["region_time_zone"]
-        records = [SRGFRecord(timezone=tz_hour, **record) for record in data["list"]]
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.STARRAIL,
-                )
-                for record in records
-            ]
+        records = (SRGFRecord(timezone=tz_hour, **record) for record in data["list"])
+        return await import_gacha_records(
+            i.client.pool, account=account, records=cls._to_rows(records)
         )
-        after = await GachaHistory.get_wish_count(account)
-        return after - before
 
     @classmethod
     async def _starward_zzz_import(
@@ -487,28 +386,10 @@ class GachaCommand:
             raise UIDMismatchError(uid)
 
         tz_hour = data["info"]["region_time_zone"]
-        records = [StarwardZZZRecord(tz_hour=tz_hour, **record) for record in data["list"]]
-        records.sort(key=lambda x: x.id)
-
-        before = await GachaHistory.get_wish_count(account)
-        await GachaHistory.bulk_create(
-            [
-                GachaHistory(
-                    wish_id=record.id,
-                    rarity=record.rarity,
-                    item_id=record.item_id,
-                    banner_type=record.banner_type,
-                    account=account,
-                    time=record.time,
-                    banner_id=None,
-                    game=Game.ZZZ,
-                )
-                for record in records
-            ]
+        records = (StarwardZZZRecord(tz_hour=tz_hour, **record) for record in data["list"])
+        return await import_gacha_records(
+            i.client.pool, account=account, records=cls._to_rows(records)
         )
-        after = await GachaHistory.get_wish_count(account)
-
-        return after - before
 
     @staticmethod
     async def run_import(i: Interaction, account: HoyoAccount) -> None:
@@ -554,8 +435,6 @@ class GachaCommand:
             error_embed, _ = get_error_embed(e, locale)
             await i.edit_original_response(embed=error_embed)
         else:
-            await update_gacha_nums(i.client.pool, account=account)
-
             embed = DefaultEmbed(
                 locale,
                 title=LocaleStr(key="gacha_import_success_title"),
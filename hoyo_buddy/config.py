@@ -30,6 +30,9 @@ class Config(BaseSettings):
     # Misc
     env: EnvType = "dev"
     db_url: str
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 20
+    db_statement_cache_size: int = 256
     fernet_key: str
     proxy: str | None = None
     residential_proxy: str | None = None
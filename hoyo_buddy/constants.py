@@ -30,7 +30,13 @@ from .enums import (
 
 if TYPE_CHECKING:
     from hoyo_buddy.models import ZZZStat
-    from hoyo_buddy.types import AutoTaskType, OpenGameGame, OpenGameRegion, SleepTime
+    from hoyo_buddy.types import (
+        AutoTaskType,
+        OpenGameGame,
+        OpenGameRegion,
+        RateLimitFamily,
+        SleepTime,
+    )
 
 
 STATIC_FOLDER = pathlib.Path("./.static")
@@ -426,6 +432,8 @@ AMBR_CITY_TO_CITY = {
     ambr.City.NATLAN: GenshinCity.NATLAN,
     ambr.City.NOD_KRAI: GenshinCity.NOD_KRAI,
 }
+FARM_DATA_VERSION_CHECK_INTERVAL = 3600
+"""Seconds between checks of the ambr data version by FarmDataFetcher."""
 AMBR_WEAPON_TYPES = {
     "WEAPON_SWORD_ONE_HAND": 1,
     "WEAPON_CATALYST": 10,
@@ -1231,21 +1239,56 @@ PLATFORM_TO_REGION: dict[Platform, genshin.Region] = {
 }
 REGION_TO_PLATFORM = {v: k for k, v in PLATFORM_TO_REGION.items()}
 
-SLEEP_TIMES: dict[SleepTime, float] = {
-    "redeem": 6.0,
-    "mimo_task": 5.0,
-    "mimo_shop": 0.5,
-    "mimo_comment": 2.0,
-    "mimo_lottery": 0.5,
-    "search_autofill": 0.1,
-    "checkin": 2.5,
-    "accompany": 2.5,
-    "notes_check": 1.2,
-    "dm": 0.1,
-}
+SLEEP_TIMES: dict[SleepTime, float] = {"search_autofill": 0.1}
+TRANSLATION_CACHE_SIZE = 50000
+"""Rendered strings memoized by the translator, keyed by string, locale and arguments."""
+SEARCH_AUTOFILL_PROBE_CONCURRENCY = 10
+"""Conditional requests sent at once when checking search autofill partitions for changes."""
+
+DM_CONCURRENCY = 20
+DM_CHANNEL_CACHE_SIZE = 10000
+DM_CLOSED_TTL = 6 * 3600
+"""Seconds to skip a user after their DMs were found closed."""
+REDEEM_INTERVAL = 6.0
+"""Seconds between two code redemptions of the same account, HoYoLAB's per-account cooldown."""
+REDEEM_COOLDOWN_RETRIES = 3
+"""Times a redemption is retried after hitting the per-account cooldown."""
+REDEEM_PROBE_TIMEOUT = 60.0
+"""Seconds auto redeem waits for another account to try an undecided code before trying it too."""
+REDEEM_TRACKED_ACCOUNTS = 1000
+"""Accounts whose last redemption time is kept before expired ones are pruned."""
+ACCOUNT_CACHE_SIZE = 10000
+ACCOUNT_CACHE_TTL = 600
+"""Seconds an account autocomplete cache entry is kept, in case a change notice was missed."""
 
 CONCURRENT_TASK_NUM = 100
+AUTO_TASK_CLAIM_SIZE = CONCURRENT_TASK_NUM
+"""Number of task run items leased at once, about one per worker so leased items don't sit queued."""
+AUTO_TASK_QUEUE_SIZE = CONCURRENT_TASK_NUM
+AUTO_TASK_RUN_WINDOW = 10
+"""Minutes grouped into one auto task run, matching the scheduler's interval."""
+AUTO_TASK_LEASE_SECONDS = 15 * 60
+AUTO_TASK_LEASE_RENEW_INTERVAL = AUTO_TASK_LEASE_SECONDS // 3
+"""Seconds between lease renewals of the items a replica holds but hasn't finished."""
+NOTES_CHECK_WORKER_NUM = 10
+NOTES_CHECK_STATE_FLUSH_SIZE = 500
 MAX_PROXY_ERROR_NUM = 8
+GPY_POOL_LIMIT = 200
+GPY_POOL_LIMIT_PER_HOST = 50
+GPY_DNS_CACHE_TTL = 300
+GPY_KEEPALIVE_TIMEOUT = 30
+
+RATE_LIMITS: dict[RateLimitFamily, float] = {
+    "redeem": CONCURRENT_TASK_NUM / 6.0,
+    "mimo_task": CONCURRENT_TASK_NUM / 5.0,
+    "mimo_shop": CONCURRENT_TASK_NUM / 0.5,
+    "mimo_comment": CONCURRENT_TASK_NUM / 2.0,
+    "mimo_lottery": CONCURRENT_TASK_NUM / 0.5,
+    "checkin": CONCURRENT_TASK_NUM / 2.5,
+    "accompany": CONCURRENT_TASK_NUM / 2.5,
+    "notes_check": NOTES_CHECK_WORKER_NUM / 1.2,
+}
+"""Initial requests per second of each HoYoLAB rate limit bucket, adapted at runtime."""
 
 AUTO_TASK_FEATURE_KEYS: dict[AutoTaskType, str] = {
     "redeem": "auto_redeem_toggle.label",
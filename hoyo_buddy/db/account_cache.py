@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar, Final
+
+import redis.asyncio as redis
+from loguru import logger
+
+from hoyo_buddy.constants import ACCOUNT_CACHE_SIZE, ACCOUNT_CACHE_TTL
+
+from .models.base import CachedModel
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .models.hoyo_account import HoyoAccount
+
+__all__ = ("AccountCache", "AccountCacheEntry")
+
+
+class AccountCacheEntry:
+    """A user's accounts and the autocomplete data derived from them."""
+
+    def __init__(self, accounts: Sequence[HoyoAccount]) -> None:
+        self.accounts = tuple(accounts)
+        self.expires_at = time.monotonic() + ACCOUNT_CACHE_TTL
+        self.choices: dict[Any, Any] = {}
+        """Formatted choices, keyed by whatever the formatting depends on."""
+
+
+class AccountCache:
+    """Per-user cache of accounts for account autocomplete.
+
+    Entries are dropped when one of the user's accounts is created, deleted or has a
+    displayed field changed. Other processes (e.g. the web app adding accounts) are told
+    through a Redis channel, ACCOUNT_CACHE_TTL bounds staleness when Redis is unavailable.
+    """
+
+    CHANNEL: Final[str] = "hoyo_buddy:account_changes"
+
+    _entries: ClassVar[OrderedDict[int, AccountCacheEntry]] = OrderedDict()
+
+    @classmethod
+    def get(cls, user_id: int) -> AccountCacheEntry | None:
+        entry = cls._entries.get(user_id)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del cls._entries[user_id]
+            return None
+
+        cls._entries.move_to_end(user_id)
+        return entry
+
+    @classmethod
+    def set(cls, user_id: int, accounts: Sequence[HoyoAccount]) -> AccountCacheEntry:
+        entry = cls._entries[user_id] = AccountCacheEntry(accounts)
+        cls._entries.move_to_end(user_id)
+        while len(cls._entries) > ACCOUNT_CACHE_SIZE:
+            cls._entries.popitem(last=False)
+        return entry
+
+    @classmethod
+    def invalidate(cls, user_id: int, *, publish: bool = True) -> None:
+        """Drop a user's entry in this process, and in other processes if publish is True."""
+        cls._entries.pop(user_id, None)
+        if publish:
+            asyncio.create_task(cls._publish(user_id))
+
+    @classmethod
+    async def _publish(cls, user_id: int) -> None:
+        redis_conn = await CachedModel._get_redis()
+        if redis_conn is None:
+            return
+
+        try:
+            await redis_conn.publish(cls.CHANNEL, user_id)
+        except redis.RedisError as e:
+            logger.error(f"Failed to publish account change of user {user_id}: {e}")
+
+    @classmethod
+    async def listen(cls) -> None:
+        """Drop entries on changes published by other processes, runs until cancelled."""
+        redis_conn = await CachedModel._get_redis()
+        if redis_conn is None:
+            return
+
+        while True:
+            try:
+                async with redis_conn.pubsub() as pubsub:
+                    await pubsub.subscribe(cls.CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            cls.invalidate(int(message["data"]), publish=False)
+            except redis.RedisError as e:
+                logger.warning(f"Account cache listener disconnected: {e}")
+                # Changes may have been missed while disconnected
+                cls._entries.clear()
+                await asyncio.sleep(5)
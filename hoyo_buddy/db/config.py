@@ -1,7 +1,23 @@
+from tortoise.backends.base.config_generator import expand_db_url
+
 from hoyo_buddy.config import CONFIG
 
+from .metrics import init_connection
+
+# Tortoise's pool is the only Postgres pool in each process, the raw SQL helpers borrow it
+# through Database (see pgsql.py)
+DB_CONNECTION = expand_db_url(CONFIG.db_url)
+DB_CONNECTION["credentials"].update(
+    {
+        "minsize": CONFIG.db_pool_min_size,
+        "maxsize": CONFIG.db_pool_max_size,
+        "statement_cache_size": CONFIG.db_statement_cache_size,
+        "init": init_connection,
+    }
+)
+
 DB_CONFIG = {
-    "connections": {"default": CONFIG.db_url},
+    "connections": {"default": DB_CONNECTION},
     "apps": {
         "models": {
             "models": ["hoyo_buddy.db.models", "aerich.models"],
@@ -9,6 +25,4 @@ DB_CONFIG = {
         }
     },
     "use_tz": True,
-    "minsize": 1,
-    "maxsize": 20,
 }
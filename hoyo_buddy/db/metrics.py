@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import TYPE_CHECKING, Final
+
+from prometheus_client import Gauge, Histogram
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    import asyncpg
+    from asyncpg.connection import LoggedQuery
+
+__all__ = ("PoolMetrics", "acquire", "init_connection", "track_pool")
+
+
+class PoolMetrics:
+    """Postgres pool metrics, exported by the Prometheus cog when it is enabled."""
+
+    PREFIX: Final[str] = "hoyo_buddy_db_"
+    """Metric's prefix"""
+
+    POOL_SIZE: Final[Gauge] = Gauge(PREFIX + "pool_size", "Number of open pool connections")
+    """Number of connections currently open in the pool"""
+
+    POOL_IN_USE: Final[Gauge] = Gauge(PREFIX + "pool_in_use", "Number of acquired connections")
+    """Number of connections currently acquired from the pool"""
+
+    POOL_WAIT: Final[Histogram] = Histogram(
+        PREFIX + "pool_wait_seconds", "Time spent waiting to acquire a pool connection"
+    )
+    """Time spent waiting for a connection in raw SQL helpers (unit: seconds)"""
+
+    QUERY_LATENCY: Final[Histogram] = Histogram(
+        PREFIX + "query_seconds", "Query execution time", ["statement"]
+    )
+    """Query execution time labelled by its leading keyword (unit: seconds)"""
+
+
+def _log_query(record: LoggedQuery) -> None:
+    statement = next(iter(record.query.split(None, 1)), "").upper()
+    PoolMetrics.QUERY_LATENCY.labels(statement=statement).observe(record.elapsed)
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:  # ruff:ignore[unused-async]
+    """Initialize a new pool connection, passed to asyncpg as the pool's ``init`` callback."""
+    conn.add_query_logger(_log_query)
+
+
+def track_pool(pool: asyncpg.Pool) -> None:
+    """Report the pool's size and usage through PoolMetrics."""
+    PoolMetrics.POOL_SIZE.set_function(pool.get_size)
+    PoolMetrics.POOL_IN_USE.set_function(lambda: pool.get_size() - pool.get_idle_size())
+
+
+@contextlib.asynccontextmanager
+async def acquire(pool: asyncpg.Pool) -> AsyncGenerator[asyncpg.Connection]:
+    """Acquire a connection from the pool, recording the wait time."""
+    start = time.perf_counter()
+    async with pool.acquire() as conn:
+        PoolMetrics.POOL_WAIT.observe(time.perf_counter() - start)
+        yield conn
@@ -13,4 +13,5 @@ from .leaderboard import Leaderboard
 from .notes_notify import NotesNotify
 from .notif_settings import AccountNotifSettings
 from .settings import Settings
+from .task_run_item import TaskRunItem
 from .user import User
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import copy
 import pickle
-from typing import TYPE_CHECKING, Any, cast
+import zlib
+from typing import TYPE_CHECKING, Any, Self, cast
 
 import genshin
+import orjson
 from loguru import logger
 from tortoise import fields
 from tortoise.exceptions import IntegrityError
@@ -32,6 +34,8 @@ CHALLENGE_MODELS: dict[ChallengeType, type[Challenge]] = {
     ChallengeType.HARD_CHALLENGE: genshin.models.HardChallenge,
     ChallengeType.ANOMALY: genshin.models.AnomalyRecord,
 }
+HEADER_FIELDS = ("id", "uid", "season_id", "name", "challenge_type", "start_time", "end_time")
+"""Fields needed to list the stored seasons without loading their payload."""
 
 
 class ChallengeHistory(BaseModel):
@@ -44,6 +48,8 @@ class ChallengeHistory(BaseModel):
     end_time = fields.DatetimeField()
     lang: fields.Field[str | None] = fields.CharField(max_length=5, null=True)
     json_data: fields.Field[dict[str, Any] | None] = fields.JSONField(null=True)
+    payload: fields.Field[bytes | None] = fields.BinaryField(null=True)
+    """zlib-compressed JSON of the raw challenge data, replaces json_data."""
 
     class Meta:
         unique_together = ("uid", "season_id", "challenge_type")
@@ -57,15 +63,18 @@ class ChallengeHistory(BaseModel):
 
     @property
     def parsed_data(self) -> ChallengeWithLang:
-        """Parsed challenge data from binary pickled data."""
-        if self.json_data is None:
-            if self.data is None:
-                # This shouldn't happen, data could be None because of migration to use json_data
-                msg = "Both json_data and data are None in ChallengeHistory"
-                raise ValueError(msg)
+        """Parsed challenge data from the stored payload."""
+        if self.payload is not None:
+            raw = orjson.loads(zlib.decompress(self.payload))
+            challenge = self._validate(raw, challenge_type=self.challenge_type)
+        elif self.json_data is not None:
+            challenge = self.load_data(self.json_data, challenge_type=self.challenge_type)
+        elif self.data is not None:
             challenge = pickle.loads(self.data)
         else:
-            challenge = self.load_data(self.json_data, challenge_type=self.challenge_type)
+            # This shouldn't happen, rows always have one of the payload columns set
+            msg = "payload, json_data and data are all None in ChallengeHistory"
+            raise ValueError(msg)
 
         lang = getattr(challenge, "lang", None)
         if lang is None:
@@ -74,19 +83,33 @@ class ChallengeHistory(BaseModel):
         return cast("ChallengeWithLang", challenge)
 
     @classmethod
-    def load_data(cls, raw: Mapping[str, Any], *, challenge_type: ChallengeType) -> Challenge:
-        # Create a deep copy to prevent Pydantic field validators from modifying the original data
-        raw_copy = copy.deepcopy(raw)
+    async def get_headers(cls, *, uid: int, challenge_type: ChallengeType) -> list[Self]:
+        """Return the stored seasons of a challenge type, with only HEADER_FIELDS loaded."""
+        return await cls.filter(uid=uid, challenge_type=challenge_type).only(*HEADER_FIELDS)
 
+    @classmethod
+    async def get_parsed_data(
+        cls, *, uid: int, challenge_type: ChallengeType, season_id: int
+    ) -> ChallengeWithLang | None:
+        history = await cls.get_or_none(uid=uid, challenge_type=challenge_type, season_id=season_id)
+        return history.parsed_data if history is not None else None
+
+    @staticmethod
+    def _validate(raw: Mapping[str, Any], *, challenge_type: ChallengeType) -> Challenge:
         model = CHALLENGE_MODELS.get(challenge_type)
         if model is None:
             msg = f"Loading data for {challenge_type} is not implemented."
             raise NotImplementedError(msg)
 
-        if challenge_type is ChallengeType.SHIYU_DEFENSE and "pass_fifth_floor" in raw_copy:
+        if challenge_type is ChallengeType.SHIYU_DEFENSE and "pass_fifth_floor" in raw:
             model = genshin.models.ShiyuDefenseV2
 
-        return model.model_validate(raw_copy)
+        return model.model_validate(raw)
+
+    @classmethod
+    def load_data(cls, raw: Mapping[str, Any], *, challenge_type: ChallengeType) -> Challenge:
+        # Create a deep copy to prevent Pydantic field validators from modifying the original data
+        return cls._validate(copy.deepcopy(raw), challenge_type=challenge_type)
 
     @classmethod
     async def add_data(
@@ -131,6 +154,8 @@ class ChallengeHistory(BaseModel):
             end_time = season.end_time.datetime
             name = season.name
 
+        payload = zlib.compress(orjson.dumps(raw))
+
         try:
             await cls.create(
                 uid=uid,
@@ -140,9 +165,15 @@ class ChallengeHistory(BaseModel):
                 end_time=end_time,
                 name=name,
                 lang=lang,
-                json_data=raw,
+                payload=payload,
             )
         except IntegrityError:
             await cls.filter(uid=uid, season_id=season_id, challenge_type=challenge_type).update(
-                name=name, lang=lang, json_data=raw, start_time=start_time, end_time=end_time
+                name=name,
+                lang=lang,
+                payload=payload,
+                json_data=None,
+                data=None,
+                start_time=start_time,
+                end_time=end_time,
             )
@@ -34,6 +34,8 @@ class DiscordEmbed(BaseModel):
     task_type: AutoTaskType = fields.CharField(max_length=20)
     type: Literal["default", "error"] = fields.CharField(max_length=7)
     created_at = fields.DatetimeField(auto_now_add=True)
+    attempts = fields.IntField(default=0)
+    """Number of failed delivery attempts."""
 
     user_id: int
     account_id: int
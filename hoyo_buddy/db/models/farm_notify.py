@@ -3,13 +3,22 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from tortoise import fields
+from tortoise import Tortoise, fields
 
 from .base import BaseModel
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .hoyo_account import HoyoAccount
 
+DUE_FARM_NOTIFIES_SQL = """
+SELECT f.account_id
+FROM farmnotify f
+JOIN hoyoaccount a ON a.id = f.account_id
+WHERE f.enabled AND f.item_ids ?| $1::text[] AND a.uid::text LIKE $2 || '%';
+"""
+
 
 class FarmNotify(BaseModel):
     enabled = fields.BooleanField(default=True)
@@ -17,3 +26,12 @@ class FarmNotify(BaseModel):
         "models.HoyoAccount", related_name="farm_notifs", pk=True
     )
     item_ids: fields.Field[list[str]] = fields.JSONField(default=[])
+    """Item IDs to notify, indexed by idx_farmnotify_item_ids (GIN)."""
+
+    @classmethod
+    async def get_due_account_ids(cls, item_ids: Iterable[str], *, uid_start: str) -> list[int]:
+        """Get the accounts with notifies enabled for any of the items and a UID prefix."""
+        _, rows = await Tortoise.get_connection("default").execute_query(
+            DUE_FARM_NOTIFIES_SQL, [list(item_ids), uid_start]
+        )
+        return [row["account_id"] for row in rows]
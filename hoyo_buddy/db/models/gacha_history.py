@@ -1,7 +1,7 @@
 # pyright: reportAssignmentType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING
 
 from tortoise import fields
 
@@ -34,16 +34,5 @@ class GachaHistory(BaseModel):
 
     class Meta:
         unique_together = ("wish_id", "game", "account", "banner_type")
+        indexes = (("account", "banner_type", "wish_id"),)
         ordering = ("-wish_id",)
-
-    @classmethod
-    async def get_wish_count(cls, account: HoyoAccount) -> int:
-        return await cls.filter(account=account).count()
-
-    @classmethod
-    async def bulk_create(cls, records: list[Self], **kwargs) -> None:
-        for record in records:
-            if record.game is Game.ZZZ:
-                record.rarity += 1
-
-        return await super().bulk_create(records, batch_size=5000, ignore_conflicts=True, **kwargs)
@@ -27,6 +27,13 @@ class GachaStats(BaseModel):
 
     class Meta:
         unique_together = ("account_id", "banner_type", "game")
+        indexes = (
+            ("game", "banner_type", "lifetime_pulls"),
+            ("game", "banner_type", "avg_5star_pulls"),
+            ("game", "banner_type", "avg_4star_pulls"),
+            ("game", "banner_type", "avg_3star_pulls"),
+            ("game", "banner_type", "win_rate"),
+        )
 
     @classmethod
     async def create_or_update(
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import datetime
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import genshin
 from tortoise import fields
@@ -13,6 +13,7 @@ from hoyo_buddy.enums import Game
 from hoyo_buddy.icons import get_game_icon
 from hoyo_buddy.utils import blur_uid, get_now
 
+from ..account_cache import AccountCache
 from .base import BaseModel
 
 if TYPE_CHECKING:
@@ -24,6 +25,11 @@ if TYPE_CHECKING:
     from .notif_settings import AccountNotifSettings
     from .user import User
 
+ACCOUNT_CHOICE_FIELDS = frozenset(
+    {"uid", "username", "nickname", "game", "region", "public", "current", "user_id"}
+)
+"""Fields shown in or used to filter account autocomplete choices."""
+
 
 class HoyoAccount(BaseModel):
     # Account info
@@ -86,6 +92,17 @@ class HoyoAccount(BaseModel):
     def __str__(self) -> str:
         return f"{self.nickname or self.username} ({self.uid})"
 
+    async def save(self, *args: Any, **kwargs: Any) -> None:
+        await super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or not ACCOUNT_CHOICE_FIELDS.isdisjoint(update_fields):
+            AccountCache.invalidate(self.user_id)
+
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        await super().delete(*args, **kwargs)
+        AccountCache.invalidate(self.user_id)
+
     @cached_property
     def blurred_display(self) -> str:
         return f"{self.nickname or self.username} ({blur_uid(self.uid)})"
@@ -93,9 +110,9 @@ class HoyoAccount(BaseModel):
     @cached_property
     def client(self) -> GenshinClient:
         # ruff:ignore[import-outside-top-level]
-        from hoyo_buddy.hoyo.clients.gpy import GenshinClient
+        from hoyo_buddy.hoyo.clients.gpy import GenshinClientFactory
 
-        return GenshinClient(self)
+        return GenshinClientFactory.get(self)
 
     @property
     def server_reset_datetime(self) -> datetime.datetime:
@@ -1,26 +1,34 @@
 # pyright: reportAssignmentType=false
 
-from typing import Any
+from typing import Any, Literal
 
-from tortoise import fields
-from tortoise.exceptions import IntegrityError
+import orjson
+from tortoise import Tortoise, fields
 
 from hoyo_buddy.enums import Game, LeaderboardType
 
 from .base import BaseModel
 
+UPSERT_LB_SQL = """
+INSERT INTO leaderboard (type, game, uid, value, username, extra_info)
+VALUES ($1, $2, $3, $4, $5, $6::jsonb)
+ON CONFLICT (type, game, uid) DO UPDATE
+SET value = excluded.value, username = excluded.username, extra_info = excluded.extra_info
+WHERE leaderboard.value < excluded.value;
+"""
+
 
 class Leaderboard(BaseModel):
     type = fields.CharEnumField(LeaderboardType, max_length=32)
     game = fields.CharEnumField(Game, max_length=32)
     value = fields.FloatField()
     uid = fields.BigIntField()
-    rank = fields.IntField()
     username = fields.CharField(max_length=32)
     extra_info: fields.Field[dict[str, Any]] = fields.JSONField(default={}, null=True)
 
     class Meta:
         unique_together = ("type", "game", "uid")
+        indexes = (("game", "type", "value"),)
 
     @classmethod
     async def update_or_create(
@@ -33,21 +41,16 @@ class Leaderboard(BaseModel):
         username: str,
         extra_info: dict[str, Any] | None,
     ) -> None:
-        extra_info = extra_info or {}
-
-        try:
-            await cls.create(
-                type=type_,
-                game=game,
-                uid=uid,
-                value=value,
-                username=username,
-                rank=0,
-                extra_info=extra_info,
-            )
-        except IntegrityError:
-            lb = await cls.get(type=type_, game=game, uid=uid)
-            if lb.value < value:
-                await cls.filter(type=type_, game=game, uid=uid).update(
-                    value=value, username=username, extra_info=extra_info
-                )
+        """Insert the entry, or update it if the new value is higher than the stored one."""
+        await Tortoise.get_connection("default").execute_query(
+            UPSERT_LB_SQL,
+            [type_, game, uid, value, username, orjson.dumps(extra_info or {}).decode()],
+        )
+
+    @classmethod
+    async def get_rank(
+        cls, *, type_: LeaderboardType, game: Game, value: float, order: Literal["ASC", "DESC"]
+    ) -> int:
+        """Return the rank of an entry with the given value."""
+        filter_kwargs = {"value__gt": value} if order == "DESC" else {"value__lt": value}
+        return await cls.filter(type=type_, game=game, **filter_kwargs).count() + 1
@@ -26,6 +26,8 @@ class NotesNotify(BaseModel):
     last_check_time: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
     est_time: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
     """Estimated time for the threshold to be reached."""
+    next_check_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    """Earliest time the notify can be due, None means due now."""
 
     notify_interval = fields.SmallIntField()
     """Notify interval in minutes."""
@@ -47,4 +49,5 @@ class NotesNotify(BaseModel):
 
     class Meta:
         unique_together = ("type", "account")
+        indexes = (("enabled", "next_check_at"),)
         ordering = ("type",)
@@ -0,0 +1,182 @@
+# pyright: reportAssignmentType=false
+from __future__ import annotations
+
+import datetime
+import operator
+from typing import TYPE_CHECKING, Literal
+
+from tortoise import Tortoise, fields
+
+from hoyo_buddy.utils import get_now
+
+from .base import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from hoyo_buddy.types import AutoTaskType
+
+    from .hoyo_account import HoyoAccount
+
+ENQUEUE_SQL = """
+WITH candidates AS (
+  SELECT {distinct} a.id, a.user_id, {last_time} AS last_time
+  FROM hoyoaccount a
+  WHERE a.id = ANY($3::int[])
+  {distinct_order}
+),
+supporters AS (
+  SELECT jsonb_array_elements_text(data)::bigint AS user_id
+  FROM jsonfile
+  WHERE name = 'supporter_ids.json'
+)
+INSERT INTO task_run_item (run_id, task_type, account_id, status, created_at)
+SELECT $1, $2, c.id, 'pending', NOW()
+FROM candidates c
+WHERE NOT EXISTS (
+  SELECT 1 FROM task_run_item t
+  WHERE t.task_type = $2 AND t.account_id = c.id AND t.status <> 'done'
+)
+ORDER BY c.user_id IN (SELECT user_id FROM supporters) DESC, c.last_time ASC NULLS FIRST, c.id
+ON CONFLICT (run_id, account_id) DO NOTHING
+RETURNING 1;
+"""
+"""Supporters go first, then the accounts that waited the longest (never ran first)."""
+
+CLAIM_SQL = """
+UPDATE task_run_item
+SET status = 'leased', leased_by = $3, lease_expires_at = NOW() + $4 * INTERVAL '1 second'
+WHERE id IN (
+  SELECT id FROM task_run_item
+  WHERE task_type = $1
+    AND (status = 'pending' OR (status = 'leased' AND lease_expires_at < NOW()))
+  ORDER BY id
+  LIMIT $2
+  FOR UPDATE SKIP LOCKED
+)
+RETURNING id, account_id;
+"""
+
+COMPLETE_SQL = """
+UPDATE task_run_item
+SET status = 'done', lease_expires_at = NULL
+WHERE task_type = $1 AND account_id = ANY($2::int[]) AND status = 'leased' AND leased_by = $3;
+"""
+
+RENEW_SQL = """
+UPDATE task_run_item
+SET lease_expires_at = NOW() + $4 * INTERVAL '1 second'
+WHERE task_type = $1 AND account_id = ANY($2::int[]) AND status = 'leased' AND leased_by = $3;
+"""
+
+PROGRESS_SQL = """
+SELECT
+  COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+  COUNT(*) FILTER (WHERE status = 'leased' AND lease_expires_at >= NOW()) AS leased,
+  COUNT(*) FILTER (WHERE status = 'leased' AND lease_expires_at < NOW()) AS expired,
+  COUNT(*) FILTER (WHERE status = 'done') AS done
+FROM task_run_item
+WHERE run_id = $1;
+"""
+
+
+class TaskRunItem(BaseModel):
+    """An account to process in an auto task run.
+
+    Scheduler replicas claim items with expiring leases, so a run can be split between
+    them and the items of a crashed replica are picked up again once their lease expires.
+    """
+
+    id = fields.BigIntField(pk=True, generated=True)
+    run_id = fields.CharField(max_length=64)
+    task_type: AutoTaskType = fields.CharField(max_length=20)
+    account: fields.ForeignKeyRelation[HoyoAccount] = fields.ForeignKeyField(
+        "models.HoyoAccount", related_name="task_run_items"
+    )
+    status: Literal["pending", "leased", "done"] = fields.CharField(max_length=7, default="pending")
+    leased_by: fields.Field[str | None] = fields.CharField(max_length=64, null=True)
+    lease_expires_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    account_id: int
+
+    class Meta:
+        table = "task_run_item"
+        unique_together = ("run_id", "account")
+        indexes = (("task_type", "status"),)
+
+    @classmethod
+    async def enqueue(
+        cls,
+        run_id: str,
+        task_type: AutoTaskType,
+        account_ids: Sequence[int],
+        *,
+        last_time_field: str | None = None,
+        dedupe: bool = False,
+    ) -> int:
+        """Add accounts to a run in priority order, in one statement.
+
+        Accounts with an unfinished item of the same task are skipped. Items are inserted, and
+        therefore claimed, supporters first, then by ``last_time_field`` (oldest first).
+
+        Args:
+            run_id: The run to add the accounts to.
+            task_type: The auto task type.
+            account_ids: IDs of the candidate accounts, in any order.
+            last_time_field: HoyoAccount column with the time the task last ran.
+            dedupe: Keep only the lowest account ID of accounts with the same cookies and game.
+
+        Returns:
+            The number of added items.
+        """
+        sql = ENQUEUE_SQL.format(
+            distinct="DISTINCT ON (a.cookies, a.game)" if dedupe else "",
+            distinct_order="ORDER BY a.cookies, a.game, a.id" if dedupe else "",
+            last_time=f"a.{last_time_field}" if last_time_field else "NULL::timestamptz",
+        )
+        # execute_query_dict always fetches, execute_query may drop the rows of an INSERT
+        rows = await Tortoise.get_connection("default").execute_query_dict(
+            sql, [run_id, task_type, list(account_ids)]
+        )
+        return len(rows)
+
+    @classmethod
+    async def claim(
+        cls, task_type: AutoTaskType, *, worker: str, limit: int, lease_seconds: int
+    ) -> list[int]:
+        """Lease pending or expired items, returning their account IDs in queue order."""
+        # execute_query may send an UPDATE through execute() and drop its RETURNING rows
+        rows = await Tortoise.get_connection("default").execute_query_dict(
+            CLAIM_SQL, [task_type, limit, worker, lease_seconds]
+        )
+        return [row["account_id"] for row in sorted(rows, key=operator.itemgetter("id"))]
+
+    @classmethod
+    async def complete(
+        cls, task_type: AutoTaskType, account_ids: Sequence[int], *, worker: str
+    ) -> None:
+        """Mark items leased by the worker as done, items re-leased by another worker are kept."""
+        await Tortoise.get_connection("default").execute_query(
+            COMPLETE_SQL, [task_type, list(account_ids), worker]
+        )
+
+    @classmethod
+    async def renew(
+        cls, task_type: AutoTaskType, account_ids: Sequence[int], *, worker: str, lease_seconds: int
+    ) -> None:
+        """Extend the leases the worker still holds."""
+        await Tortoise.get_connection("default").execute_query(
+            RENEW_SQL, [task_type, list(account_ids), worker, lease_seconds]
+        )
+
+    @classmethod
+    async def get_progress(cls, run_id: str) -> dict[str, int]:
+        """Get the number of pending, leased, expired and done items of a run."""
+        rows = await Tortoise.get_connection("default").execute_query_dict(PROGRESS_SQL, [run_id])
+        return dict(rows[0])
+
+    @classmethod
+    async def purge(cls, *, days: int = 1) -> int:
+        """Delete the items of runs created more than ``days`` days ago."""
+        return await cls.filter(created_at__lt=get_now() - datetime.timedelta(days=days)).delete()
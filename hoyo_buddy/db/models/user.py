@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from tortoise import fields
 
+from ..account_cache import AccountCache
 from .base import BaseModel
 from .hoyo_account import HoyoAccount
 
@@ -30,3 +31,4 @@ class User(BaseModel):
         """
         await HoyoAccount.filter(user=self).update(current=False)
         await HoyoAccount.filter(id=acc.id).update(current=True)
+        AccountCache.invalidate(self.id)
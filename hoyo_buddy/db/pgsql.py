@@ -6,18 +6,31 @@ from loguru import logger
 from tortoise import Tortoise
 
 from .config import DB_CONFIG
+from .metrics import track_pool
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+    import asyncpg
+
 
 __all__ = ("Database",)
 
 
 class Database:
-    async def __aenter__(self) -> None:
+    async def __aenter__(self) -> asyncpg.Pool:
+        """Initialize Tortoise and return its connection pool for raw SQL queries."""
         await Tortoise.init(config=DB_CONFIG)
+
+        client = Tortoise.get_connection("default")
+        # Tortoise creates its pool lazily on first acquire
+        async with client.acquire_connection():
+            pass
+        pool: asyncpg.Pool = client._pool  # pyright: ignore[reportAttributeAccessIssue]
+        track_pool(pool)
+
         logger.info("Connected to database")
+        return pool
 
     async def __aexit__(
         self,
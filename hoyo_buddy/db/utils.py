@@ -1,7 +1,9 @@
 # pyright: reportAssignmentType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import datetime
+import time
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from tortoise.exceptions import IntegrityError
@@ -20,14 +22,14 @@ from hoyo_buddy.utils import contains_masked_link
 from hoyo_buddy.utils.misc import get_template_num
 
 from . import models
+from .metrics import acquire
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Iterable, Mapping, Sequence
 
     import asyncpg
     import genshin
 
-    from hoyo_buddy.enums import LeaderboardType
     from hoyo_buddy.types import Interaction
 
 __all__ = (
@@ -38,8 +40,9 @@ __all__ = (
     "get_last_gacha_num",
     "get_locale",
     "get_num_since_last",
+    "import_gacha_records",
     "update_gacha_nums",
-    "update_lb_ranks",
+    "update_notes_notify_states",
 )
 
 
@@ -139,41 +142,224 @@ WHERE gachahistory.wish_id = pw.wish_id
 
 
 async def update_gacha_nums(pool: asyncpg.Pool, *, account: models.HoyoAccount) -> None:
-    """Update the num and num_since_last fields of the gacha histories."""
-    async with pool.acquire() as conn:
+    """Recompute the num and num_since_last fields of all the account's gacha histories.
+
+    Imports renumber incrementally, this is kept to repair histories that went out of sync.
+    """
+    async with acquire(pool) as conn:
         await conn.execute(UPDATE_NUM_SQL, account.id)
         await conn.execute(UPDATE_NUM_SINCE_LAST_SQL, account.id)
 
 
-UPDATE_LB_RANK_SQL = """
-WITH ranked_leaderboard AS (
+type GachaRecordRow = tuple[int, int, datetime.datetime, int, int, int | None]
+"""(wish_id, rarity, time, item_id, banner_type, banner_id)"""
+
+GACHA_IMPORT_COLUMNS = ("wish_id", "rarity", "time", "item_id", "banner_type", "banner_id")
+
+CREATE_GACHA_IMPORT_TABLE_SQL = """
+CREATE TEMP TABLE gacha_import (
+  wish_id BIGINT NOT NULL,
+  rarity INT NOT NULL,
+  "time" TIMESTAMPTZ NOT NULL,
+  item_id INT NOT NULL,
+  banner_type INT NOT NULL,
+  banner_id INT
+) ON COMMIT DROP;
+"""
+
+MERGE_GACHA_IMPORT_SQL = """
+WITH inserted AS (
+  INSERT INTO gachahistory
+    (wish_id, rarity, "time", item_id, banner_type, banner_id, num, num_since_last, game, account_id)
+  SELECT wish_id, rarity, "time", item_id, banner_type, banner_id, 1, 1, $1, $2
+  FROM gacha_import
+  ORDER BY wish_id
+  ON CONFLICT (wish_id, game, account_id, banner_type) DO NOTHING
+  RETURNING wish_id, banner_type
+)
+SELECT banner_type, COUNT(*) AS count, MIN(wish_id) AS min_wish_id
+FROM inserted
+GROUP BY banner_type;
+"""
+
+UPDATE_NUM_INCREMENTAL_SQL = """
+WITH seed AS (
+  SELECT COALESCE(
+    (
+      SELECT num FROM gachahistory
+      WHERE account_id = $1 AND banner_type = $2 AND wish_id < $3
+      ORDER BY wish_id DESC
+      LIMIT 1
+    ),
+    0
+  ) AS num
+),
+renumbered AS (
   SELECT
-    uid,
-    type,
-    game,
-    value,
-    ROW_NUMBER() OVER (
-      PARTITION BY type, game
-      ORDER BY value {order}
-    ) AS new_rank
-  FROM Leaderboard
-  WHERE game = $1 AND type = $2
+    wish_id,
+    rarity,
+    (SELECT num FROM seed) + ROW_NUMBER() OVER (ORDER BY wish_id) AS new_num
+  FROM gachahistory
+  WHERE account_id = $1 AND banner_type = $2 AND wish_id >= $3
+),
+previous_wishes AS (
+  SELECT
+    r.wish_id,
+    r.new_num,
+    COALESCE(
+      LAG(r.new_num) OVER (PARTITION BY r.rarity ORDER BY r.wish_id),
+      (
+        SELECT g.num FROM gachahistory g
+        WHERE g.account_id = $1 AND g.banner_type = $2 AND g.rarity = r.rarity AND g.wish_id < $3
+        ORDER BY g.wish_id DESC
+        LIMIT 1
+      )
+    ) AS prev_num
+  FROM renumbered r
 )
-UPDATE Leaderboard l
-SET rank = r.new_rank
-FROM ranked_leaderboard r
-WHERE l.uid = r.uid
-  AND l.type = r.type
-  AND l.game = r.game;
+UPDATE gachahistory w
+SET num = pw.new_num,
+    num_since_last =
+      CASE
+        WHEN pw.prev_num IS NULL THEN pw.new_num
+        ELSE pw.new_num - pw.prev_num
+      END
+FROM previous_wishes pw
+WHERE w.account_id = $1
+  AND w.banner_type = $2
+  AND w.wish_id = pw.wish_id;
 """
 
 
-async def update_lb_ranks(
-    pool: asyncpg.Pool, *, game: Game, type_: LeaderboardType, order: Literal["ASC", "DESC"]
+async def import_gacha_records(
+    pool: asyncpg.Pool, *, account: models.HoyoAccount, records: Iterable[GachaRecordRow]
+) -> int:
+    """Bulk import gacha records for an account.
+
+    Records are streamed into a temporary table with ``COPY`` and merged into
+    ``gachahistory``, skipping rows that already exist. Only the rows at or after
+    the oldest newly inserted wish of each banner are renumbered afterwards.
+
+    Returns:
+        The number of newly inserted records.
+    """
+    # ZZZ rarities are stored one higher to line up with the other games
+    rarity_offset = 1 if account.game is Game.ZZZ else 0
+    records = (
+        (
+            wish_id,
+            rarity + rarity_offset,
+            # Naive times (e.g. from CSV files) are UTC, like Tortoise treats them, instead of
+            # being left to the database session's timezone
+            time_ if time_.tzinfo is not None else time_.replace(tzinfo=datetime.UTC),
+            item_id,
+            banner_type,
+            banner_id,
+        )
+        for wish_id, rarity, time_, item_id, banner_type, banner_id in records
+    )
+
+    start = time.perf_counter()
+
+    async with acquire(pool) as conn, conn.transaction():
+        await conn.execute(CREATE_GACHA_IMPORT_TABLE_SQL)
+        status = await conn.copy_records_to_table(
+            "gacha_import", records=records, columns=GACHA_IMPORT_COLUMNS
+        )
+        banners = await conn.fetch(MERGE_GACHA_IMPORT_SQL, account.game, account.id)
+        for banner in banners:
+            await conn.execute(
+                UPDATE_NUM_INCREMENTAL_SQL, account.id, banner["banner_type"], banner["min_wish_id"]
+            )
+
+    inserted = sum(banner["count"] for banner in banners)
+
+    elapsed = time.perf_counter() - start
+    copied = int(status.split()[-1])
+    logger.info(
+        f"Imported {inserted}/{copied} gacha records for account {account.id} in {elapsed:.2f}s "
+        f"({copied / elapsed if elapsed else 0:.0f} records/s)"
+    )
+    return inserted
+
+
+UPDATE_NOTES_NOTIFY_STATES_SQL = """
+UPDATE notesnotify AS n
+SET
+  last_check_time = v.last_check_time,
+  last_notif_time = v.last_notif_time,
+  est_time = v.est_time,
+  next_check_at = v.next_check_at,
+  current_notif_count = v.current_notif_count
+FROM unnest(
+  $1::int[],
+  $2::timestamptz[],
+  $3::timestamptz[],
+  $4::timestamptz[],
+  $5::timestamptz[],
+  $6::smallint[]
+) AS v(
+  id,
+  last_check_time,
+  last_notif_time,
+  est_time,
+  next_check_at,
+  current_notif_count
+)
+WHERE n.id = v.id;
+"""
+DISABLE_NOTES_NOTIFIES_SQL = """
+UPDATE notesnotify SET enabled = false WHERE id = ANY($1::int[]) AND enabled;
+"""
+CLEAR_NOTES_NOTIFY_TIMES_SQL = """
+UPDATE notesnotify AS n
+SET notify_time = NULL
+FROM unnest($1::int[], $2::smallint[]) AS v(id, notify_time)
+WHERE n.id = v.id AND n.notify_time = v.notify_time;
+"""
+
+
+async def update_notes_notify_states(
+    pool: asyncpg.Pool,
+    notifies: Sequence[models.NotesNotify],
+    *,
+    disabled: Collection[int] = (),
+    cleared_notify_times: Mapping[int, int] | None = None,
 ) -> None:
-    """Update the ranks of the leaderboards."""
-    async with pool.acquire() as conn:
-        await conn.execute(UPDATE_LB_RANK_SQL.format(order=order), game, type_)
+    """Write the check state of many notes notifies in a single statement.
+
+    Only check state columns are written in bulk, so settings changed by the user while
+    the notifies were being checked are kept. Notifies disabled or with their notify_time
+    cleared by the check are updated separately, and only if the user hasn't changed
+    those columns in the meantime.
+
+    Args:
+        pool: The database pool.
+        notifies: The checked notifies.
+        disabled: IDs of the notifies the check disabled, they were enabled before.
+        cleared_notify_times: Notify ID -> notify_time it had before the check cleared it.
+    """
+    if not notifies:
+        return
+
+    async with acquire(pool) as conn, conn.transaction():
+        await conn.execute(
+            UPDATE_NOTES_NOTIFY_STATES_SQL,
+            [n.id for n in notifies],
+            [n.last_check_time for n in notifies],
+            [n.last_notif_time for n in notifies],
+            [n.est_time for n in notifies],
+            [n.next_check_at for n in notifies],
+            [n.current_notif_count for n in notifies],
+        )
+        if disabled:
+            await conn.execute(DISABLE_NOTES_NOTIFIES_SQL, list(disabled))
+        if cleared_notify_times:
+            await conn.execute(
+                CLEAR_NOTES_NOTIFY_TIMES_SQL,
+                list(cleared_notify_times.keys()),
+                list(cleared_notify_times.values()),
+            )
 
 
 def draw_locale(locale: Locale, account: models.HoyoAccount) -> Locale:
@@ -12,7 +12,8 @@ from hoyo_buddy.constants import ACCOMPANY_SUPPORT_GAMES, CONCURRENT_TASK_NUM, M
 from hoyo_buddy.db.models import DiscordEmbed
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.hoyo.auto_tasks.mixin import AutoTaskMixin
-from hoyo_buddy.utils import capture_exception, error_handler, get_now, sleep
+from hoyo_buddy.hoyo.rate_limit import RateLimiter
+from hoyo_buddy.utils import capture_exception, error_handler, get_now
 
 if TYPE_CHECKING:
     from hoyo_buddy.db import HoyoAccount
@@ -44,7 +45,7 @@ class AccompanyCheckin(AutoTaskMixin):
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
 
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
+                logger.info(f"Starting {cls.__name__}")
                 tasks = [
                     asyncio.create_task(cls._accompany_task(queue))
                     for _ in range(CONCURRENT_TASK_NUM)
@@ -97,7 +98,6 @@ class AccompanyCheckin(AutoTaskMixin):
                 account.last_accompany_time = get_now()
                 await account.save(update_fields=("last_accompany_time",))
             finally:
-                await sleep("accompany")
                 queue.task_done()
 
     @classmethod
@@ -109,16 +109,18 @@ class AccompanyCheckin(AutoTaskMixin):
             client.use_proxy = True
             client.set_lang(locale)
 
-            details = await client.get_accompany_character_details(
-                topic_id=account.accompany_topic_id  # pyright: ignore[reportArgumentType]
-            )
+            async with RateLimiter.get("accompany", client):
+                details = await client.get_accompany_character_details(
+                    topic_id=account.accompany_topic_id  # pyright: ignore[reportArgumentType]
+                )
             if details.accompany_info.accompanied_today:
                 return None
 
-            result = await client.accompany_character(
-                role_id=account.accompany_role_id,  # pyright: ignore[reportArgumentType]
-                topic_id=account.accompany_topic_id,  # pyright: ignore[reportArgumentType]
-            )
+            async with RateLimiter.get("accompany", client):
+                result = await client.accompany_character(
+                    role_id=account.accompany_role_id,  # pyright: ignore[reportArgumentType]
+                    topic_id=account.accompany_topic_id,  # pyright: ignore[reportArgumentType]
+                )
             if result.points_increased == 0:
                 return None
 
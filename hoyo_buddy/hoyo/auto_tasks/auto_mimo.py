@@ -21,6 +21,7 @@ from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import MIMO_POINT_EMOJIS
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.hoyo.auto_tasks.mixin import AutoTaskMixin
+from hoyo_buddy.hoyo.rate_limit import RateLimiter
 from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.utils import (
     capture_exception,
@@ -28,7 +29,6 @@ from hoyo_buddy.utils import (
     error_handler,
     get_mimo_task_str,
     get_now,
-    sleep,
 )
 
 if TYPE_CHECKING:
@@ -123,7 +123,6 @@ class AutoMimoMixin(AutoTaskMixin):
                         task_type=notif_task_type,
                     )
             finally:
-                await sleep("mimo_task")
                 queue.task_done()
 
     @classmethod
@@ -208,8 +207,6 @@ class AutoMimoMixin(AutoTaskMixin):
                     bought_str += f" ({convert_code_to_redeem_url(code, game=account.game)})"
                 bought_strs.append(bought_str)
 
-                await sleep("redeem")
-
             embed = DefaultEmbed(
                 locale,
                 title=LocaleStr(
@@ -261,8 +258,10 @@ class AutoMimoMixin(AutoTaskMixin):
                     break
 
                 try:
-                    result = await client.draw_mimo_lottery(game_id=game_id, version_id=version_id)
-                    await sleep("mimo_lottery")
+                    async with RateLimiter.get("mimo_lottery", client):
+                        result = await client.draw_mimo_lottery(
+                            game_id=game_id, version_id=version_id
+                        )
                 except genshin.GenshinException as e:
                     if e.retcode == -510001:  # Invalid fields in calculation
                         break
@@ -280,7 +279,6 @@ class AutoMimoMixin(AutoTaskMixin):
                     success = False
                     if account.can_redeem_code:
                         _, success = await client.redeem_code(result.code, locale=locale)
-                        await sleep("redeem")
 
                     if not success:
                         item_str += (
@@ -340,7 +338,7 @@ class AutoMimoTask(AutoMimoMixin):
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
 
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
+                logger.info(f"Starting {cls.__name__}")
                 tasks = [
                     asyncio.create_task(cls._auto_mimo_task(queue, task_type="task"))
                     for _ in range(CONCURRENT_TASK_NUM)
@@ -383,7 +381,7 @@ class AutoMimoBuy(AutoMimoMixin):
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
 
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
+                logger.info(f"Starting {cls.__name__}")
                 tasks = [
                     asyncio.create_task(cls._auto_mimo_task(queue, task_type="buy"))
                     for _ in range(CONCURRENT_TASK_NUM)
@@ -426,7 +424,7 @@ class AutoMimoDraw(AutoMimoMixin):
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
 
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
+                logger.info(f"Starting {cls.__name__}")
                 tasks = [
                     asyncio.create_task(cls._auto_mimo_task(queue, task_type="draw"))
                     for _ in range(CONCURRENT_TASK_NUM)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar
 
@@ -13,6 +14,8 @@ from hoyo_buddy.constants import (
     CONCURRENT_TASK_NUM,
     HB_GAME_TO_GPY_GAME,
     MAX_PROXY_ERROR_NUM,
+    REDEEM_INTERVAL,
+    REDEEM_PROBE_TIMEOUT,
 )
 from hoyo_buddy.db.models import DiscordEmbed
 from hoyo_buddy.enums import Locale
@@ -21,6 +24,8 @@ from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.utils import capture_exception, error_handler, get_now
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import aiohttp
 
     from hoyo_buddy.db import HoyoAccount
@@ -28,6 +33,115 @@ if TYPE_CHECKING:
     from hoyo_buddy.enums import Game
 
 
+class RedeemPlanner:
+    """Code states shared by all accounts of an auto redeem run.
+
+    The first definitive response for a code decides it for every account: invalid
+    and expired codes are skipped for everyone, region locked codes for every account
+    of that server. Until a code is decided, only one account at a time tries it, others
+    try it themselves if no decision comes within REDEEM_PROBE_TIMEOUT seconds.
+
+    Accounts that hit the per-account redemption cooldown are deferred for REDEEM_INTERVAL
+    seconds before their next attempt.
+    """
+
+    def __init__(self, game_codes: dict[Game, list[str]]) -> None:
+        self._game_codes = game_codes
+        self._valid: set[tuple[Game, str]] = set()
+        self._invalid: set[tuple[Game, str]] = set()
+        self._region_locked: set[tuple[Game, str, str]] = set()
+        self._probes: dict[tuple[Game, str], asyncio.Event] = {}
+        self._deferred: dict[int, float] = {}
+        """Account ID -> monotonic time until which the account is on redemption cooldown"""
+
+        self.attempts = 0
+        self.skipped = 0
+
+    @staticmethod
+    def _get_server(account: HoyoAccount) -> str:
+        return genshin.utility.recognize_server(account.uid, HB_GAME_TO_GPY_GAME[account.game])
+
+    def _is_blocked(self, account: HoyoAccount, code: str) -> bool:
+        key = (account.game, code)
+        return key in self._invalid or (*key, self._get_server(account)) in self._region_locked
+
+    def has_codes(self, game: Game) -> bool:
+        return bool(self._game_codes.get(game))
+
+    def get_codes(self, account: HoyoAccount, *, skip_redeemed: bool) -> list[str]:
+        """Get the codes the account still has to try."""
+        redeemed = {c.capitalize() for c in account.redeemed_codes} if skip_redeemed else set()
+        return [
+            code
+            for code in self._game_codes.get(account.game, [])
+            if code and code.capitalize() not in redeemed and not self._is_blocked(account, code)
+        ]
+
+    async def should_redeem(self, account: HoyoAccount, code: str) -> bool:
+        """Wait until the code is decided or the account is picked to try it."""
+        key = (account.game, code)
+        while True:
+            if self._is_blocked(account, code):
+                self.skipped += 1
+                return False
+            if key in self._valid:
+                break
+
+            probe = self._probes.get(key)
+            if probe is None:
+                self._probes[key] = asyncio.Event()
+                break
+
+            try:
+                await asyncio.wait_for(probe.wait(), timeout=REDEEM_PROBE_TIMEOUT)
+            except TimeoutError:
+                logger.debug(f"Probe of redeem code {code} timed out, trying it with {account}")
+                break
+
+        deferred_until = self._deferred.pop(account.id, None)
+        if deferred_until is not None:
+            await asyncio.sleep(max(0.0, deferred_until - time.monotonic()))
+
+        self.attempts += 1
+        return True
+
+    def record(
+        self, account: HoyoAccount, code: str, *, success: bool, error: Exception | None
+    ) -> None:
+        """Learn from the result of a redemption attempt."""
+        key = (account.game, code)
+
+        if isinstance(error, genshin.RedemptionCooldown):
+            self._deferred[account.id] = time.monotonic() + REDEEM_INTERVAL
+
+        if success or (
+            isinstance(error, genshin.RedemptionException)
+            and not isinstance(error, genshin.RedemptionCooldown)
+        ):
+            if isinstance(error, genshin.RedemptionInvalid):
+                self._invalid.add(key)
+                self._valid.discard(key)
+                logger.info(f"Redeem code {code} of {account.game} is invalid: {error}")
+            elif isinstance(error, genshin.RedemptionRegionLock):
+                self._region_locked.add((*key, self._get_server(account)))
+            else:
+                self._valid.add(key)
+
+            probe = self._probes.get(key)
+        else:
+            # Not decided, let another account try it
+            probe = self._probes.pop(key, None)
+
+        if probe is not None:
+            probe.set()
+
+    def get_summary(self) -> str:
+        return (
+            f"attempts={self.attempts}, skipped={self.skipped}, valid={len(self._valid)}, "
+            f"invalid={len(self._invalid)}, region_locked={len(self._region_locked)}"
+        )
+
+
 class AutoRedeem(AutoTaskMixin):
     _count: ClassVar[int]
     _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
@@ -49,6 +163,7 @@ class AutoRedeem(AutoTaskMixin):
 
                 game_codes = await cls.get_codes(session)
                 logger.debug(f"Game codes: {game_codes}")
+                planner = RedeemPlanner(game_codes)
 
                 queue = await cls.build_auto_task_queue(
                     "redeem", games=AUTO_REDEEM_SUPPORT_GAMES, region=genshin.Region.OVERSEAS
@@ -57,10 +172,10 @@ class AutoRedeem(AutoTaskMixin):
                     logger.debug(f"Queue is empty for {cls.__name__}")
                     return
 
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
+                logger.info(f"Starting {cls.__name__}")
                 tasks = [
                     asyncio.create_task(
-                        cls._redeem_code_task(queue, game_codes, skip_redeemed=skip_redeemed)
+                        cls._redeem_code_task(queue, planner, skip_redeemed=skip_redeemed)
                     )
                     for _ in range(CONCURRENT_TASK_NUM)
                 ]
@@ -73,6 +188,7 @@ class AutoRedeem(AutoTaskMixin):
                 capture_exception(e)
             else:
                 logger.info(f"{cls.__name__} completed, count={cls._count}")
+                logger.info(f"{cls.__name__} plan: {planner.get_summary()}")
                 logger.info(f"{cls.__name__} took {asyncio.get_event_loop().time() - start:.2f}s")
 
     @staticmethod
@@ -94,24 +210,26 @@ class AutoRedeem(AutoTaskMixin):
 
     @classmethod
     async def _redeem_code_task(
-        cls,
-        queue: asyncio.Queue[HoyoAccount],
-        game_codes: dict[Game, list[str]],
-        *,
-        skip_redeemed: bool,
+        cls, queue: asyncio.Queue[HoyoAccount], planner: RedeemPlanner, *, skip_redeemed: bool
     ) -> None:
         while True:
             account = await queue.get()
             logger.debug(f"{cls.__name__} is processing account {account}")
-            codes = game_codes.get(account.game, [])
-            if not codes:
+            if not planner.has_codes(account.game):
                 logger.debug(f"No codes for {account}, game={account.game}, marking task as done")
                 queue.task_done()
                 continue
 
             try:
-                await account.fetch_related("user", "user__settings")
-                embed = await cls._redeem_codes(account, codes, skip_redeemed=skip_redeemed)
+                codes = planner.get_codes(account, skip_redeemed=skip_redeemed)
+                if codes:
+                    await account.fetch_related("user", "user__settings")
+                    embed = await cls._redeem_codes(
+                        account, codes, planner, skip_redeemed=skip_redeemed
+                    )
+                else:
+                    logger.debug(f"No codes left for {account}, game={account.game}")
+                    embed = None
             except Exception as e:
                 with error_handler():
                     if cls._error_counts[account.id] >= MAX_PROXY_ERROR_NUM:
@@ -143,7 +261,12 @@ class AutoRedeem(AutoTaskMixin):
 
     @classmethod
     async def _redeem_codes(
-        cls, account: HoyoAccount, codes: list[str], *, skip_redeemed: bool
+        cls,
+        account: HoyoAccount,
+        codes: Sequence[str],
+        planner: RedeemPlanner,
+        *,
+        skip_redeemed: bool,
     ) -> DefaultEmbed | ErrorEmbed | None:
         locale = account.user.settings.locale or Locale.american_english
 
@@ -152,8 +275,8 @@ class AutoRedeem(AutoTaskMixin):
             client.use_proxy = True
             client.set_lang(locale)
 
-            embed = await account.client.redeem_codes(
-                codes, locale=locale, blur=False, skip_redeemed=skip_redeemed
+            embed = await client.redeem_codes(
+                codes, locale=locale, blur=False, skip_redeemed=skip_redeemed, planner=planner
             )
             if embed is None:
                 return None
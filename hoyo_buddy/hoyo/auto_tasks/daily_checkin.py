@@ -13,7 +13,8 @@ from hoyo_buddy.db import User
 from hoyo_buddy.db.models import DiscordEmbed
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.hoyo.auto_tasks.mixin import AutoTaskMixin
-from hoyo_buddy.utils import capture_exception, error_handler, get_now, sleep
+from hoyo_buddy.hoyo.rate_limit import RateLimiter
+from hoyo_buddy.utils import capture_exception, error_handler, get_now
 
 if TYPE_CHECKING:
     from hoyo_buddy.db import HoyoAccount
@@ -44,7 +45,7 @@ class DailyCheckin(AutoTaskMixin):
                     logger.debug(f"Queue is empty for {cls.__name__}, {game=}")
                     return
 
-                logger.info(f"Starting {cls.__name__} for {queue.qsize()} accounts")
+                logger.info(f"Starting {cls.__name__}")
                 tasks = [
                     asyncio.create_task(cls._daily_checkin_task(queue))
                     for _ in range(CONCURRENT_TASK_NUM)
@@ -97,7 +98,6 @@ class DailyCheckin(AutoTaskMixin):
                 account.last_checkin_time = get_now()
                 await account.save(update_fields=("last_checkin_time",))
             finally:
-                await sleep("checkin")
                 queue.task_done()
 
     @classmethod
@@ -109,8 +109,9 @@ class DailyCheckin(AutoTaskMixin):
             client.use_proxy = True
             client.set_lang(locale)
 
-            await client.update_cookies_for_checkin()
-            reward = await client.claim_daily_reward()
+            async with RateLimiter.get("checkin", client):
+                await client.update_cookies_for_checkin()
+                reward = await client.claim_daily_reward()
             embed = client.get_daily_reward_embed(reward, locale, blur=False)
         except Exception as e:
             if isinstance(e, genshin.DailyGeetestTriggered):
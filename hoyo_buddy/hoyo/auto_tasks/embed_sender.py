@@ -8,14 +8,17 @@ from typing import TYPE_CHECKING, ClassVar
 import discord
 from loguru import logger
 from seria.utils import shorten
+from tortoise.expressions import F
 
-from hoyo_buddy.constants import AUTO_TASK_FEATURE_KEYS, NOTIF_SETTING_FIELDS
+from hoyo_buddy.constants import AUTO_TASK_FEATURE_KEYS, DM_CONCURRENCY, NOTIF_SETTING_FIELDS
 from hoyo_buddy.db.models import AccountNotifSettings, DiscordEmbed, Settings
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.l10n import LocaleStr
-from hoyo_buddy.utils import get_now, sleep
+from hoyo_buddy.utils import get_now
 
 if TYPE_CHECKING:
+    import asyncpg
+
     from hoyo_buddy.bot.bot import HoyoBuddy
     from hoyo_buddy.db.models import HoyoAccount
     from hoyo_buddy.types import AutoTaskType
@@ -23,11 +26,27 @@ if TYPE_CHECKING:
 MAX_EMBEDS_PER_MESSAGE = 10
 MAX_EMBED_CHARS_PER_MESSAGE = 5900
 STALE_EMBED_HOURS = 12
+MAX_DELIVERY_ATTEMPTS = 5
+"""Embeds that failed this many times are dead letters and are no longer retried."""
+DEAD_LETTER_DAYS = 7
+NOTIFY_CHANNEL = "discord_embed"
+"""Postgres channel notified with the user ID by a trigger on every DiscordEmbed insert."""
+NOTIFY_DEBOUNCE_SECONDS = 2
 
 
 class EmbedSender:
+    """Delivers queued DiscordEmbed rows to users.
+
+    Rows are pushed through Postgres LISTEN/NOTIFY as soon as they are committed, and the
+    periodic execute() run acts as a fallback that picks up anything the listener missed.
+    A row is only deleted after it was sent, so delivery is at-least-once.
+    """
+
     _bot: ClassVar[HoyoBuddy]
     _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    _listen_conn: ClassVar[asyncpg.pool.PoolConnectionProxy | None] = None
+    _pending_users: ClassVar[set[int]] = set()
+    _flush_task: ClassVar[asyncio.Task | None] = None
 
     @classmethod
     def _get_error_content(
@@ -126,14 +145,128 @@ class EmbedSender:
 
         for chunk in cls._chunk_embeds(to_send):
             _, errored = await cls._bot.dm_user(user_id, embeds=[e for _, e in chunk])
-            await sleep("dm")
             if not errored:
                 deleted += await DiscordEmbed.filter(id__in=[row.id for row, _ in chunk]).delete()
 
         return deleted
 
+    @classmethod
+    async def _deliver(cls, user_ids: set[int] | None = None) -> None:
+        """Send pending embeds, optionally only the ones of the given users."""
+        failed_users: set[int] = set()
+
+        while True:
+            query = DiscordEmbed.filter(attempts__lt=MAX_DELIVERY_ATTEMPTS)
+            if user_ids is not None:
+                query = query.filter(user_id__in=user_ids)
+            if failed_users:
+                query = query.exclude(user_id__in=failed_users)
+            embeds = await query.order_by("-type", "id").limit(100).prefetch_related("account")
+            if not embeds:
+                logger.debug("No embeds to send for")
+                break
+
+            notif_settings = {
+                settings.account_id: settings
+                for settings in await AccountNotifSettings.filter(
+                    account_id__in={embed.account_id for embed in embeds}
+                )
+            }
+
+            # Organize embeds into a dictionary with user_id as key
+            embeds_dict: defaultdict[int, list[DiscordEmbed]] = defaultdict(list)
+            for embed in embeds:
+                embeds_dict[embed.user_id].append(embed)
+
+            queue: asyncio.Queue[tuple[int, list[DiscordEmbed]]] = asyncio.Queue()
+            for item in embeds_dict.items():
+                queue.put_nowait(item)
+
+            tasks = [
+                asyncio.create_task(cls._send_task(queue, notif_settings, failed_users))
+                for _ in range(min(DM_CONCURRENCY, queue.qsize()))
+            ]
+            await queue.join()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    async def _send_task(
+        cls,
+        queue: asyncio.Queue[tuple[int, list[DiscordEmbed]]],
+        notif_settings: dict[int, AccountNotifSettings],
+        failed_users: set[int],
+    ) -> None:
+        while True:
+            user_id, user_embeds = await queue.get()
+            try:
+                deleted = await cls._send_embeds(user_id, user_embeds, notif_settings)
+                if deleted == 0:
+                    # Every send for this user errored, skip them to avoid spinning
+                    failed_users.add(user_id)
+                    await DiscordEmbed.filter(id__in=[e.id for e in user_embeds]).update(
+                        attempts=F("attempts") + 1
+                    )
+            except Exception as e:
+                failed_users.add(user_id)
+                cls._bot.capture_exception(e)
+            finally:
+                queue.task_done()
+
+    @classmethod
+    def _on_notify(cls, _conn: asyncpg.Connection, _pid: int, _channel: str, payload: str) -> None:
+        cls._pending_users.add(int(payload))
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_task = asyncio.create_task(cls._flush_pending())
+
+    @classmethod
+    async def _flush_pending(cls) -> None:
+        # Auto tasks insert embeds in bursts, wait a bit to deliver them together
+        await asyncio.sleep(NOTIFY_DEBOUNCE_SECONDS)
+
+        async with cls._lock:
+            while cls._pending_users:
+                user_ids = cls._pending_users.copy()
+                cls._pending_users.clear()
+                try:
+                    await cls._deliver(user_ids)
+                except Exception as e:
+                    cls._bot.capture_exception(e)
+
+    @classmethod
+    async def listen(cls, bot: HoyoBuddy) -> None:
+        """Start pushing embeds to users as soon as they are inserted."""
+        cls._bot = bot
+
+        if cls._listen_conn is not None:
+            if not cls._listen_conn.is_closed():
+                return
+            await bot.pool.release(cls._listen_conn)
+
+        cls._listen_conn = await bot.pool.acquire()
+        await cls._listen_conn.add_listener(NOTIFY_CHANNEL, cls._on_notify)
+        logger.info(f"{cls.__name__} is listening on {NOTIFY_CHANNEL!r}")
+
+    @classmethod
+    async def stop_listening(cls) -> None:
+        if cls._listen_conn is None:
+            return
+
+        conn, cls._listen_conn = cls._listen_conn, None
+        if not conn.is_closed():
+            await conn.remove_listener(NOTIFY_CHANNEL, cls._on_notify)
+        await cls._bot.pool.release(conn)
+
     @classmethod
     async def execute(cls, bot: HoyoBuddy) -> None:
+        """Fallback run that delivers every pending embed and cleans up old ones."""
+        try:
+            # Restore the listener if its connection dropped
+            await cls.listen(bot)
+        except Exception as e:
+            bot.capture_exception(e)
+
         if cls._lock.locked():
             logger.debug(f"{cls.__name__} is already running")
             return
@@ -149,41 +282,18 @@ class EmbedSender:
                 if stale:
                     logger.info(f"{cls.__name__} deleted {stale} stale embeds")
 
-                cnt = await DiscordEmbed.all().count()
+                dead = await DiscordEmbed.filter(
+                    attempts__gte=MAX_DELIVERY_ATTEMPTS,
+                    created_at__lt=get_now() - datetime.timedelta(days=DEAD_LETTER_DAYS),
+                ).delete()
+                if dead:
+                    logger.info(f"{cls.__name__} deleted {dead} dead letter embeds")
+
+                cnt = await DiscordEmbed.filter(attempts__lt=MAX_DELIVERY_ATTEMPTS).count()
                 if cnt == 0:
                     return
 
                 logger.info(f"Starting {cls.__name__} for {cnt} embeds")
-
-                failed_users: set[int] = set()
-
-                while True:
-                    query = DiscordEmbed.all()
-                    if failed_users:
-                        query = query.exclude(user_id__in=failed_users)
-                    embeds = (
-                        await query.order_by("-type", "id").limit(100).prefetch_related("account")
-                    )
-                    if not embeds:
-                        logger.debug("No embeds to send for")
-                        break
-
-                    notif_settings = {
-                        settings.account_id: settings
-                        for settings in await AccountNotifSettings.filter(
-                            account_id__in={embed.account_id for embed in embeds}
-                        )
-                    }
-
-                    # Organize embeds into a dictionary with user_id as key
-                    embeds_dict: defaultdict[int, list[DiscordEmbed]] = defaultdict(list)
-                    for embed in embeds:
-                        embeds_dict[embed.user_id].append(embed)
-
-                    for user_id, user_embeds in embeds_dict.items():
-                        deleted = await cls._send_embeds(user_id, user_embeds, notif_settings)
-                        if deleted == 0:
-                            # Every send for this user errored, skip them to avoid spinning
-                            failed_users.add(user_id)
+                await cls._deliver()
             except Exception as e:
                 bot.capture_exception(e)
@@ -2,22 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import os
+import socket
+import time
 from typing import TYPE_CHECKING
 
 import tortoise.timezone
 from loguru import logger
-from tortoise.expressions import Case, Q, When
+from tortoise.expressions import Q
 
 from hoyo_buddy.constants import (
+    AUTO_TASK_CLAIM_SIZE,
     AUTO_TASK_INTERVALS,
     AUTO_TASK_LAST_TIME_FIELDS,
+    AUTO_TASK_LEASE_RENEW_INTERVAL,
+    AUTO_TASK_LEASE_SECONDS,
+    AUTO_TASK_QUEUE_SIZE,
+    AUTO_TASK_RUN_WINDOW,
     AUTO_TASK_TOGGLE_FIELDS,
-    UTC_8,
 )
 from hoyo_buddy.db import models
 from hoyo_buddy.db.utils import build_account_query
 from hoyo_buddy.enums import Game
-from hoyo_buddy.utils import get_now
+from hoyo_buddy.utils import capture_exception, get_now
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -27,6 +34,126 @@ if TYPE_CHECKING:
     from hoyo_buddy.types import AutoTaskType
 
 
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+"""Identifies this scheduler replica in task run item leases."""
+
+
+class AutoTaskQueue(asyncio.Queue["models.HoyoAccount"]):
+    """Account queue that is filled from leased task run items while the workers consume it.
+
+    The producer waits while the queue holds ``limit`` accounts, so memory use doesn't
+    grow with the number of accounts. Workers can still put back accounts to retry
+    without blocking. An item is completed once the worker that got its account calls
+    task_done() without putting it back.
+
+    Leases of the items still queued or being processed are renewed until the queue is
+    joined, or until no worker has touched it for a whole lease.
+    """
+
+    def __init__(self, task_type: AutoTaskType, run_id: str, *, limit: int) -> None:
+        super().__init__()
+        self.task_type: AutoTaskType = task_type
+        self.run_id = run_id
+        self._limit = limit
+        self._space = asyncio.Event()
+        self.producer: asyncio.Task[None] | None = None
+
+        self._in_flight: dict[asyncio.Task | None, int] = {}
+        self._retrying: set[int] = set()
+        self._done: list[int] = []
+        self._last_activity = time.monotonic()
+        self.renewer: asyncio.Task[None] | None = None
+
+    def _get(self) -> models.HoyoAccount:
+        item = super()._get()
+        if self.qsize() < self._limit:
+            self._space.set()
+
+        self._retrying.discard(item.id)
+        self._in_flight[asyncio.current_task()] = item.id
+        self._last_activity = time.monotonic()
+        return item
+
+    def _put(self, item: models.HoyoAccount) -> None:
+        if self._in_flight.get(asyncio.current_task()) == item.id:
+            self._retrying.add(item.id)
+        super()._put(item)
+
+    def task_done(self) -> None:
+        account_id = self._in_flight.pop(asyncio.current_task(), None)
+        if account_id is not None and account_id not in self._retrying:
+            self._done.append(account_id)
+        self._last_activity = time.monotonic()
+        super().task_done()
+
+    async def feed(self, account: models.HoyoAccount) -> None:
+        while self.qsize() >= self._limit:
+            self._space.clear()
+            await self._space.wait()
+        self.put_nowait(account)
+
+    async def claim(self) -> list[models.HoyoAccount]:
+        """Lease the next batch of items and return their accounts."""
+        account_ids = await models.TaskRunItem.claim(
+            self.task_type,
+            worker=WORKER_ID,
+            limit=AUTO_TASK_CLAIM_SIZE,
+            lease_seconds=AUTO_TASK_LEASE_SECONDS,
+        )
+        if not account_ids:
+            return []
+
+        accounts = {a.id: a for a in await models.HoyoAccount.filter(id__in=account_ids)}
+        # Accounts can be deleted after they were enqueued
+        missing = [id_ for id_ in account_ids if id_ not in accounts]
+        if missing:
+            await models.TaskRunItem.complete(self.task_type, missing, worker=WORKER_ID)
+        return [accounts[id_] for id_ in account_ids if id_ in accounts]
+
+    async def flush(self) -> None:
+        """Mark the items processed since the last flush as done."""
+        if not self._done:
+            return
+
+        done, self._done = self._done, []
+        await models.TaskRunItem.complete(self.task_type, done, worker=WORKER_ID)
+
+    async def renew_leases(self) -> None:
+        """Periodically extend the leases of the items this queue holds, runs until cancelled."""
+        while True:
+            await asyncio.sleep(AUTO_TASK_LEASE_RENEW_INTERVAL)
+            if time.monotonic() - self._last_activity > AUTO_TASK_LEASE_SECONDS:
+                # Abandoned by its workers, let other replicas take over the items
+                logger.warning(f"{self.run_id} queue stalled, no longer renewing leases")
+                return
+
+            held = {account.id for account in self._queue} | set(self._in_flight.values())  # pyright: ignore[reportAttributeAccessIssue]
+            if not held:
+                continue
+            try:
+                await models.TaskRunItem.renew(
+                    self.task_type,
+                    list(held),
+                    worker=WORKER_ID,
+                    lease_seconds=AUTO_TASK_LEASE_SECONDS,
+                )
+            except Exception as e:
+                capture_exception(e)
+
+    async def join(self) -> None:
+        try:
+            if self.producer is not None:
+                await self.producer
+            await super().join()
+        finally:
+            if self.renewer is not None:
+                self.renewer.cancel()
+        await self.flush()
+
+        progress = await models.TaskRunItem.get_progress(self.run_id)
+        logger.info(f"{self.run_id} progress: {progress}")
+
+
 class AutoTaskMixin:
     @staticmethod
     async def build_auto_task_queue(
@@ -34,7 +161,7 @@ class AutoTaskMixin:
         *,
         games: Sequence[Game] | None = None,
         region: genshin.Region | None = None,
-    ) -> asyncio.Queue[models.HoyoAccount]:
+    ) -> AutoTaskQueue:
         games = games or list(Game)
         query = build_account_query(games=games, region=region)
 
@@ -58,6 +185,12 @@ class AutoTaskMixin:
                         **{f"{field_name}__lt": threshold_time, f"{field_name}__isnull": True},
                         join_type="OR",
                     )
+        elif (field_name := AUTO_TASK_LAST_TIME_FIELDS.get(task_type)) is not None:
+            # Skip accounts that already ran today (UTC+8)
+            today = get_now().replace(hour=0, minute=0, second=0, microsecond=0)
+            query &= Q(
+                **{f"{field_name}__lt": today, f"{field_name}__isnull": True}, join_type="OR"
+            )
 
         # Filter accounts that have the auto task toggle enabled
         toggle_field = AUTO_TASK_TOGGLE_FIELDS.get(task_type)
@@ -80,30 +213,47 @@ class AutoTaskMixin:
         if task_type == "accompany":
             query &= Q(accompany_role_id__isnull=False)
 
-        # Supporters have priority
-        supporter_ids: list[int] = await models.JSONFile.read("supporter_ids.json", default=[])
-        logger.debug(f"Supporter IDs: {supporter_ids}")
-        query_set = (
-            models.HoyoAccount.filter(query)
-            .annotate(is_supporter=Case(When(user_id__in=supporter_ids, then="1"), default="0"))
-            .order_by("-is_supporter", "id")
+        # The candidates are read once, without ordering; prioritizing and removing duplicate
+        # cookies/game pairs of daily tasks happens in the statement that enqueues them
+        account_ids = await models.HoyoAccount.filter(query).values_list("id", flat=True)
+
+        # Enqueue the candidates of this run, replicas that start in the same window share it
+        run_id = AutoTaskMixin.get_run_id(task_type)
+        await models.TaskRunItem.purge()
+        enqueued = await models.TaskRunItem.enqueue(
+            run_id,
+            task_type,
+            account_ids,  # pyright: ignore[reportArgumentType]
+            last_time_field=AUTO_TASK_LAST_TIME_FIELDS.get(task_type),
+            dedupe=daily_task,
         )
+        logger.info(f"Enqueued {enqueued} accounts for {run_id}")
 
-        last_time_field = AUTO_TASK_LAST_TIME_FIELDS.get(task_type)
+        # Wait for the first batch so callers can tell if there's nothing to do
+        queue = AutoTaskQueue(task_type, run_id, limit=AUTO_TASK_QUEUE_SIZE)
+        first_batch = await queue.claim()
+        for account in first_batch:
+            queue.put_nowait(account)
 
-        queue: asyncio.Queue[models.HoyoAccount] = asyncio.Queue()
-        cookie_game_pairs: set[tuple[str, Game]] = set()
-        async for account in query_set:
-            # For daily tasks: skip accounts with the same cookies and game (duplicates),
-            # and skip accounts that already ran today (UTC+8)
-            if daily_task:
-                last_time = getattr(account, last_time_field) if last_time_field else None
-                if (account.cookies, account.game) in cookie_game_pairs or (
-                    last_time is not None and last_time.astimezone(UTC_8).date() == get_now().date()
-                ):
-                    continue
+        if first_batch:
+            queue.renewer = asyncio.create_task(queue.renew_leases())
+        if len(first_batch) == AUTO_TASK_CLAIM_SIZE:
+            queue.producer = asyncio.create_task(AutoTaskMixin._feed_queue(queue))
+        return queue
 
-            cookie_game_pairs.add((account.cookies, account.game))
-            await queue.put(account)
+    @staticmethod
+    def get_run_id(task_type: AutoTaskType) -> str:
+        now = get_now(datetime.UTC)
+        window = now.replace(minute=now.minute - now.minute % AUTO_TASK_RUN_WINDOW, second=0)
+        return f"{task_type}:{window:%Y%m%d%H%M}"
 
-        return queue
+    @staticmethod
+    async def _feed_queue(queue: AutoTaskQueue) -> None:
+        try:
+            while accounts := await queue.claim():
+                for account in accounts:
+                    await queue.feed(account)
+                await queue.flush()
+        except Exception as e:
+            # Items that weren't claimed are left for the next run or other replicas
+            capture_exception(e)
@@ -9,12 +9,16 @@ import discord
 import genshin
 from genshin.models import HonkaiNotes, StarRailNote, VideoStoreState, ZZZNotes
 from genshin.models import Notes as GenshinNotes
+from loguru import logger
+from tortoise.expressions import Q
 
 from hoyo_buddy.bot.error_handler import get_error_embed
-from hoyo_buddy.db import NotesNotify, draw_locale
+from hoyo_buddy.constants import NOTES_CHECK_STATE_FLUSH_SIZE, NOTES_CHECK_WORKER_NUM
+from hoyo_buddy.db import NotesNotify, draw_locale, update_notes_notify_states
 from hoyo_buddy.draw.main_funcs import draw_gi_notes_card, draw_hsr_notes_card, draw_zzz_notes_card
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.enums import Game, Locale, NotesNotifyType
+from hoyo_buddy.hoyo.rate_limit import RateLimiter
 from hoyo_buddy.icons import (
     BATTERY_CHARGE_ICON,
     COMMISSION_ICON,
@@ -29,7 +33,7 @@ from hoyo_buddy.l10n import LocaleStr
 from hoyo_buddy.models import DrawInput
 from hoyo_buddy.ui import View
 from hoyo_buddy.ui.hoyo.notes.view import NotesView
-from hoyo_buddy.utils import get_now, sleep
+from hoyo_buddy.utils import get_now
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -45,6 +49,45 @@ Notes: TypeAlias = GenshinNotes | HonkaiNotes | StarRailNote | ZZZNotes
 class NotesChecker:
     _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
     _bot: ClassVar[HoyoBuddy]
+    _dirty: ClassVar[dict[int, NotesNotify]] = {}
+    """Notifies with state changes that haven't been written to the database yet."""
+    _disabled: ClassVar[set[int]] = set()
+    """IDs of dirty notifies that were disabled by their check."""
+    _cleared_notify_times: ClassVar[dict[int, int]] = {}
+    """Dirty notify ID -> notify_time it had before its check cleared it."""
+
+    @classmethod
+    async def _save_state(cls, notify: NotesNotify) -> None:
+        cls._dirty[notify.id] = notify
+        if len(cls._dirty) >= NOTES_CHECK_STATE_FLUSH_SIZE:
+            await cls._flush_states()
+
+    @classmethod
+    async def _flush_states(cls) -> None:
+        """Write all pending state changes.
+
+        A notify's state is only queued after its check finished, so changes lost to a
+        crash before the flush make the notify get checked again instead of skipped.
+        """
+        if not cls._dirty:
+            return
+
+        notifies = list(cls._dirty.values())
+        disabled = cls._disabled
+        cleared_notify_times = cls._cleared_notify_times
+        cls._dirty.clear()
+        cls._disabled = set()
+        cls._cleared_notify_times = {}
+
+        await update_notes_notify_states(
+            cls._bot.pool, notifies, disabled=disabled, cleared_notify_times=cleared_notify_times
+        )
+
+    @classmethod
+    async def _disable(cls, notify: NotesNotify) -> None:
+        notify.enabled = False
+        cls._disabled.add(notify.id)
+        await cls._save_state(notify)
 
     @classmethod
     def _calc_est_time(cls, game: Game, threshold: int, current: int) -> datetime.datetime:
@@ -217,7 +260,7 @@ class NotesChecker:
     ) -> None:
         notify.current_notif_count = 0
         notify.est_time = est_time
-        await notify.save(update_fields=("current_notif_count", "est_time"))
+        await cls._save_state(notify)
 
     @classmethod
     async def _notify_user(cls, notify: NotesNotify, notes: Notes | None) -> None:
@@ -264,10 +307,12 @@ class NotesChecker:
             )
             view.message = message
 
-            notify.enabled = not errored
             notify.last_notif_time = get_now()
-            notify.current_notif_count += 1 if not errored else 0
-            await notify.save(update_fields=("enabled", "last_notif_time", "current_notif_count"))
+            if errored:
+                await cls._disable(notify)
+            else:
+                notify.current_notif_count += 1
+                await cls._save_state(notify)
         except Exception as e:
             await cls._handle_notify_error(notify, e)
 
@@ -547,8 +592,7 @@ class NotesChecker:
             notify.account.user.id, embed=embed, content=content.translate(locale)
         )
 
-        notify.enabled = False
-        await notify.save(update_fields=("enabled",))
+        await cls._disable(notify)
 
     @classmethod
     def _determine_skip(cls, notify: NotesNotify) -> bool:
@@ -585,6 +629,35 @@ class NotesChecker:
 
         return False
 
+    @classmethod
+    def _get_next_check_time(cls, notify: NotesNotify) -> datetime.datetime:
+        """Get the earliest time at which _determine_skip can stop skipping the notification."""
+        now = get_now()
+        candidates = [now]
+
+        if notify.est_time is not None:
+            candidates.append(notify.est_time)
+        if notify.last_check_time is not None:
+            candidates.append(
+                notify.last_check_time + datetime.timedelta(minutes=notify.check_interval)
+            )
+        if notify.last_notif_time is not None:
+            candidates.append(
+                notify.last_notif_time + datetime.timedelta(minutes=notify.notify_interval)
+            )
+
+        server_reset = notify.account.server_reset_datetime
+        if (
+            notify.notify_weekday is not None
+            and notify.notify_weekday != server_reset.weekday() + 1
+        ):
+            # The weekday is re-evaluated after the next server reset
+            candidates.append(server_reset)
+        if notify.notify_time is not None:
+            candidates.append(server_reset - datetime.timedelta(hours=notify.notify_time))
+
+        return max(candidates)
+
     @classmethod
     async def _get_notes(cls, notify: NotesNotify) -> Notes | StarRailNote | ZZZNotes:
         if notify.account.game is Game.GENSHIN:
@@ -601,55 +674,105 @@ class NotesChecker:
 
     @classmethod
     async def _adjust_notify(cls, notify: NotesNotify) -> NotesNotify:
-        if notify.type is NotesNotifyType.VIDEO_STORE:
+        if notify.type is NotesNotifyType.VIDEO_STORE and notify.notify_time is not None:
+            cls._cleared_notify_times[notify.id] = notify.notify_time
             notify.notify_time = None
-            await notify.save(update_fields=("notify_time",))
+            await cls._save_state(notify)
         return notify
 
+    @classmethod
+    async def _get_notes_or_events(
+        cls, notify: NotesNotify, notes_cache: dict[tuple[Game, int], Notes]
+    ) -> tuple[Notes | None, Sequence[HSREvent] | None]:
+        client = notify.account.client
+        if notify.type is NotesNotifyType.PLANAR_FISSURE:
+            async with RateLimiter.get("notes_check", client):
+                return None, (await client.get_starrail_event_calendar()).events
+
+        key = (notify.account.game, notify.account.uid)
+        if key not in notes_cache:
+            async with RateLimiter.get("notes_check", client):
+                notes_cache[key] = await cls._get_notes(notify)
+        return notes_cache[key], None
+
+    @classmethod
+    async def _check_notifies(cls, notifies: list[NotesNotify]) -> None:
+        """Check all notifies of one game account, sharing the fetched notes between them."""
+        notes_cache: dict[tuple[Game, int], Notes] = {}
+
+        for notify in notifies:
+            try:
+                notes, events = await cls._get_notes_or_events(notify, notes_cache)
+            except genshin.errors.InternalDatabaseError:
+                notes = events = None
+            except Exception as e:
+                await cls._handle_notify_error(notify, e)
+            else:
+                if notes is not None or events is not None:
+                    try:
+                        await cls._process_notify(notify, notes, events)
+                    except Exception as e:
+                        await cls._handle_notify_error(notify, e)
+
+            notify.last_check_time = get_now()
+            notify.next_check_at = cls._get_next_check_time(notify)
+            await cls._save_state(notify)
+
+    @classmethod
+    async def _notes_check_task(cls, queue: asyncio.Queue[list[NotesNotify]]) -> None:
+        while True:
+            notifies = await queue.get()
+            try:
+                await cls._check_notifies(notifies)
+            except Exception as e:
+                cls._bot.capture_exception(e)
+            finally:
+                queue.task_done()
+
     @classmethod
     async def execute(cls, bot: HoyoBuddy) -> None:
         if cls._lock.locked():
             return
 
-        async with cls._lock:  # ruff:ignore[too-many-nested-blocks]
+        async with cls._lock:
             cls._bot = bot
-            notes_cache: defaultdict[Game, dict[int, Notes | StarRailNote | ZZZNotes]] = (
-                defaultdict(dict)
-            )
 
             notifies = (
                 await NotesNotify.filter(enabled=True)
-                .all()
+                .filter(Q(next_check_at__isnull=True) | Q(next_check_at__lte=get_now()))
                 .order_by("account__uid")
-                .prefetch_related("account")
+                .prefetch_related("account__user__settings")
             )
-
-            for notify_ in notifies:
-                notify = await cls._adjust_notify(notify_)
-                if cls._determine_skip(notify):
-                    continue
-
-                await notify.fetch_related("account__user", "account__user__settings")
-
-                try:
-                    if notify.type is NotesNotifyType.PLANAR_FISSURE:
-                        events = (await notify.account.client.get_starrail_event_calendar()).events
-                        notes = None
-                    else:
-                        events = None
-                        if notify.account.uid not in notes_cache[notify.account.game]:
-                            try:
-                                notes = await cls._get_notes(notify)
-                            except genshin.errors.InternalDatabaseError:
-                                continue
-                            notes_cache[notify.account.game][notify.account.uid] = notes
-                        else:
-                            notes = notes_cache[notify.account.game][notify.account.uid]
-
-                    await cls._process_notify(notify, notes, events)
-                except Exception as e:
-                    await cls._handle_notify_error(notify, e)
-                finally:
-                    notify.last_check_time = get_now()
-                    await notify.save(update_fields=("last_check_time",))
-                    await sleep("notes_check")
+            if not notifies:
+                return
+
+            try:
+                # Notifies of the same game account share one notes fetch
+                groups: defaultdict[tuple[Game, int], list[NotesNotify]] = defaultdict(list)
+                for notify_ in notifies:
+                    notify = await cls._adjust_notify(notify_)
+                    if cls._determine_skip(notify):
+                        notify.next_check_at = cls._get_next_check_time(notify)
+                        await cls._save_state(notify)
+                        continue
+                    groups[notify.account.game, notify.account.uid].append(notify)
+
+                if not groups:
+                    return
+
+                logger.debug(f"{cls.__name__} checking {len(groups)} accounts")
+
+                queue: asyncio.Queue[list[NotesNotify]] = asyncio.Queue()
+                for group in groups.values():
+                    queue.put_nowait(group)
+
+                tasks = [
+                    asyncio.create_task(cls._notes_check_task(queue))
+                    for _ in range(min(NOTES_CHECK_WORKER_NUM, len(groups)))
+                ]
+                await queue.join()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                await cls._flush_states()
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import itertools
+from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar
 
 import genshin
 from loguru import logger
 
-from hoyo_buddy.constants import HB_GAME_TO_GPY_GAME
+from hoyo_buddy.constants import HB_GAME_TO_GPY_GAME, LOCALE_TO_HOYO_LANG
 from hoyo_buddy.db.models import HoyoAccount, JSONFile
 from hoyo_buddy.enums import Locale
 from hoyo_buddy.l10n import LocaleStr
@@ -15,10 +16,17 @@ from hoyo_buddy.ui.hoyo.web_events import WebEventsView
 
 if TYPE_CHECKING:
     from hoyo_buddy.bot import HoyoBuddy
+    from hoyo_buddy.embeds import DefaultEmbed
     from hoyo_buddy.enums import Game
 
 
 class WebEventsNotify:
+    """Notify users of new web events.
+
+    Events are fetched once per game and language, and the new ones are sent to every
+    subscribed user of that game, so the number of API calls doesn't grow with users.
+    """
+
     _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
     _bot: ClassVar[HoyoBuddy]
     _notify_count: ClassVar[int]
@@ -37,61 +45,117 @@ class WebEventsNotify:
                 cls._bot = bot
                 cls._notify_count = 0
 
-                accounts = await HoyoAccount.filter(notif_settings__web_events=True)
-                games = {account.game for account in accounts}
+                accounts = await HoyoAccount.filter(
+                    notif_settings__web_events=True
+                ).prefetch_related("user__settings")
+
+                # game -> locale -> user IDs, a user with multiple accounts of a game is notified once
+                subscribers: defaultdict[Game, defaultdict[Locale, set[int]]] = defaultdict(
+                    lambda: defaultdict(set)
+                )
+                for account in accounts:
+                    locale = account.user.settings.locale or Locale.american_english
+                    subscribers[account.game][locale].add(account.user.id)
 
-                for game in games:
+                for game, locales in subscribers.items():
                     try:
-                        now_events = await cls.fetch_events(game)
+                        await cls.notify_game(game, locales)
                     except Exception as e:
                         cls._bot.capture_exception(e)
-                        continue
-
-                    saved_events: list[genshin.models.WebEvent] = [
-                        genshin.models.WebEvent(**event)
-                        for event in (
-                            await JSONFile.read(f"web_events_{game.value}.json", default=[])
-                        )
-                    ]
-                    if not saved_events:
-                        saved_events = now_events
-
-                    saved_event_ids = {event.id for event in saved_events}
-                    notify_events: list[genshin.models.WebEvent] = [
-                        event for event in now_events if event.id not in saved_event_ids
-                    ]
-                    if not notify_events:
-                        continue
-
-                    notify_accounts = [account for account in accounts if account.game == game]
-                    for account in notify_accounts:
-                        await cls.notify_events(account, notify_events)
-                        cls._notify_count += 1
             except Exception as e:
                 cls._bot.capture_exception(e)
             finally:
-                logger.info(f"Web events notify finished, notified {cls._notify_count} accounts")
+                logger.info(f"Web events notify finished, notified {cls._notify_count} users")
                 logger.info(
                     f"Web events notify took {asyncio.get_event_loop().time() - start:.2f}s"
                 )
 
+    @staticmethod
+    async def _read_seen_ids(filename: str) -> set[int] | None:
+        saved: list[int | dict] = await JSONFile.read(filename, default=[])
+        if not saved:
+            return None
+        # Older versions saved the whole event instead of its ID
+        return {event["id"] if isinstance(event, dict) else event for event in saved}
+
     @classmethod
-    async def fetch_events(cls, game: Game) -> list[genshin.models.WebEvent]:
-        client = genshin.Client(game=HB_GAME_TO_GPY_GAME[game])
-        return await client.get_web_events()
+    async def notify_game(cls, game: Game, locales: dict[Locale, set[int]]) -> None:
+        """Send new events of a game to its subscribers.
+
+        Seen event IDs are kept per language and only saved after that language's users were
+        notified, so a failing language is retried without repeating the others.
+        """
+        langs: defaultdict[str, dict[Locale, set[int]]] = defaultdict(dict)
+        for locale, user_ids in locales.items():
+            langs[LOCALE_TO_HOYO_LANG.get(locale, "en-us")][locale] = user_ids
+
+        # IDs seen by any language, the starting point of languages without seen IDs of their own
+        game_filename = f"web_events_{game.value}.json"
+        game_seen_ids = await cls._read_seen_ids(game_filename)
+
+        now_ids: set[int] = set()
+        for lang, lang_locales in langs.items():
+            try:
+                now_ids.update(await cls._notify_lang(game, lang, lang_locales, game_seen_ids))
+            except Exception as e:
+                cls._bot.capture_exception(e)
+
+        if now_ids and now_ids != game_seen_ids:
+            await JSONFile.write(game_filename, sorted(now_ids))
+
+    @classmethod
+    async def _notify_lang(
+        cls, game: Game, lang: str, locales: dict[Locale, set[int]], game_seen_ids: set[int] | None
+    ) -> list[int]:
+        """Send new events in one language, returning the IDs of the current events."""
+        filename = f"web_events_{game.value}_{lang}.json"
+        events = await cls.fetch_events(game, lang=lang)
+        if not events:
+            return []
+
+        seen_ids = await cls._read_seen_ids(filename)
+        if seen_ids is None:
+            seen_ids = game_seen_ids
+
+        now_ids = [event.id for event in events]
+        if not seen_ids:
+            # First run, nothing to compare with
+            await JSONFile.write(filename, now_ids)
+            return now_ids
+
+        new_events = [event for event in events if event.id not in seen_ids]
+        for locale, user_ids in locales.items():
+            embeds = cls.get_event_embeds(new_events, locale)
+            if not embeds:
+                continue
+
+            for user_id in user_ids:
+                try:
+                    for chunk in itertools.batched(embeds, 10):
+                        await cls._bot.dm_user(user_id, embeds=chunk)
+                except Exception as e:
+                    cls._bot.capture_exception(e)
+                else:
+                    cls._notify_count += 1
+
+        if set(now_ids) != seen_ids:
+            await JSONFile.write(filename, now_ids)
+        return now_ids
 
     @classmethod
-    async def notify_events(
-        cls, account: HoyoAccount, events: list[genshin.models.WebEvent]
-    ) -> None:
-        await account.fetch_related("user", "user__settings")
-        locale = account.user.settings.locale or Locale.american_english
-        embeds = [
+    async def fetch_events(
+        cls, game: Game, *, lang: str = "en-us"
+    ) -> list[genshin.models.WebEvent]:
+        client = genshin.Client(game=HB_GAME_TO_GPY_GAME[game])
+        return await client.get_web_events(lang=lang)
+
+    @staticmethod
+    def get_event_embeds(
+        events: list[genshin.models.WebEvent], locale: Locale
+    ) -> list[DefaultEmbed]:
+        return [
             WebEventsView.get_event_embed(event, locale).set_footer(
                 text=LocaleStr(key="web_events_embed_footer")
             )
             for event in events
         ]
-
-        for chunk in itertools.batched(embeds, 10):
-            await cls._bot.dm_user(account.user.id, embeds=chunk)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, ClassVar
 
 import hb_data
 from discord.app_commands import Choice
+from loguru import logger
 
 from hoyo_buddy.constants import (
     GI_UGC_CHARACTER_IDS,
+    HOYO_BUDDY_LOCALES,
     TRAILBLAZER_IDS,
     TRAVELER_ELEMENTS,
     TRAVELER_IDS,
@@ -14,9 +18,11 @@ from hoyo_buddy.constants import (
     locale_to_starrail_data_lang,
     locale_to_zenless_data_lang,
 )
-from hoyo_buddy.enums import HSRPath
+from hoyo_buddy.enums import Game, HSRPath
 from hoyo_buddy.l10n import EnumStr, translator
 
+from .search_index import ChoiceIndex
+
 if TYPE_CHECKING:
     from hoyo_buddy.enums import Locale
 
@@ -33,7 +39,7 @@ HB_DATA_PATH_TO_HSR_PATH: dict[hb_data.hsr.Path, HSRPath] = {
 }
 
 
-async def get_gi_character_choices(
+async def fetch_gi_character_choices(
     locale: Locale, *, ambr_traveler_ids: bool = False
 ) -> list[Choice[str]]:
     """Get GI character autocomplete choices from hb-data.
@@ -73,7 +79,7 @@ async def get_gi_character_choices(
     return choices
 
 
-async def get_hsr_character_choices(locale: Locale) -> list[Choice[str]]:
+async def fetch_hsr_character_choices(locale: Locale) -> list[Choice[str]]:
     """Get HSR character autocomplete choices from hb-data."""
     async with hb_data.HSRClient() as client:
         characters = client.get_characters(
@@ -100,7 +106,7 @@ async def get_hsr_character_choices(locale: Locale) -> list[Choice[str]]:
     return choices
 
 
-async def get_zzz_character_choices(locale: Locale) -> list[Choice[str]]:
+async def fetch_zzz_character_choices(locale: Locale) -> list[Choice[str]]:
     """Get ZZZ character autocomplete choices from hb-data."""
     async with hb_data.ZZZClient() as client:
         characters = client.get_characters(
@@ -108,3 +114,77 @@ async def get_zzz_character_choices(locale: Locale) -> list[Choice[str]]:
         )
 
     return [Choice(name=character.name, value=str(character.id)) for character in characters]
+
+
+class CharacterChoices:
+    """Precomputed character autocomplete choices, one immutable index per game and locale.
+
+    Indexes are built once from hb-data and only rebuilt when the assets are updated,
+    so autocomplete callbacks just look up the index instead of reading and translating
+    the whole character list on every keystroke.
+    """
+
+    _indexes: ClassVar[dict[tuple[Game, Locale, bool], ChoiceIndex[Choice[str]]]] = {}
+    _locks: ClassVar[defaultdict[tuple[Game, Locale, bool], asyncio.Lock]] = defaultdict(
+        asyncio.Lock
+    )
+
+    @staticmethod
+    async def _fetch(game: Game, locale: Locale, *, ambr_traveler_ids: bool) -> list[Choice[str]]:
+        if game is Game.GENSHIN:
+            return await fetch_gi_character_choices(locale, ambr_traveler_ids=ambr_traveler_ids)
+        if game is Game.STARRAIL:
+            return await fetch_hsr_character_choices(locale)
+        if game is Game.ZZZ:
+            return await fetch_zzz_character_choices(locale)
+        return []
+
+    @classmethod
+    async def get(
+        cls, game: Game, locale: Locale, *, ambr_traveler_ids: bool = False
+    ) -> ChoiceIndex[Choice[str]]:
+        """Get the choice index of a game and locale, building it on first use.
+
+        Args:
+            game: Game of the characters.
+            locale: Locale of the character names.
+            ambr_traveler_ids: See fetch_gi_character_choices, only used for Genshin.
+        """
+        key = (game, locale, ambr_traveler_ids and game is Game.GENSHIN)
+        index = cls._indexes.get(key)
+        if index is not None:
+            return index
+
+        async with cls._locks[key]:
+            index = cls._indexes.get(key)
+            if index is None:
+                choices = await cls._fetch(game, locale, ambr_traveler_ids=key[2])
+                index = cls._indexes[key] = ChoiceIndex(choices)
+            return index
+
+    @classmethod
+    async def search(
+        cls, game: Game, locale: Locale, query: str, *, ambr_traveler_ids: bool = False
+    ) -> list[Choice[str]]:
+        index = await cls.get(game, locale, ambr_traveler_ids=ambr_traveler_ids)
+        return index.search(query)
+
+    @classmethod
+    async def build(cls) -> None:
+        """Build the indexes of all Hoyo Buddy locales, replacing the existing ones.
+
+        The old indexes keep serving lookups until the new ones are ready.
+        """
+        indexes: dict[tuple[Game, Locale, bool], ChoiceIndex[Choice[str]]] = {}
+        for locale in HOYO_BUDDY_LOCALES:
+            for game, ambr_traveler_ids in (
+                (Game.GENSHIN, False),
+                (Game.GENSHIN, True),
+                (Game.STARRAIL, False),
+                (Game.ZZZ, False),
+            ):
+                choices = await cls._fetch(game, locale, ambr_traveler_ids=ambr_traveler_ids)
+                indexes[game, locale, ambr_traveler_ids] = ChoiceIndex(choices)
+
+        cls._indexes = indexes
+        logger.info(f"Built {len(indexes)} character choice indexes")
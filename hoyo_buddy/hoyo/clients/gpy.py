@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import random
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, overload
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, overload
 
 import enka
 import genshin
@@ -27,6 +30,9 @@ from hoyo_buddy.constants import (
     PLAYER_BOY_GACHA_ART,
     PLAYER_GIRL_GACHA_ART,
     POST_REPLIES,
+    REDEEM_COOLDOWN_RETRIES,
+    REDEEM_INTERVAL,
+    REDEEM_TRACKED_ACCOUNTS,
     YATTA_PROP_TYPE_TO_GPY_TYPE,
     ZZZ_ENKA_AGENT_STAT_TYPE_TO_ZZZ_AGENT_PROPERTY,
     ZZZ_ENKA_ELEMENT_TO_ZZZ_ELEMENT_TYPE,
@@ -42,8 +48,9 @@ from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.enums import Game, GenshinElement, Locale
 from hoyo_buddy.exceptions import HoyoBuddyError
 from hoyo_buddy.hoyo.clients.yatta import YattaAPIClient
+from hoyo_buddy.hoyo.http_pool import HTTPPoolRegistry
+from hoyo_buddy.hoyo.rate_limit import RateLimiter
 from hoyo_buddy.l10n import LocaleStr
-from hoyo_buddy.utils import sleep
 from hoyo_buddy.utils.game import get_ascension_from_level, get_max_level_from_ascension
 
 if TYPE_CHECKING:
@@ -52,6 +59,7 @@ if TYPE_CHECKING:
     import yatta
 
     from hoyo_buddy.db import HoyoAccount
+    from hoyo_buddy.hoyo.auto_tasks.auto_redeem import RedeemPlanner
 
 
 class MimoClaimTaksResult(NamedTuple):
@@ -60,15 +68,6 @@ class MimoClaimTaksResult(NamedTuple):
     all_claimed: bool
 
 
-def _create_gpy_cache() -> genshin.cache.BaseCache:
-    """Create the genshin.py API cache, using Redis if available."""
-    static_ttl = 3600 * 24 * 31  # 31 days
-    if CONFIG.redis_url:
-        redis = aioredis.from_url(CONFIG.redis_url)
-        return genshin.RedisCache(redis, static_ttl=static_ttl)
-    return genshin.SQLiteCache(static_ttl=static_ttl)
-
-
 class ProxyGenshinClient(genshin.Client):
     def __init__(
         self,
@@ -87,7 +86,7 @@ class ProxyGenshinClient(genshin.Client):
         super().__init__(
             *args,
             debug=True,
-            cache=_create_gpy_cache(),
+            cache=GenshinClientFactory.get_cache(),
             region=region,
             proxy=effective_proxy,
             **kwargs,
@@ -95,6 +94,16 @@ class ProxyGenshinClient(genshin.Client):
         self._use_proxy = use_proxy
         self._proxy_url = proxy_url
 
+    @property
+    def cookie_manager(self) -> genshin.client.manager.BaseCookieManager:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return self._cookie_manager
+
+    @cookie_manager.setter
+    def cookie_manager(self, manager: genshin.client.manager.BaseCookieManager) -> None:
+        # genshin.py replaces the manager whenever cookies are set, hook every new one
+        manager.create_session = functools.partial(HTTPPoolRegistry.create_session, manager)  # pyright: ignore[reportAttributeAccessIssue]
+        self._cookie_manager = manager
+
     @property
     def use_proxy(self) -> bool:
         return self._use_proxy
@@ -113,6 +122,12 @@ class ProxyGenshinClient(genshin.Client):
 
 
 class GenshinClient(ProxyGenshinClient):
+    _redeem_locks: ClassVar[weakref.WeakValueDictionary[int, asyncio.Lock]] = (
+        weakref.WeakValueDictionary()
+    )
+    _last_redeems: ClassVar[dict[int, float]] = {}
+    """Account ID -> monotonic time of the account's last redemption attempt"""
+
     def __init__(self, account: HoyoAccount) -> None:
         game = HB_GAME_TO_GPY_GAME[account.game]
 
@@ -574,23 +589,37 @@ class GenshinClient(ProxyGenshinClient):
         await self._account.save(update_fields=("cookies",))
 
     async def redeem_codes(
-        self, codes: Sequence[str], *, locale: Locale, blur: bool = True, skip_redeemed: bool = True
+        self,
+        codes: Sequence[str],
+        *,
+        locale: Locale,
+        blur: bool = True,
+        skip_redeemed: bool = True,
+        planner: RedeemPlanner | None = None,
     ) -> DefaultEmbed | None:
-        """Redeem multiple codes and return an embed with the results."""
+        """Redeem multiple codes and return an embed with the results.
+
+        If a planner is given, codes it knows can't be redeemed by the account are skipped
+        and the result of every attempt is reported to it.
+        """
         if not codes:
             return None
 
+        redeemed = {c.capitalize() for c in self._account.redeemed_codes}
         results: list[tuple[str, str, bool]] = []
         for code in codes:
-            if not code or (
-                code.capitalize() in {c.capitalize() for c in self._account.redeemed_codes}
-                and skip_redeemed
-            ):
+            if not code or (code.capitalize() in redeemed and skip_redeemed):
+                continue
+            if planner is not None and not await planner.should_redeem(self._account, code):
                 continue
 
-            msg, success = await self.redeem_code(code.strip(), locale=locale)
+            msg, success, error = "", False, None
+            try:
+                msg, success, error = await self._redeem_code(code.strip(), locale=locale)
+            finally:
+                if planner is not None:
+                    planner.record(self._account, code, success=success, error=error)
             results.append((code, msg, success))
-            await sleep("redeem")
 
         if not results:
             return None
@@ -629,14 +658,50 @@ class GenshinClient(ProxyGenshinClient):
 
     async def redeem_code(self, code: str, *, locale: Locale) -> tuple[str, bool]:
         """Redeem a code, return a message and a boolean indicating success."""
+        msg, success, _ = await self._redeem_code(code, locale=locale)
+        return msg, success
+
+    def _get_redeem_lock(self) -> asyncio.Lock:
+        lock = self._redeem_locks.get(self._account.id)
+        if lock is None:
+            lock = self._redeem_locks[self._account.id] = asyncio.Lock()
+        return lock
+
+    async def _send_redeem_request(self, code: str) -> None:
+        """Redeem a code, keeping REDEEM_INTERVAL seconds between the account's attempts."""
+        async with self._get_redeem_lock():
+            last_redeem = self._last_redeems.get(self._account.id)
+            if last_redeem is not None:
+                await asyncio.sleep(max(0.0, last_redeem + REDEEM_INTERVAL - time.monotonic()))
+
+            try:
+                async with RateLimiter.get("redeem", self):
+                    await super().redeem_code(code)
+            finally:
+                now = time.monotonic()
+                self._last_redeems[self._account.id] = now
+                if len(self._last_redeems) > REDEEM_TRACKED_ACCOUNTS:
+                    # Attempts older than the interval no longer delay anything
+                    GenshinClient._last_redeems = {
+                        account_id: last
+                        for account_id, last in self._last_redeems.items()
+                        if last + REDEEM_INTERVAL > now
+                    }
+
+    async def _redeem_code(
+        self, code: str, *, locale: Locale, cooldown_retries: int = REDEEM_COOLDOWN_RETRIES
+    ) -> tuple[str, bool, Exception | None]:
+        """Redeem a code, return a message, a boolean indicating success and the error, if any."""
         success = False
+        error: Exception | None = None
 
         try:
             if code in self._account.redeemed_codes:
                 raise genshin.RedemptionClaimed
 
-            await super().redeem_code(code)
-        except genshin.InvalidCookies:
+            await self._send_redeem_request(code)
+        except genshin.InvalidCookies as e:
+            error = e
             # cookie token is invalid
             if "stoken" in self._account.dict_cookies and "ltmid_v2" in self._account.dict_cookies:
                 # cookie token can be refreshed
@@ -649,16 +714,23 @@ class GenshinClient(ProxyGenshinClient):
                     )
                 else:
                     # cookie token refresh succeeded, redeem code again
-                    await sleep("redeem")
-                    return await self.redeem_code(code, locale=locale)
+                    return await self._redeem_code(
+                        code, locale=locale, cooldown_retries=cooldown_retries
+                    )
             else:
                 # cookie token can't be refreshed
                 msg = self._handle_redeem_error(genshin.GenshinException({"retcode": 999}), locale)
-        except genshin.RedemptionCooldown:
-            # sleep then retry
-            await sleep("redeem")
-            return await self.redeem_code(code, locale=locale)
+        except genshin.RedemptionCooldown as e:
+            if cooldown_retries > 0:
+                # The next attempt waits out REDEEM_INTERVAL after this one
+                return await self._redeem_code(
+                    code, locale=locale, cooldown_retries=cooldown_retries - 1
+                )
+
+            error = e
+            msg = self._handle_redeem_error(e, locale)
         except Exception as e:
+            error = e
             if isinstance(e, genshin.RedemptionException):
                 await self._add_to_redeemed_codes(code)
 
@@ -668,7 +740,7 @@ class GenshinClient(ProxyGenshinClient):
             success = True
             msg = LocaleStr(key="redeem_code.success").translate(locale)
 
-        return msg, success
+        return msg, success, error
 
     async def update_cookies_for_checkin(self) -> dict[str, str] | None:
         """Update client cookies for check-in if the client region is CN."""
@@ -787,8 +859,8 @@ class GenshinClient(ProxyGenshinClient):
                 genshin.models.MimoTaskType.GI_VIDEO,
             }:
                 try:
-                    await self.finish_mimo_task(task.id, game_id=game_id, version_id=version_id)
-                    await sleep("mimo_task")
+                    async with RateLimiter.get("mimo_task", self):
+                        await self.finish_mimo_task(task.id, game_id=game_id, version_id=version_id)
                 except genshin.GenshinException as e:
                     if e.retcode == -500001:  # Invalid fields in calculation
                         continue
@@ -804,23 +876,23 @@ class GenshinClient(ProxyGenshinClient):
                 post_id: str | None = args.get("post_id")
                 if post_id is not None:
                     try:
-                        reply_id = await self.reply_to_post(
-                            random.choice(POST_REPLIES), post_id=int(post_id)
-                        )
+                        async with RateLimiter.get("mimo_comment", self):
+                            reply_id = await self.reply_to_post(
+                                random.choice(POST_REPLIES), post_id=int(post_id)
+                            )
                     except genshin.AccountMuted:
-                        await sleep("mimo_comment")
+                        pass
                     else:
-                        await sleep("mimo_comment")
-                        await self.delete_reply(reply_id=reply_id, post_id=int(post_id))
-                        await sleep("mimo_comment")
+                        async with RateLimiter.get("mimo_comment", self):
+                            await self.delete_reply(reply_id=reply_id, post_id=int(post_id))
                     finished = True
 
                 topic_id: str | None = args.get("topic_id")
                 if topic_id is not None:
-                    await self.join_topic(int(topic_id))
-                    await sleep("mimo_comment")
-                    await self.leave_topic(int(topic_id))
-                    await sleep("mimo_comment")
+                    async with RateLimiter.get("mimo_comment", self):
+                        await self.join_topic(int(topic_id))
+                    async with RateLimiter.get("mimo_comment", self):
+                        await self.leave_topic(int(topic_id))
                     finished = True
 
         if finished:
@@ -829,10 +901,10 @@ class GenshinClient(ProxyGenshinClient):
         for task in tasks:
             if task.status is genshin.models.MimoTaskStatus.FINISHED:
                 try:
-                    await self.claim_mimo_task_reward(
-                        task.id, game_id=game_id, version_id=version_id
-                    )
-                    await sleep("mimo_task")
+                    async with RateLimiter.get("mimo_task", self):
+                        await self.claim_mimo_task_reward(
+                            task.id, game_id=game_id, version_id=version_id
+                        )
                 except genshin.GenshinException as e:
                     if e.retcode == -500001:  # Invalid fields in calculation
                         continue
@@ -854,12 +926,12 @@ class GenshinClient(ProxyGenshinClient):
         bought: list[tuple[int, str]] = []
 
         original_lang = self.lang[:]
-        points = await self.get_mimo_point_count()
-        await sleep("mimo_shop")
+        async with RateLimiter.get("mimo_shop", self):
+            points = await self.get_mimo_point_count()
 
         self.lang = "en-us"
-        en_items = await self.get_mimo_shop_items(game_id=game_id, version_id=version_id)
-        await sleep("mimo_shop")
+        async with RateLimiter.get("mimo_shop", self):
+            en_items = await self.get_mimo_shop_items(game_id=game_id, version_id=version_id)
 
         # Sort items from most expensive to least expensive
         en_items = sorted(en_items, key=lambda item: item.cost, reverse=True)
@@ -872,10 +944,10 @@ class GenshinClient(ProxyGenshinClient):
                 and item.cost <= points
             ):
                 try:
-                    code = await self.buy_mimo_shop_item(
-                        item.id, game_id=game_id, version_id=version_id
-                    )
-                    await sleep("mimo_shop")
+                    async with RateLimiter.get("mimo_shop", self):
+                        code = await self.buy_mimo_shop_item(
+                            item.id, game_id=game_id, version_id=version_id
+                        )
                 except genshin.GenshinException as e:
                     if e.retcode == -502005:  # Insufficient points
                         continue
@@ -895,3 +967,43 @@ class GenshinClient(ProxyGenshinClient):
             result = [(item_mi18n[item_id], code) for item_id, code in bought]
 
         return result
+
+
+class GenshinClientFactory:
+    """Process-wide genshin.py resources shared by account clients.
+
+    Clients hold per-call state (language, proxy, account instance), so a new one is built
+    for every caller. They are cheap to create, the API cache and HTTP connection pools
+    they use are what's shared.
+    """
+
+    _cache: ClassVar[genshin.cache.BaseCache | None] = None
+    _redis: ClassVar[aioredis.Redis | None] = None
+
+    @classmethod
+    def get_cache(cls) -> genshin.cache.BaseCache:
+        """Get the genshin.py API cache, using Redis if available."""
+        if cls._cache is None:
+            static_ttl = 3600 * 24 * 31  # 31 days
+            if CONFIG.redis_url:
+                cls._redis = aioredis.from_url(CONFIG.redis_url)
+                cls._cache = genshin.RedisCache(cls._redis, static_ttl=static_ttl)
+            else:
+                cls._cache = genshin.SQLiteCache(static_ttl=static_ttl)
+        return cls._cache
+
+    @staticmethod
+    def get(account: HoyoAccount) -> GenshinClient:
+        """Create a client for an account, backed by the shared cache and connection pools."""
+        return GenshinClient(account)
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the API cache and HTTP connection pools."""
+        cls._cache = None
+        await HTTPPoolRegistry.close()
+
+        if cls._redis is not None:
+            await cls._redis.aclose()
+            cls._redis = None
+            logger.info("genshin.py Redis cache closed")
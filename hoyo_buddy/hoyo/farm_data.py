@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, ClassVar
+
+from loguru import logger
 
 from hoyo_buddy.enums import Locale
 
-from ..constants import AMBR_CITY_TO_CITY
+from ..constants import AMBR_CITY_TO_CITY, FARM_DATA_VERSION_CHECK_INTERVAL
 from ..models import FarmData
 from .clients.ambr import AmbrAPIClient
 
@@ -13,71 +18,140 @@ if TYPE_CHECKING:
 
     from ..enums import GenshinCity
 
+WEEKDAY_FIELDS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
 
-class FarmDataFetcher:
-    _weekday: int
 
-    @classmethod
-    def _get_domains(cls, domains: ambr.Domains) -> list[ambr.Domain]:
-        match cls._weekday:
-            case 0:
-                return domains.monday
-            case 1:
-                return domains.tuesday
-            case 2:
-                return domains.wednesday
-            case 3:
-                return domains.thursday
-            case 4:
-                return domains.friday
-            case 5:
-                return domains.saturday
-            case 6:
-                return domains.sunday
-            case _:
-                msg = "Invalid weekday"
-                raise ValueError(msg)
+class FarmDataStore:
+    """Farm data of one game data version and locale, indexed for O(1) lookups."""
+
+    def __init__(
+        self,
+        version: str,
+        *,
+        domains: ambr.Domains,
+        upgrades: ambr.UpgradeData,
+        characters: list[ambr.Character],
+        weapons: list[ambr.Weapon],
+    ) -> None:
+        self.version = version
+        self.checked_at = time.monotonic()
+
+        self.characters: dict[str, ambr.Character] = {str(c.id): c for c in characters}
+        self.weapons: dict[str, ambr.Weapon] = {str(w.id): w for w in weapons}
+        self.domains: dict[int, ambr.Domain] = {}
+        self.weekdays: dict[int, list[FarmData]] = {}
+        """Farm data of each weekday, Monday is 0."""
+        self.weekday_items: dict[int, dict[str, ambr.Character | ambr.Weapon]] = {}
+        """Characters and weapons farmable on each weekday by their ID."""
+
+        # Talent and ascension material ID -> IDs of the characters or weapons using it
+        character_materials: defaultdict[int, list[str]] = defaultdict(list)
+        for upgrade in upgrades.character:
+            for item in upgrade.items:
+                character_materials[item.id].append(str(upgrade.id))
+        weapon_materials: defaultdict[int, list[str]] = defaultdict(list)
+        for upgrade in upgrades.weapon:
+            for item in upgrade.items:
+                weapon_materials[item.id].append(str(upgrade.id))
+
+        for weekday, field in enumerate(WEEKDAY_FIELDS):
+            farm_datas: list[FarmData] = []
+            items: dict[str, ambr.Character | ambr.Weapon] = {}
+
+            for domain in getattr(domains, field):
+                self.domains[domain.id] = domain
+                farm_data = FarmData(domain)
+
+                if "Mastery" in domain.name:
+                    # Character domains
+                    materials, index, result = (
+                        character_materials,
+                        self.characters,
+                        farm_data.characters,
+                    )
+                else:
+                    # Weapon domains
+                    materials, index, result = weapon_materials, self.weapons, farm_data.weapons
+
+                item_ids = dict.fromkeys(
+                    item_id for reward in domain.rewards for item_id in materials.get(reward.id, ())
+                )
+                for item_id in item_ids:
+                    item = index.get(item_id)
+                    if item is None:
+                        continue
+                    result.append(item)  # pyright: ignore[reportArgumentType]
+                    items.setdefault(item_id, item)
+
+                farm_datas.append(farm_data)
+
+            self.weekdays[weekday] = farm_datas
+            self.weekday_items[weekday] = items
+
+    def get_item(self, item_id: str) -> ambr.Character | ambr.Weapon | None:
+        return self.characters.get(item_id) or self.weapons.get(item_id)
 
-    @classmethod
-    async def fetch(
-        cls, weekday: int, *, locale: Locale | None = None, city: GenshinCity | None = None
-    ) -> list[FarmData]:
-        # Initialize class variables
-        cls._weekday = weekday
 
+class FarmDataFetcher:
+    _stores: ClassVar[dict[Locale, FarmDataStore]] = {}
+    _locks: ClassVar[defaultdict[Locale, asyncio.Lock]] = defaultdict(asyncio.Lock)
+
+    @classmethod
+    async def _build_store(cls, locale: Locale, version: str) -> FarmDataStore:
         async with AmbrAPIClient(Locale.american_english) as client:
             domains = await client.fetch_domains()
-        async with AmbrAPIClient(locale or Locale.american_english) as client:
+        async with AmbrAPIClient(locale) as client:
             upgrades = await client.fetch_upgrade_data()
             characters = await client.fetch_characters()
             weapons = await client.fetch_weapons()
 
-        farm_datas: list[FarmData] = []
-
-        domains_ = cls._get_domains(domains)
-        for domain in domains_:
-            if city is not None and AMBR_CITY_TO_CITY[domain.city] != city:
-                continue
-            farm_data = FarmData(domain)
-            reward_ids = [r.id for r in domain.rewards]
-
-            if "Mastery" in domain.name:
-                # Character domains
-                for upgrade in upgrades.character:
-                    if any(item.id in reward_ids for item in upgrade.items):
-                        character = next((c for c in characters if c.id == upgrade.id), None)
-                        if character is None:
-                            continue
-                        farm_data.characters.append(character)
-            else:
-                # Weapon domains
-                for upgrade in upgrades.weapon:
-                    if any(item.id in reward_ids for item in upgrade.items):
-                        weapon = next((w for w in weapons if str(w.id) == upgrade.id), None)
-                        if weapon is None:
-                            continue
-                        farm_data.weapons.append(weapon)
-
-            farm_datas.append(farm_data)
-
-        return farm_datas
+        return FarmDataStore(
+            version, domains=domains, upgrades=upgrades, characters=characters, weapons=weapons
+        )
+
+    @classmethod
+    async def get_store(cls, locale: Locale = Locale.american_english) -> FarmDataStore:
+        """Get the farm data store of a locale, rebuilding it when the game data version changes.
+
+        The version is checked at most once per FARM_DATA_VERSION_CHECK_INTERVAL seconds,
+        other calls are served from memory.
+        """
+        store = cls._stores.get(locale)
+        if (
+            store is not None
+            and time.monotonic() - store.checked_at < FARM_DATA_VERSION_CHECK_INTERVAL
+        ):
+            return store
+
+        async with cls._locks[locale]:
+            store = cls._stores.get(locale)
+            if (
+                store is not None
+                and time.monotonic() - store.checked_at < FARM_DATA_VERSION_CHECK_INTERVAL
+            ):
+                return store
+
+            async with AmbrAPIClient(locale) as client:
+                version = await client.fetch_latest_version()
+
+            if store is not None and store.version == version:
+                store.checked_at = time.monotonic()
+                return store
+
+            logger.info(f"Building farm data store for {locale}, version={version}")
+            store = cls._stores[locale] = await cls._build_store(locale, version)
+            return store
+
+    @classmethod
+    async def fetch(
+        cls, weekday: int, *, locale: Locale | None = None, city: GenshinCity | None = None
+    ) -> list[FarmData]:
+        if not 0 <= weekday <= 6:
+            msg = "Invalid weekday"
+            raise ValueError(msg)
+
+        store = await cls.get_store(locale or Locale.american_english)
+        farm_datas = store.weekdays[weekday]
+        if city is None:
+            return list(farm_datas)
+        return [fd for fd in farm_datas if AMBR_CITY_TO_CITY[fd.domain.city] == city]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, Final
+
+import aiohttp
+import aiohttp_socks
+import yarl
+from loguru import logger
+from prometheus_client import Counter, Gauge, Histogram
+
+from hoyo_buddy.constants import (
+    GPY_DNS_CACHE_TTL,
+    GPY_KEEPALIVE_TIMEOUT,
+    GPY_POOL_LIMIT,
+    GPY_POOL_LIMIT_PER_HOST,
+)
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    import genshin
+
+__all__ = ("HTTPPool", "HTTPPoolMetrics", "HTTPPoolRegistry")
+
+
+class HTTPPoolMetrics:
+    """genshin.py connection pool metrics, exported by the Prometheus cog when it is enabled."""
+
+    PREFIX: Final[str] = "hoyo_buddy_http_pool_"
+    """Metric's prefix"""
+
+    CONNECTIONS: Final[Counter] = Counter(
+        PREFIX + "connections", "Connections opened by a connection pool", ["pool"]
+    )
+    """New connections, each one costs a TCP and TLS handshake"""
+
+    HANDSHAKES_AVOIDED: Final[Counter] = Counter(
+        PREFIX + "handshakes_avoided", "Requests sent over a kept-alive connection", ["pool"]
+    )
+    """Requests that reused a pooled connection instead of opening a new one"""
+
+    IN_FLIGHT: Final[Gauge] = Gauge(
+        PREFIX + "requests_in_flight", "Requests currently sent through a pool", ["pool"]
+    )
+    """Requests waiting for a response"""
+
+    CONNECT_LATENCY: Final[Histogram] = Histogram(
+        PREFIX + "connect_latency_seconds",
+        "Time taken to open a connection",
+        ["pool"],
+        buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    )
+    """Time taken to open a new connection, including DNS, TCP and TLS (unit: seconds)"""
+
+
+class HTTPPool:
+    """A keep-alive connection pool for the requests sent through one proxy."""
+
+    def __init__(self, *, label: str, socks_proxy: str | None) -> None:
+        self.label = label
+
+        kwargs: dict[str, Any] = {
+            "limit": GPY_POOL_LIMIT,
+            "limit_per_host": GPY_POOL_LIMIT_PER_HOST,
+            "ttl_dns_cache": GPY_DNS_CACHE_TTL,
+            "keepalive_timeout": GPY_KEEPALIVE_TIMEOUT,
+        }
+        self.connector: aiohttp.TCPConnector = (
+            aiohttp_socks.ProxyConnector.from_url(socks_proxy, **kwargs)
+            if socks_proxy is not None
+            else aiohttp.TCPConnector(**kwargs)
+        )
+        self.trace_config = self._create_trace_config()
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        label = self.label
+        in_flight = HTTPPoolMetrics.IN_FLIGHT.labels(pool=label)
+
+        async def on_request_start(_: Any, __: SimpleNamespace, ___: Any) -> None:  # ruff:ignore[unused-async]
+            in_flight.inc()
+
+        async def on_request_end(_: Any, __: SimpleNamespace, ___: Any) -> None:  # ruff:ignore[unused-async]
+            in_flight.dec()
+
+        async def on_connection_create_start(_: Any, ctx: SimpleNamespace, __: Any) -> None:  # ruff:ignore[unused-async]
+            ctx.connect_start = time.monotonic()
+
+        async def on_connection_create_end(_: Any, ctx: SimpleNamespace, __: Any) -> None:  # ruff:ignore[unused-async]
+            HTTPPoolMetrics.CONNECTIONS.labels(pool=label).inc()
+            HTTPPoolMetrics.CONNECT_LATENCY.labels(pool=label).observe(
+                time.monotonic() - ctx.connect_start
+            )
+
+        async def on_connection_reuseconn(_: Any, __: SimpleNamespace, ___: Any) -> None:  # ruff:ignore[unused-async]
+            HTTPPoolMetrics.HANDSHAKES_AVOIDED.labels(pool=label).inc()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.freeze()
+        return trace_config
+
+
+class HTTPPoolRegistry:
+    """Process-wide connection pools for genshin.py, keyed by proxy.
+
+    genshin.py opens a new session, and with it a new connector, for every request.
+    Sessions created here borrow a shared connector instead, so consecutive requests
+    through the same proxy reuse kept-alive connections.
+    """
+
+    _pools: ClassVar[dict[str, HTTPPool]] = {}
+
+    @staticmethod
+    def get_label(proxy: str | None) -> str:
+        """Pool label for metrics and logs, without the proxy's credentials."""
+        if proxy is None:
+            return "direct"
+        url = yarl.URL(proxy)
+        return f"{url.scheme}://{url.host}:{url.port}"
+
+    @classmethod
+    def get(cls, proxy: str | None, *, socks: bool = False) -> HTTPPool:
+        key = proxy or "direct"
+        pool = cls._pools.get(key)
+        if pool is None or pool.connector.closed:
+            label = cls.get_label(proxy)
+            pool = cls._pools[key] = HTTPPool(label=label, socks_proxy=proxy if socks else None)
+            logger.debug(f"Created HTTP connection pool {label}")
+        return pool
+
+    @classmethod
+    def create_session(
+        cls, manager: genshin.client.manager.BaseCookieManager, **kwargs: Any
+    ) -> aiohttp.ClientSession:
+        """Drop-in replacement for genshin.py's ``BaseCookieManager.create_session``."""
+        socks_proxy: str | None = manager._socks_proxy
+        if socks_proxy is not None:
+            pool = cls.get(socks_proxy, socks=True)
+        else:
+            pool = cls.get(str(manager.proxy) if manager.proxy is not None else None)
+
+        return aiohttp.ClientSession(
+            cookie_jar=aiohttp.DummyCookieJar(),
+            connector=pool.connector,
+            connector_owner=False,
+            proxy=manager.proxy,
+            trace_configs=[pool.trace_config],
+            **kwargs,
+        )
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the connectors of all pools."""
+        for pool in cls._pools.values():
+            await pool.connector.close()
+        cls._pools.clear()
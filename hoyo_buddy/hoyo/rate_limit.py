@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, ClassVar, Final, Self
+
+import genshin
+from prometheus_client import Counter, Gauge
+
+from hoyo_buddy.constants import RATE_LIMITS
+from hoyo_buddy.hoyo.http_pool import HTTPPoolRegistry
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from hoyo_buddy.types import RateLimitFamily
+
+__all__ = ("RateLimitMetrics", "RateLimiter", "TokenBucket")
+
+RATE_LIMIT_ERRORS: Final[tuple[type[Exception], ...]] = (genshin.errors.VisitsTooFrequently,)
+"""Errors that mean HoYoLAB wants us to slow down.
+
+Per-account limits such as the redemption cooldown are not included, they say nothing about
+the load on a proxy and are handled by the caller.
+"""
+
+BACKOFF_FACTOR: Final[float] = 0.5
+"""Rate multiplier applied when a request is rate limited."""
+PROBE_STEP: Final[float] = 0.01
+"""Fraction of the initial rate added back after every successful request."""
+MIN_RATE_FACTOR: Final[float] = 0.05
+MAX_RATE_FACTOR: Final[float] = 2.0
+
+
+class RateLimitMetrics:
+    """HoYoLAB rate limiter metrics, exported by the Prometheus cog when it is enabled."""
+
+    PREFIX: Final[str] = "hoyo_buddy_rate_limit_"
+    """Metric's prefix"""
+
+    REQUESTS: Final[Counter] = Counter(
+        PREFIX + "requests",
+        "Requests sent through a rate limit bucket",
+        ["family", "key", "outcome"],
+    )
+    """Requests sent through a bucket, labelled by outcome (ok, rate_limited, error)"""
+
+    RATE: Final[Gauge] = Gauge(
+        PREFIX + "rate", "Allowed requests per second of a rate limit bucket", ["family", "key"]
+    )
+    """Current allowed rate of a bucket (unit: requests per second)"""
+
+    WAIT: Final[Counter] = Counter(
+        PREFIX + "wait_seconds", "Time spent waiting for a rate limit token", ["family", "key"]
+    )
+    """Total time spent waiting for tokens (unit: seconds)"""
+
+
+class TokenBucket:
+    """Token bucket with an additive-increase, multiplicative-decrease rate.
+
+    Use it as an async context manager around the requests it guards, a token is taken on
+    enter and the outcome is recorded on exit.
+    """
+
+    def __init__(self, family: RateLimitFamily, key: str, *, rate: float) -> None:
+        self.family = family
+        self.key = key
+
+        self.rate = rate
+        self.min_rate = rate * MIN_RATE_FACTOR
+        self.max_rate = rate * MAX_RATE_FACTOR
+        self._step = rate * PROBE_STEP
+
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        self._rate_metric = RateLimitMetrics.RATE.labels(family=family, key=key)
+        self._rate_metric.set(rate)
+
+    @property
+    def capacity(self) -> float:
+        """Allow bursts of up to one second worth of requests."""
+        return max(1.0, self.rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                RateLimitMetrics.WAIT.labels(family=self.family, key=self.key).inc(wait)
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self._step)
+        self._rate_metric.set(self.rate)
+        self._record("ok")
+
+    def on_rate_limited(self) -> None:
+        self.rate = max(self.min_rate, self.rate * BACKOFF_FACTOR)
+        # Drop the saved up burst so the lower rate applies right away
+        self._tokens = min(self._tokens, 0.0)
+        self._rate_metric.set(self.rate)
+        self._record("rate_limited")
+
+    def _record(self, outcome: str) -> None:
+        RateLimitMetrics.REQUESTS.labels(family=self.family, key=self.key, outcome=outcome).inc()
+
+    async def __aenter__(self) -> Self:
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_value is None:
+            self.on_success()
+        elif isinstance(exc_value, RATE_LIMIT_ERRORS):
+            self.on_rate_limited()
+        else:
+            self._record("error")
+
+
+class RateLimiter:
+    """Process-wide token buckets keyed by endpoint family and proxy/region."""
+
+    _buckets: ClassVar[dict[tuple[RateLimitFamily, str], TokenBucket]] = {}
+
+    @staticmethod
+    def get_key(client: genshin.Client) -> str:
+        """Requests sent through the same proxy from the same region share a bucket."""
+        proxy = str(client.proxy) if client.proxy is not None else None
+        return f"{client.region.value}:{HTTPPoolRegistry.get_label(proxy)}"
+
+    @classmethod
+    def get(cls, family: RateLimitFamily, client: genshin.Client) -> TokenBucket:
+        key = cls.get_key(client)
+        bucket = cls._buckets.get((family, key))
+        if bucket is None:
+            bucket = cls._buckets[family, key] = TokenBucket(family, key, rate=RATE_LIMITS[family])
+        return bucket
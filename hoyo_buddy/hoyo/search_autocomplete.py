@@ -1,28 +1,137 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import time
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import aiohttp
+import orjson
 from discord.app_commands import Choice
+from loguru import logger
 
-from hoyo_buddy.constants import LOCALE_TO_AMBR_LANG, LOCALE_TO_YATTA_LANG
-from hoyo_buddy.enums import Game
+from hoyo_buddy.constants import (
+    LOCALE_TO_AMBR_LANG,
+    LOCALE_TO_YATTA_LANG,
+    SEARCH_AUTOFILL_PROBE_CONCURRENCY,
+)
+from hoyo_buddy.db.models import JSONFile
+from hoyo_buddy.enums import Game, Locale
 from hoyo_buddy.utils import sleep
 
 from .clients import ambr, yatta
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from types import CoroutineType
 
-    import aiohttp
+    from hoyo_buddy.types import AutocompleteChoices, ItemCategory
 
-    from hoyo_buddy.types import AutocompleteChoices, Tasks
+    type Fetcher = Callable[[], CoroutineType[Any, Any, list[Any]] | None]
+    type MutableChoices = defaultdict[
+        Game, defaultdict[ItemCategory, defaultdict[Locale, list[Choice[str]]]]
+    ]
+
+MANIFEST_FILENAME = "search_autofill_manifest.json"
+"""Content hash and HTTP validators of each partition, keyed by partition key."""
+PARTITION_FILENAME_PREFIX = "search_autofill/"
+LEGACY_FILENAME = "search_autofill.json"
+"""The whole autofill in one file, written by older versions."""
+
+AMBR_ENDPOINTS: dict[ambr.ItemCategory, str] = {
+    ambr.ItemCategory.CHARACTERS: "avatar",
+    ambr.ItemCategory.WEAPONS: "weapon",
+    ambr.ItemCategory.ARTIFACT_SETS: "reliquary",
+    ambr.ItemCategory.FOOD: "food",
+    ambr.ItemCategory.MATERIALS: "material",
+    ambr.ItemCategory.FURNISHINGS: "furniture",
+    ambr.ItemCategory.FURNISHING_SETS: "furnitureSuite",
+    ambr.ItemCategory.NAMECARDS: "namecard",
+    ambr.ItemCategory.LIVING_BEINGS: "monster",
+    ambr.ItemCategory.BOOKS: "book",
+    ambr.ItemCategory.TCG: "gcg",
+}
+YATTA_ENDPOINTS: dict[yatta.ItemCategory, str] = {
+    yatta.ItemCategory.CHARACTERS: "avatar",
+    yatta.ItemCategory.LIGHT_CONES: "equipment",
+    yatta.ItemCategory.ITEMS: "item",
+    yatta.ItemCategory.RELICS: "relic",
+    yatta.ItemCategory.BOOKS: "book",
+}
+
+
+def get_partition_key(game: Game, category: ItemCategory, locale: Locale) -> str:
+    return f"{game.value}/{category.value}/{locale.value}"
+
+
+def get_choices_hash(choices: Sequence[Choice[str]]) -> str:
+    data = orjson.dumps([(choice.name, choice.value) for choice in choices])
+    return hashlib.sha256(data).hexdigest()
+
+
+def new_choices() -> MutableChoices:
+    return defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+
+
+def get_category(game: Game, category: str) -> ItemCategory | None:
+    if game is Game.GENSHIN:
+        return ambr.ItemCategory(category)
+    if game is Game.STARRAIL:
+        return yatta.ItemCategory(category)
+    return None
+
+
+class Partition:
+    """Choices of one game, category and locale, and how to refresh them."""
+
+    def __init__(
+        self, game: Game, category: ItemCategory, locale: Locale, *, url: str, fetch: Fetcher
+    ) -> None:
+        self.game = game
+        self.category = category
+        self.locale = locale
+        self.key = get_partition_key(game, category, locale)
+        self.url = url
+        self.fetch = fetch
+
+
+class SourceReport:
+    """Timing and outcome counts of refreshing the partitions of one source."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.probe_time = 0.0
+        self.fetch_time = 0.0
+        self.not_modified = 0
+        """Partitions skipped because the server answered 304 Not Modified."""
+        self.unchanged = 0
+        """Partitions fetched again but with the same content hash."""
+        self.changed = 0
+        self.failed = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source}: probe={self.probe_time:.2f}s, fetch={self.fetch_time:.2f}s, "
+            f"not_modified={self.not_modified}, unchanged={self.unchanged}, "
+            f"changed={self.changed}, failed={self.failed}"
+        )
 
 
 class AutocompleteSetup:
-    _result: ClassVar[AutocompleteChoices]
-    _tasks: ClassVar[Tasks]
+    """Keeps the search autofill up to date, one partition per game, category and locale.
+
+    Each partition is first probed with a conditional HEAD request using the ETag and
+    Last-Modified of its previous fetch, and only fetched again when the server reports
+    a change. Partitions are stored in their own JSONFile and only written back when
+    their content hash changes.
+    """
+
+    _result: ClassVar[MutableChoices]
+    _manifest: ClassVar[dict[str, dict[str, str]]] = {}
+    _changed: ClassVar[set[str]] = set()
+    _manifest_changed: ClassVar[bool] = False
 
     @classmethod
     def _get_ambr_task(
@@ -30,27 +139,27 @@ class AutocompleteSetup:
     ) -> CoroutineType[Any, Any, list[Any]] | None:
         match category:
             case ambr.ItemCategory.CHARACTERS:
-                return api.fetch_characters(traveler_gender_symbol=True)
+                return api.fetch_characters(use_cache=False, traveler_gender_symbol=True)
             case ambr.ItemCategory.WEAPONS:
-                return api.fetch_weapons()
+                return api.fetch_weapons(use_cache=False)
             case ambr.ItemCategory.ARTIFACT_SETS:
-                return api.fetch_artifact_sets()
+                return api.fetch_artifact_sets(use_cache=False)
             case ambr.ItemCategory.FOOD:
-                return api.fetch_foods()
+                return api.fetch_foods(use_cache=False)
             case ambr.ItemCategory.MATERIALS:
-                return api.fetch_materials()
+                return api.fetch_materials(use_cache=False)
             case ambr.ItemCategory.FURNISHINGS:
-                return api.fetch_furnitures()
+                return api.fetch_furnitures(use_cache=False)
             case ambr.ItemCategory.FURNISHING_SETS:
-                return api.fetch_furniture_sets()
+                return api.fetch_furniture_sets(use_cache=False)
             case ambr.ItemCategory.NAMECARDS:
-                return api.fetch_namecards()
+                return api.fetch_namecards(use_cache=False)
             case ambr.ItemCategory.LIVING_BEINGS:
-                return api.fetch_monsters()
+                return api.fetch_monsters(use_cache=False)
             case ambr.ItemCategory.BOOKS:
-                return api.fetch_books()
+                return api.fetch_books(use_cache=False)
             case ambr.ItemCategory.TCG:
-                return api.fetch_tcg_cards()
+                return api.fetch_tcg_cards(use_cache=False)
 
     @classmethod
     def _get_yatta_task(
@@ -58,75 +167,276 @@ class AutocompleteSetup:
     ) -> CoroutineType[Any, Any, list[Any]]:
         match category:
             case yatta.ItemCategory.CHARACTERS:
-                return api.fetch_characters(trailblazer_gender_symbol=True)
+                return api.fetch_characters(use_cache=False, trailblazer_gender_symbol=True)
             case yatta.ItemCategory.LIGHT_CONES:
-                return api.fetch_light_cones()
+                return api.fetch_light_cones(use_cache=False)
             case yatta.ItemCategory.ITEMS:
-                return api.fetch_items()
+                return api.fetch_items(use_cache=False)
             case yatta.ItemCategory.RELICS:
-                return api.fetch_relic_sets()
+                return api.fetch_relic_sets(use_cache=False)
             case yatta.ItemCategory.BOOKS:
-                return api.fetch_books()
+                return api.fetch_books(use_cache=False)
 
     @classmethod
-    async def _setup_ambr(cls, session: aiohttp.ClientSession) -> None:
-        game = Game.GENSHIN
-
+    def _get_ambr_partitions(cls, session: aiohttp.ClientSession) -> list[Partition]:
+        partitions: list[Partition] = []
         for locale in LOCALE_TO_AMBR_LANG:
             api = ambr.AmbrAPIClient(locale, session=session)
-            for category in ambr.ItemCategory:
-                coro = cls._get_ambr_task(api, category)
-                if coro is not None:
-                    task = asyncio.create_task(coro)
-                    cls._tasks[game][category][locale] = task
-                    await sleep("search_autofill")
+            partitions.extend(
+                Partition(
+                    Game.GENSHIN,
+                    category,
+                    locale,
+                    url=f"{api.BASE_URL}/{api.lang.value}/{AMBR_ENDPOINTS[category]}",
+                    fetch=functools.partial(cls._get_ambr_task, api, category),
+                )
+                for category in ambr.ItemCategory
+            )
+        return partitions
 
     @classmethod
-    async def _setup_yatta(cls, session: aiohttp.ClientSession) -> None:
-        game = Game.STARRAIL
-
+    def _get_yatta_partitions(cls, session: aiohttp.ClientSession) -> list[Partition]:
+        partitions: list[Partition] = []
         for locale in LOCALE_TO_YATTA_LANG:
             api = yatta.YattaAPIClient(locale, session=session)
-            for category in yatta.ItemCategory:
-                coro = cls._get_yatta_task(api, category)
-                task = asyncio.create_task(coro)
-                cls._tasks[game][category][locale] = task
-                await sleep("search_autofill")
+            partitions.extend(
+                Partition(
+                    Game.STARRAIL,
+                    category,
+                    locale,
+                    url=f"{api.BASE_URL}/{api.lang.value}/{YATTA_ENDPOINTS[category]}",
+                    fetch=functools.partial(cls._get_yatta_task, api, category),
+                )
+                for category in yatta.ItemCategory
+            )
+        return partitions
+
+    @staticmethod
+    def _get_choices(items: list[Any]) -> list[Choice[str]]:
+        choices: list[Choice[str]] = []
+        for item in items:
+            if not hasattr(item, "id") or not hasattr(item, "name"):
+                continue
+
+            # rarity is None means it's a beta item
+            if hasattr(item, "rarity") and item.rarity is None:
+                continue
+
+            choices.append(Choice(name=item.name, value=str(item.id)))
+        return choices
+
+    @staticmethod
+    async def _probe(
+        session: aiohttp.ClientSession, url: str, state: dict[str, str]
+    ) -> dict[str, str] | None:
+        """Send a conditional HEAD request for a partition.
+
+        Returns:
+            None if the resource was not modified, otherwise its new validators
+            (empty if the server doesn't send any, or the probe failed).
+        """
+        headers: dict[str, str] = {}
+        if etag := state.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := state.get("last_modified"):
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            async with session.head(url, headers=headers) as resp:
+                if resp.status == 304:
+                    return None
+                if resp.status >= 400:
+                    return {}
+
+                validators: dict[str, str] = {}
+                if etag := resp.headers.get("ETag"):
+                    validators["etag"] = etag
+                if last_modified := resp.headers.get("Last-Modified"):
+                    validators["last_modified"] = last_modified
+                return validators
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.debug(f"Failed to probe {url}: {e}")
+            return {}
+
+    @classmethod
+    async def _refresh_source(
+        cls,
+        source: str,
+        partitions: list[Partition],
+        *,
+        probe_session: aiohttp.ClientSession,
+        previous: AutocompleteChoices,
+    ) -> SourceReport:
+        report = SourceReport(source)
+
+        old_choices: dict[Partition, list[Choice[str]]] = {}
+        for partition in partitions:
+            choices = previous.get(partition.game, {}).get(partition.category, {})
+            if choices := choices.get(partition.locale):
+                old_choices[partition] = list(choices)
+
+        # Probe the partitions with bounded concurrency
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(SEARCH_AUTOFILL_PROBE_CONCURRENCY)
+
+        async def probe(partition: Partition) -> dict[str, str] | None:
+            # Without previous choices there's nothing to fall back on, fetch unconditionally
+            state = cls._manifest.get(partition.key, {}) if partition in old_choices else {}
+            async with semaphore:
+                return await cls._probe(probe_session, partition.url, state)
+
+        probes = await asyncio.gather(*(probe(partition) for partition in partitions))
+        report.probe_time = time.monotonic() - start
+
+        # Fetch the modified partitions, spaced out to go easy on the API. The HTTP cache is
+        # bypassed, a stale cached response would be saved with the new validators and kept
+        # until the next upstream change.
+        start = time.monotonic()
+        tasks: dict[Partition, asyncio.Task[list[Any]]] = {}
+        validators: dict[Partition, dict[str, str]] = {}
+        for partition, result in zip(partitions, probes, strict=True):
+            if result is None and partition in old_choices:
+                report.not_modified += 1
+                cls._result[partition.game][partition.category][partition.locale] = old_choices[
+                    partition
+                ]
+                continue
+
+            coro = partition.fetch()
+            if coro is None:
+                continue
+
+            tasks[partition] = asyncio.create_task(coro)
+            validators[partition] = result or {}
+            await sleep("search_autofill")
+
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        report.fetch_time = time.monotonic() - start
+
+        for partition, task in tasks.items():
+            if (e := task.exception()) is not None:
+                logger.warning(f"Failed to fetch search autofill {partition.key}: {e!r}")
+                report.failed += 1
+                if partition in old_choices:
+                    cls._result[partition.game][partition.category][partition.locale] = old_choices[
+                        partition
+                    ]
+                continue
+
+            choices = cls._get_choices(task.result())
+            cls._result[partition.game][partition.category][partition.locale] = choices
+
+            digest = get_choices_hash(choices)
+            state = cls._manifest.get(partition.key, {})
+            if partition in old_choices and state.get("hash") == digest:
+                report.unchanged += 1
+            else:
+                report.changed += 1
+                cls._changed.add(partition.key)
+
+            new_state = {"hash": digest, **validators[partition]}
+            if new_state != state:
+                cls._manifest[partition.key] = new_state
+                cls._manifest_changed = True
+
+        logger.info(f"Search autofill refresh report, {report}")
+        return report
 
     @classmethod
-    async def start(cls, session: aiohttp.ClientSession) -> AutocompleteChoices:
-        # Initialize variables
-        cls._result = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-        cls._tasks = defaultdict(lambda: defaultdict(dict))
-
-        creat_task_tasks = [
-            asyncio.create_task(cls._setup_ambr(session)),
-            asyncio.create_task(cls._setup_yatta(session)),
-        ]
-        await asyncio.gather(*creat_task_tasks, return_exceptions=True)
-
-        tasks = [
-            task
-            for categories in cls._tasks.values()
-            for locales in categories.values()
-            for task in locales.values()
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-        for game, categories in cls._tasks.items():
-            for category, locales in categories.items():
-                for locale, task in locales.items():
-                    items = task.result()
-                    for item in items:
-                        if not hasattr(item, "id") or not hasattr(item, "name"):
-                            continue
-
-                        # rarity is None means it's a beta item
-                        if hasattr(item, "rarity") and item.rarity is None:
-                            continue
-
-                        cls._result[game][category][locale].append(
-                            Choice(name=item.name, value=str(item.id))
-                        )
+    async def start(
+        cls, session: aiohttp.ClientSession, previous: AutocompleteChoices
+    ) -> AutocompleteChoices:
+        """Refresh the autofill, reusing partitions of ``previous`` that weren't modified.
+
+        Call save() afterwards to write back the changed partitions.
+        """
+        cls._result = new_choices()
+        cls._changed = set()
+
+        if not cls._manifest:
+            cls._manifest = await JSONFile.read(MANIFEST_FILENAME)
+
+        async with aiohttp.ClientSession(
+            headers=session.headers, timeout=aiohttp.ClientTimeout(total=30)
+        ) as probe_session:
+            await asyncio.gather(
+                cls._refresh_source(
+                    "ambr",
+                    cls._get_ambr_partitions(session),
+                    probe_session=probe_session,
+                    previous=previous,
+                ),
+                cls._refresh_source(
+                    "yatta",
+                    cls._get_yatta_partitions(session),
+                    probe_session=probe_session,
+                    previous=previous,
+                ),
+            )
 
         return cls._result
+
+    @classmethod
+    async def save(cls) -> None:
+        """Write back the partitions changed by the last refresh, and the manifest."""
+        for key in cls._changed:
+            game_str, category_str, locale_str = key.split("/")
+            game = Game(game_str)
+            category = get_category(game, category_str)
+            if category is None:
+                continue
+
+            choices = cls._result[game][category][Locale(locale_str)]
+            await JSONFile.write(
+                f"{PARTITION_FILENAME_PREFIX}{key}.json",
+                [{"name": choice.name, "value": choice.value} for choice in choices],
+            )
+
+        if cls._manifest_changed:
+            await JSONFile.write(MANIFEST_FILENAME, cls._manifest)
+            cls._manifest_changed = False
+
+        if cls._changed:
+            logger.info(f"Saved {len(cls._changed)} changed search autofill partitions")
+            # Partitions supersede the single file of older versions
+            await JSONFile.filter(name=LEGACY_FILENAME).delete()
+        cls._changed = set()
+
+    @classmethod
+    async def load(cls) -> AutocompleteChoices:
+        """Load the autofill saved by previous refreshes."""
+        result = new_choices()
+        cls._manifest = await JSONFile.read(MANIFEST_FILENAME)
+
+        files = await JSONFile.filter(name__startswith=PARTITION_FILENAME_PREFIX)
+        if not files:
+            return cls._load_legacy(await JSONFile.read(LEGACY_FILENAME))
+
+        for file in files:
+            key = file.name.removeprefix(PARTITION_FILENAME_PREFIX).removesuffix(".json")
+            game_str, category_str, locale_str = key.split("/")
+            game = Game(game_str)
+            category = get_category(game, category_str)
+            if category is None:
+                continue
+
+            result[game][category][Locale(locale_str)] = [
+                Choice(name=choice["name"], value=choice["value"]) for choice in file.data
+            ]
+        return result
+
+    @staticmethod
+    def _load_legacy(data: dict[str, Any]) -> AutocompleteChoices:
+        result = new_choices()
+        for game_str, categories in data.get("search_autofill", {}).items():
+            game = Game(game_str)
+            for category_str, locales in categories.items():
+                category = get_category(game, category_str)
+                if category is None:
+                    continue
+
+                for locale_str, choices in locales.items():
+                    result[game][category][Locale(locale_str)] = [
+                        Choice(name=choice["name"], value=choice["value"]) for choice in choices
+                    ]
+        return result
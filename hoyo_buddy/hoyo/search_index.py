@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from discord import app_commands
+from prometheus_client import Histogram
+
+from hoyo_buddy.enums import Locale
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from hoyo_buddy.enums import Game
+    from hoyo_buddy.types import AutocompleteChoices, ItemCategory
+
+__all__ = ("ChoiceIndex", "SearchIndex", "SearchMetrics", "normalize")
+
+ChoiceT = TypeVar("ChoiceT", bound=app_commands.Choice)
+
+MAX_CHOICES = 25
+GRAM_SIZE = 3
+
+# Match qualities, lower is better
+EXACT = 0
+PREFIX = 1
+WORD_PREFIX = 2
+SUBSTRING = 3
+
+
+class SearchMetrics:
+    """Autocomplete metrics, exported by the Prometheus cog when it is enabled."""
+
+    PREFIX: Final[str] = "hoyo_buddy_search_"
+    """Metric's prefix"""
+
+    AUTOCOMPLETE_LATENCY: Final[Histogram] = Histogram(
+        PREFIX + "autocomplete_latency_seconds",
+        "Time taken to look up autocomplete choices for a keystroke",
+        ["index"],
+        buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+    )
+    """Index lookup time of an autocomplete keystroke (unit: seconds)"""
+
+
+def _is_cjk(char: str) -> bool:
+    return unicodedata.east_asian_width(char) in {"W", "F"}
+
+
+def normalize(text: str) -> str:
+    """Normalize text for matching: case-folded, accents stripped and full-width folded."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return unicodedata.normalize("NFKC", stripped).strip()
+
+
+def _get_word_starts(name: str) -> set[int]:
+    """Positions where a word starts; every CJK character starts a word."""
+    starts: set[int] = set()
+    prev_alnum = False
+    for pos, char in enumerate(name):
+        alnum = char.isalnum()
+        if alnum and (not prev_alnum or _is_cjk(char)):
+            starts.add(pos)
+        prev_alnum = alnum
+    return starts
+
+
+class ChoiceIndex(Generic[ChoiceT]):
+    """N-gram index over the names of autocomplete choices.
+
+    Every substring of up to GRAM_SIZE characters of a normalized name is mapped to the
+    choices containing it. Short queries are looked up directly and longer ones by
+    intersecting their n-grams, then confirmed with a substring check.
+    """
+
+    def __init__(self, choices: Sequence[ChoiceT]) -> None:
+        self.choices = tuple(choices)
+        self._values = {str(choice.value): choice for choice in self.choices}
+        self._names = tuple(normalize(choice.name) for choice in self.choices)
+        self._word_starts = tuple(_get_word_starts(name) for name in self._names)
+
+        postings: defaultdict[str, set[int]] = defaultdict(set)
+        for index, name in enumerate(self._names):
+            for size in range(1, GRAM_SIZE + 1):
+                for pos in range(len(name) - size + 1):
+                    postings[name[pos : pos + size]].add(index)
+        self._postings: dict[str, frozenset[int]] = {
+            gram: frozenset(ids) for gram, ids in postings.items()
+        }
+
+    def get(self, value: str) -> ChoiceT | None:
+        """Get a choice by its value."""
+        return self._values.get(value)
+
+    def _get_candidates(self, query: str) -> frozenset[int] | set[int]:
+        if len(query) <= GRAM_SIZE:
+            return self._postings.get(query, frozenset())
+
+        grams = sorted(
+            (
+                self._postings.get(query[pos : pos + GRAM_SIZE], frozenset())
+                for pos in range(len(query) - GRAM_SIZE + 1)
+            ),
+            key=len,
+        )
+        candidates = set(grams[0])
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= gram
+        return candidates
+
+    def _get_quality(self, index: int, query: str) -> int | None:
+        name = self._names[index]
+        if name == query:
+            return EXACT
+        if name.startswith(query):
+            return PREFIX
+
+        pos = name.find(query)
+        if pos == -1:
+            return None
+
+        word_starts = self._word_starts[index]
+        while pos != -1:
+            if pos in word_starts:
+                return WORD_PREFIX
+            pos = name.find(query, pos + 1)
+        return SUBSTRING
+
+    def search(
+        self, query: str, *, popularity: Mapping[str, int] | None = None, limit: int = MAX_CHOICES
+    ) -> list[ChoiceT]:
+        """Get the best matching choices.
+
+        Choices are ranked by match quality (exact, prefix, word prefix, substring),
+        then by popularity, then by name, so the same query always gives the same result.
+        """
+        query = normalize(query)
+        if not query:
+            return list(self.choices[:limit])
+
+        popularity = popularity or {}
+        ranked: list[tuple[int, int, int, str, int]] = []
+        for index in self._get_candidates(query):
+            quality = self._get_quality(index, query)
+            if quality is None:
+                continue
+
+            name = self._names[index]
+            value = str(self.choices[index].value)
+            ranked.append((quality, -popularity.get(value, 0), len(name), name, index))
+
+        ranked.sort()
+        return [self.choices[item[-1]] for item in ranked[:limit]]
+
+
+class SearchIndex:
+    """Lazily built choice indexes of the /search autofill, one per game, category and locale.
+
+    Call reset() whenever the autofill is refreshed, popularity counts are kept.
+    """
+
+    def __init__(self, autofill: AutocompleteChoices) -> None:
+        self._autofill = autofill
+        self._indexes: dict[
+            tuple[Game, ItemCategory, Locale], ChoiceIndex[app_commands.Choice[str]]
+        ] = {}
+        self._popularity: defaultdict[tuple[Game, ItemCategory], Counter[str]] = defaultdict(
+            Counter
+        )
+
+    def reset(self, autofill: AutocompleteChoices) -> None:
+        self._autofill = autofill
+        self._indexes.clear()
+
+    def _get_index(
+        self, game: Game, category: ItemCategory, locale: Locale
+    ) -> ChoiceIndex[app_commands.Choice[str]]:
+        key = (game, category, locale)
+        index = self._indexes.get(key)
+        if index is None:
+            locales = self._autofill.get(game, {}).get(category, {})
+            index = self._indexes[key] = ChoiceIndex(
+                locales.get(locale) or locales.get(Locale.american_english) or []
+            )
+        return index
+
+    def record_use(self, game: Game, category: ItemCategory, value: str) -> None:
+        """Count a searched item towards its popularity.
+
+        Only values of the autofill's choices are counted, so free-text queries can't grow the
+        counts without bound. Values are item IDs, which are the same in every locale.
+        """
+        if self._get_index(game, category, Locale.american_english).get(value) is None:
+            return
+        self._popularity[game, category][value] += 1
+
+    def search(
+        self, game: Game, category: ItemCategory, locale: Locale, query: str
+    ) -> list[app_commands.Choice[str]]:
+        start = time.perf_counter()
+
+        index = self._get_index(game, category, locale)
+        result = index.search(query, popularity=self._popularity[game, category])
+        SearchMetrics.AUTOCOMPLETE_LATENCY.labels(index=game.value).observe(
+            time.perf_counter() - start
+        )
+        return result
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import contextlib
 import datetime
+import functools
+import mmap
+import os
+import pathlib
 import random
 import re
-from typing import TYPE_CHECKING, Any, Final, Literal, Self, TypeAlias
+import struct
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple, Self, TypeAlias
 
 import aiofiles
 import anyio
@@ -21,6 +27,7 @@ from hoyo_buddy.enums import Game
 from .constants import (
     AMBR_ELEMENT_TO_ELEMENT,
     HOYO_LANG_TO_LOCALE,
+    TRANSLATION_CACHE_SIZE,
     WEEKDAYS,
     YATTA_PATH_TO_HSR_PATH,
     ZENLESS_DATA_LANG_TO_LOCALE,
@@ -64,11 +71,140 @@ GAME_MI18N_FILES: Final[dict[Mi18nGame, tuple[str, str]]] = {
 }
 FILENAME_TO_GAME: Final[dict[str, Mi18nGame]] = {v[1]: k for k, v in GAME_MI18N_FILES.items()}
 
+CATALOG_PATH = pathlib.Path(".cache/l10n_catalog.bin")
+CATALOG_MAGIC = b"HBL10N01"
+CATALOG_HEADER = struct.Struct("<8sII")
+"""Magic, entry count, flags (bit 0: loaded)"""
+CATALOG_ENTRY = struct.Struct("<IIII")
+"""Key offset, key length, value offset, value length; offsets are relative to the string table"""
+
 
 def gen_string_key(string: str) -> str:
     return string.replace(" ", "_").replace(",", "").replace(".", "").replace("-", "_").lower()
 
 
+class StringSpec(NamedTuple):
+    """The parts of a LocaleStr that decide its translation, used as a memoization key."""
+
+    source: str
+    """Catalog the string is looked up in: l10n, mi18n:<game> or textmap:<game>."""
+    key: str
+    translate: bool
+    custom_str: str | None
+    default: str | None
+    append: str | None
+
+
+class TranslationCatalog:
+    """Translation templates of every catalog source and language.
+
+    Templates are compiled when the catalog is built: command mentions are already
+    substituted, so rendering a string is a lookup plus ``str.format``.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[tuple[str, str], dict[str, str]] = {}
+        """(source, lang) -> string key -> template"""
+
+    @property
+    def loaded(self) -> bool:
+        """Whether l10n, mi18n and game textmap strings are all present."""
+        kinds = {source.split(":")[0] for source, _ in self._templates}
+        return {"l10n", "mi18n", "textmap"} <= kinds
+
+    def add(self, source: str, lang: str, templates: dict[str, str]) -> None:
+        self._templates[source, lang] = templates
+
+    def get(self, source: str, lang: str, key: str) -> str | None:
+        templates = self._templates.get((source, lang))
+        if templates is None:
+            return None
+        return templates.get(key)
+
+    def get_all(self, source: str, lang: str) -> dict[str, str]:
+        return self._templates.get((source, lang), {})
+
+    def dump(self, path: pathlib.Path) -> None:
+        """Write the catalog as a sorted string table with an offset index, for MappedCatalog.
+
+        The file is replaced atomically, so processes still mapping the old one are unaffected.
+        """
+        entries = sorted(
+            (f"{source}\0{lang}\0{key}".encode(), value.encode())
+            for (source, lang), templates in self._templates.items()
+            for key, value in templates.items()
+        )
+
+        index = bytearray()
+        strings = bytearray()
+        for key, value in entries:
+            index += CATALOG_ENTRY.pack(len(strings), len(key), len(strings) + len(key), len(value))
+            strings += key
+            strings += value
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            f.write(CATALOG_HEADER.pack(CATALOG_MAGIC, len(entries), int(self.loaded)))
+            f.write(index)
+            f.write(strings)
+        tmp_path.replace(path)
+
+
+class MappedCatalog:
+    """A read-only TranslationCatalog memory-mapped from a file written by TranslationCatalog.dump.
+
+    The pages are shared by every process mapping the same file, and nothing is parsed
+    up front; lookups binary search the sorted index.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._count, flags = CATALOG_HEADER.unpack_from(self._mmap)
+        if magic != CATALOG_MAGIC:
+            msg = f"{path} is not a translation catalog"
+            raise ValueError(msg)
+
+        self.loaded = bool(flags & 1)
+        self._strings_start = CATALOG_HEADER.size + self._count * CATALOG_ENTRY.size
+
+    def _get_entry(self, index: int) -> tuple[int, int, int, int]:
+        return CATALOG_ENTRY.unpack_from(
+            self._mmap, CATALOG_HEADER.size + index * CATALOG_ENTRY.size
+        )
+
+    def _get_key(self, index: int) -> bytes:
+        key_offset, key_length, _, _ = self._get_entry(index)
+        start = self._strings_start + key_offset
+        return self._mmap[start : start + key_length]
+
+    def _get_value(self, index: int) -> str:
+        _, _, value_offset, value_length = self._get_entry(index)
+        start = self._strings_start + value_offset
+        return self._mmap[start : start + value_length].decode()
+
+    def _find(self, target: bytes) -> int:
+        return bisect.bisect_left(range(self._count), target, key=self._get_key)
+
+    def get(self, source: str, lang: str, key: str) -> str | None:
+        target = f"{source}\0{lang}\0{key}".encode()
+        index = self._find(target)
+        if index < self._count and self._get_key(index) == target:
+            return self._get_value(index)
+        return None
+
+    def get_all(self, source: str, lang: str) -> dict[str, str]:
+        prefix = f"{source}\0{lang}\0".encode()
+        result: dict[str, str] = {}
+        index = self._find(prefix)
+        while index < self._count and (key := self._get_key(index)).startswith(prefix):
+            result[key[len(prefix) :].decode()] = self._get_value(index)
+            index += 1
+        return result
+
+
 class LocaleStr:
     def __init__(
         self,
@@ -175,13 +311,12 @@ class Translator:
         self._l10n: dict[str, dict[str, str]] = {}
         self._mi18n: dict[tuple[str, Mi18nGame], dict[str, str]] = {}
         self._game_textmaps: dict[tuple[str, Game], dict[str, str]] = {}
+        self._catalog: TranslationCatalog | MappedCatalog = TranslationCatalog()
+        self._render_cached = functools.lru_cache(maxsize=TRANSLATION_CACHE_SIZE)(self._render)
 
     @property
     def loaded(self) -> bool:
-        return (
-            bool(self._l10n) and bool(self._mi18n) and bool(self._game_textmaps)
-            # and bool(self._synced_commands)
-        )
+        return self._catalog.loaded
 
     async def __aenter__(self) -> Self:
         await self.load()
@@ -200,9 +335,10 @@ class Translator:
             return
 
         await self.load_l10n_files()
-        await self.load_synced_commands_json()
         await self.load_mi18n_files()
         await self.load_game_textmaps()
+        # Compiles the catalog
+        await self.load_synced_commands_json()
 
         logger.info("Translator loaded")
 
@@ -272,10 +408,51 @@ class Translator:
 
     async def load_synced_commands_json(self) -> None:
         self._synced_commands = await read_json(f"{BOT_DATA_PATH}/synced_commands.json")
+        self.compile_catalog()
+
+    def compile_catalog(self) -> None:
+        """Build the translation catalog from the loaded files and synced commands."""
+        catalog = TranslationCatalog()
+        for lang, strings in self._l10n.items():
+            catalog.add("l10n", lang, self._compile_templates(strings))
+        for (lang, game), strings in self._mi18n.items():
+            catalog.add(f"mi18n:{game}", lang, self._compile_templates(strings))
+        for (lang, game), strings in self._game_textmaps.items():
+            catalog.add(f"textmap:{game}", lang, self._compile_templates(strings))
+        catalog.add("commands", "", {name: str(id_) for name, id_ in self._synced_commands.items()})
+
+        self._catalog = catalog
+        self._render_cached.cache_clear()
+
+    def dump_catalog(self, path: pathlib.Path = CATALOG_PATH) -> None:
+        """Write the compiled catalog for worker processes to map with map_catalog()."""
+        if not isinstance(self._catalog, TranslationCatalog):
+            msg = "Only a catalog compiled in this process can be dumped"
+            raise TypeError(msg)
+        self._catalog.dump(path)
+
+    def map_catalog(self, path: pathlib.Path = CATALOG_PATH) -> None:
+        """Use a catalog dumped by another process instead of loading the files.
+
+        The file is memory-mapped read-only, so its pages are shared between processes.
+        """
+        catalog = MappedCatalog(path)
+        self._synced_commands = {
+            name: int(id_) for name, id_ in catalog.get_all("commands", "").items()
+        }
+        self._catalog = catalog
+        self._render_cached.cache_clear()
+
+    def _compile_templates(self, strings: dict[str, Any]) -> dict[str, str]:
+        return {
+            key: self._replace_command_with_mentions(value) if "</" in value else value
+            for key, value in strings.items()
+            if isinstance(value, str)
+        }
 
     def get_dyks(self, locale: Locale) -> list[tuple[str, bool]]:
         keys: set[str] = set()
-        for key in self._l10n[SOURCE_LANG]:
+        for key in self._catalog.get_all("l10n", SOURCE_LANG):
             if key.startswith("dyk_"):
                 keys.add(key)
 
@@ -333,44 +510,66 @@ class Translator:
             # It's intentional that we don't apply any modifiers when string is not LocaleStr
             return shorten(string, length=max_length) if max_length else string
 
-        extras = self._translate_extras(string.extras, locale)
-        string_key = self._get_string_key(string)
-
         if string.mi18n_game is not None:
-            source_string = self._mi18n[SOURCE_LANG, string.mi18n_game].get(string_key)  # pyright: ignore[reportArgumentType]
+            source = f"mi18n:{string.mi18n_game}"
         elif string.game is not None:
-            source_string = self._game_textmaps[SOURCE_LANG, string.game].get(string_key)
+            source = f"textmap:{string.game}"
         else:
-            source_string = self._l10n[SOURCE_LANG].get(string_key)
+            source = "l10n"
+        spec = StringSpec(
+            source=source,
+            key=self._get_string_key(string),
+            translate=string.translate_,
+            custom_str=string.custom_str,
+            default=string.default,
+            append=string.append,
+        )
 
-        if string.translate_ and source_string is None and string.custom_str is None:
-            logger.error(f"String {string_key!r} is missing in source lang file")
+        # Other objects (e.g. models) may hash by identity or primary key rather than by how
+        # they render, and would be kept alive by the cache; memoize their text instead
+        extras = {
+            key: value if value is None or isinstance(value, str | int | float) else str(value)
+            for key, value in self._translate_extras(string.extras, locale).items()
+        }
+        return self._render_cached(
+            spec, locale, frozenset(extras.items()), title_case=title_case, max_length=max_length
+        )
+
+    def _render(
+        self,
+        spec: StringSpec,
+        locale: Locale,
+        extras: frozenset[tuple[str, Any]],
+        *,
+        title_case: bool,
+        max_length: int | None,
+    ) -> str:
+        source_string = self._catalog.get(spec.source, SOURCE_LANG, spec.key)
+        if spec.translate and source_string is None and spec.custom_str is None:
+            logger.error(f"String {spec.key!r} is missing in source lang file")
 
         lang = locale.value.replace("-", "_")
         if lang == "en-GB":
             lang = "en-US"
 
-        if string.mi18n_game is not None:
-            translation = self._mi18n.get((lang, string.mi18n_game), {}).get(string_key)  # pyright: ignore[reportArgumentType, reportCallIssue]
-        elif string.game is not None:
-            translation = self._game_textmaps.get((lang, string.game), {}).get(string_key)
-        else:
-            translation = self._l10n.get(lang, {}).get(string_key)
-
+        # Strings outside of the catalog aren't compiled, substitute their mentions here
         translation = (
-            translation or string.default or source_string or string.custom_str or string_key
+            self._catalog.get(spec.source, lang, spec.key)
+            or (spec.default and self._replace_command_with_mentions(spec.default))
+            or source_string
+            or self._replace_command_with_mentions(spec.custom_str or spec.key)
         )
 
         with contextlib.suppress(KeyError):
-            translation = translation.format(**extras)
+            translation = translation.format(**dict(extras))
 
         if title_case:
             translation = convert_to_title_case(translation)
 
-        translation = self._replace_command_with_mentions(translation)
-        translation = self._replace_docs_urls(translation, locale=locale)
-        if string.append:
-            translation += string.append
+        if ":docs/" in translation:
+            translation = self._replace_docs_urls(translation, locale=locale)
+        if spec.append:
+            translation += spec.append
 
         return shorten(translation, length=max_length) if max_length else translation
 
@@ -383,6 +582,8 @@ class Translator:
                 extras_[k] = "/".join([self.translate(i, locale) for i in v])
             elif isinstance(v, datetime.timedelta):
                 extras_[k] = self.display_timedelta(v, locale)
+            elif isinstance(v, str) and "</" in v:
+                extras_[k] = self._replace_command_with_mentions(v)
             else:
                 extras_[k] = v
         return extras_
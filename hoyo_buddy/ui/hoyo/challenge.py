@@ -210,6 +210,18 @@ class ChallengeView(View):
             return None
         return self.challenge_cache[self.challenge_type].get(self.season_id)
 
+    async def load_challenge(self) -> None:
+        """Load and parse the selected season's challenge if it isn't cached yet."""
+        cache = self.challenge_cache[self.challenge_type]
+        if self.season_id in cache:
+            return
+
+        challenge = await ChallengeHistory.get_parsed_data(
+            uid=self.account.uid, challenge_type=self.challenge_type, season_id=self.season_id
+        )
+        if challenge is not None:
+            cache[self.season_id] = challenge
+
     @property
     def season_id(self) -> int:
         return self.season_ids[self.challenge_type]
@@ -538,17 +550,15 @@ class ChallengeView(View):
         with contextlib.suppress(NoChallengeDataError):
             await self._fetch_data()
 
-        histories = await ChallengeHistory.filter(
+        histories = await ChallengeHistory.get_headers(
             uid=self.account.uid, challenge_type=self.challenge_type
-        ).all()
+        )
         if not histories:
             raise NoChallengeDataError(self.challenge_type)
 
-        for history in histories:
-            self.challenge_cache[self.challenge_type][history.season_id] = history.parsed_data
-
         if self.challenge_type not in self.season_ids:
             self.season_id = histories[0].season_id
+        await self.load_challenge()
 
         phase_select: PhaseSelect = self.get_item("challenge_view.phase_select")
         phase_select.set_options(histories)
@@ -619,6 +629,7 @@ class PhaseSelect(PaginatorSelect[ChallengeView]):
 
         self.view.season_id = int(self.values[0])
         await self.set_loading_state(i)
+        await self.view.load_challenge()
         await self.view.update(self, i)
 
 
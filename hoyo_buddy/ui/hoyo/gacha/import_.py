@@ -6,7 +6,7 @@ import discord
 import genshin
 
 from hoyo_buddy.constants import MW_EVENT_BANNER_TYPES
-from hoyo_buddy.db import GachaHistory, get_dyk, update_gacha_nums
+from hoyo_buddy.db import get_dyk, import_gacha_records
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import COOKIE, LINK, LOADING
 from hoyo_buddy.enums import Game, Platform
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from genshin.paginators import Paginator
 
     from hoyo_buddy.db import HoyoAccount
+    from hoyo_buddy.db.utils import GachaRecordRow
     from hoyo_buddy.enums import Locale
     from hoyo_buddy.types import Interaction, User
 
@@ -58,20 +59,9 @@ async def _fetch_new_records[RecordT: genshin.models.Unique](
     return records
 
 
-def _zzz_signal_records(
-    signals: list[genshin.models.SignalSearch], account: HoyoAccount
-) -> list[GachaHistory]:
+def _zzz_signal_records(signals: list[genshin.models.SignalSearch]) -> list[GachaRecordRow]:
     return [
-        GachaHistory(
-            wish_id=signal.id,
-            rarity=signal.rarity,
-            time=signal.time,
-            banner_type=signal.banner_type,
-            item_id=signal.item_id,
-            account=account,
-            banner_id=None,
-            game=Game.ZZZ,
-        )
+        (signal.id, signal.rarity, signal.time, signal.item_id, signal.banner_type, None)
         for signal in signals
     ]
 
@@ -182,18 +172,15 @@ class HoyolabImport(Button[GachaImportView]):
             genshin.models.ZZZBannerType,
             cursors,
         )
-        signals.sort(key=lambda x: x.id)
 
-        before = await GachaHistory.get_wish_count(self.account)
-        await GachaHistory.bulk_create(_zzz_signal_records(signals, self.account))
+        count = await import_gacha_records(
+            i.client.pool, account=self.account, records=_zzz_signal_records(signals)
+        )
 
         self.account.gacha_cursors = cursors
         await self.account.save(update_fields=("gacha_cursors",))
 
-        after = await GachaHistory.get_wish_count(self.account)
-        await update_gacha_nums(i.client.pool, account=self.account)
-
-        await i.edit_original_response(embed=self.view.success_embed(after - before))
+        await i.edit_original_response(embed=self.view.success_embed(count))
 
 
 class EnterURLModal(Modal):
@@ -244,9 +231,8 @@ class URLImport(Button[GachaImportView]):
 
         await i.edit_original_response(embed=self.view.loading_embed, view=None)
 
-        records: list[GachaHistory] = []
+        records: list[GachaRecordRow] = []
         cursors = dict(self.account.gacha_cursors)
-        before = await GachaHistory.get_wish_count(self.account)
 
         if self.account.game is Game.GENSHIN:
             wishes = await _fetch_new_records(
@@ -254,7 +240,6 @@ class URLImport(Button[GachaImportView]):
                 genshin.models.GenshinBannerType,
                 cursors,
             )
-            wishes.sort(key=lambda x: x.id)
 
             ambr = AmbrAPIClient(session=i.client.session)
             item_ids = await ambr.fetch_item_name_to_id_map()
@@ -268,25 +253,13 @@ class URLImport(Button[GachaImportView]):
                     msg = f"Cannot find item ID for {wish.name}, is this an invalid item?"
                     raise ValueError(msg)
 
-                records.append(
-                    GachaHistory(
-                        wish_id=wish.id,
-                        rarity=wish.rarity,
-                        time=wish.time,
-                        banner_type=banner_type,
-                        item_id=item_id,
-                        account=self.account,
-                        banner_id=None,
-                        game=Game.GENSHIN,
-                    )
-                )
+                records.append((wish.id, wish.rarity, wish.time, item_id, banner_type, None))
 
             mw_wishes = await _fetch_new_records(
                 lambda b: client.mw_wish_history(b, authkey=authkey),
                 (genshin.models.MWBannerType.STANDARD, genshin.models.MWBannerType.EVENT),
                 cursors,
             )
-            mw_wishes.sort(key=lambda x: x.id)
 
             for wish in mw_wishes:
                 self._check_uid(wish)
@@ -296,16 +269,7 @@ class URLImport(Button[GachaImportView]):
                 )
 
                 records.append(
-                    GachaHistory(
-                        wish_id=wish.id,
-                        rarity=wish.rarity,
-                        time=wish.time,
-                        banner_type=banner_type,
-                        item_id=wish.item_id,
-                        account=self.account,
-                        banner_id=wish.banner_id,
-                        game=Game.GENSHIN,
-                    )
+                    (wish.id, wish.rarity, wish.time, wish.item_id, banner_type, wish.banner_id)
                 )
 
         elif self.account.game is Game.STARRAIL:
@@ -314,21 +278,18 @@ class URLImport(Button[GachaImportView]):
                 genshin.models.StarRailBannerType,
                 cursors,
             )
-            warps.sort(key=lambda x: x.id)
 
             for warp in warps:
                 self._check_uid(warp)
 
                 records.append(
-                    GachaHistory(
-                        wish_id=warp.id,
-                        rarity=warp.rarity,
-                        time=warp.time,
-                        banner_type=warp.banner_type,
-                        item_id=warp.item_id,
-                        account=self.account,
-                        banner_id=warp.banner_id,
-                        game=Game.STARRAIL,
+                    (
+                        warp.id,
+                        warp.rarity,
+                        warp.time,
+                        warp.item_id,
+                        warp.banner_type,
+                        warp.banner_id,
                     )
                 )
 
@@ -338,21 +299,17 @@ class URLImport(Button[GachaImportView]):
                 genshin.models.ZZZBannerType,
                 cursors,
             )
-            signals.sort(key=lambda x: x.id)
 
             for signal in signals:
                 self._check_uid(signal)
 
-            records.extend(_zzz_signal_records(signals, self.account))
+            records.extend(_zzz_signal_records(signals))
         else:
             raise FeatureNotImplementedError(platform=self.account.platform, game=self.account.game)
 
-        await GachaHistory.bulk_create(records)
+        count = await import_gacha_records(i.client.pool, account=self.account, records=records)
 
         self.account.gacha_cursors = cursors
         await self.account.save(update_fields=("gacha_cursors",))
 
-        after = await GachaHistory.get_wish_count(self.account)
-        await update_gacha_nums(i.client.pool, account=self.account)
-
-        await i.edit_original_response(embed=self.view.success_embed(after - before))
+        await i.edit_original_response(embed=self.view.success_embed(count))
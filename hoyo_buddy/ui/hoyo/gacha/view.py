@@ -15,6 +15,7 @@ from hoyo_buddy.constants import (
     MW_EVENT_BANNER_TYPES,
 )
 from hoyo_buddy.db import GachaHistory, GachaStats, get_dyk, get_last_gacha_num
+from hoyo_buddy.db.metrics import acquire
 from hoyo_buddy.embeds import DefaultEmbed
 from hoyo_buddy.emojis import CURRENCY_EMOJIS
 from hoyo_buddy.enums import Game
@@ -35,20 +36,6 @@ if TYPE_CHECKING:
 GlobalStat: TypeAlias = Literal[
     "lifetime_pulls", "avg_5star_pulls", "avg_4star_pulls", "avg_3star_pulls", "win_rate"
 ]
-GET_RANKING_SQL = """
-SELECT
-    ranked.rank,
-    (SELECT COUNT(*) FROM gachastats WHERE game = $1 AND banner_type = $3) AS total_rows
-FROM (
-    SELECT
-        account_id,
-        ROW_NUMBER() OVER (ORDER BY {row} {order}) as rank
-    FROM gachastats
-    WHERE game = $1 AND banner_type = $3
-) ranked
-WHERE account_id = $2;
-"""
-
 RANK_ORDERS: Final[dict[GlobalStat, Literal["ASC", "DESC"]]] = {
     "lifetime_pulls": "DESC",
     "avg_5star_pulls": "ASC",
@@ -56,21 +43,46 @@ RANK_ORDERS: Final[dict[GlobalStat, Literal["ASC", "DESC"]]] = {
     "avg_3star_pulls": "ASC",
     "win_rate": "DESC",
 }
+# Each rank is a range count on the (game, banner_type, <stat>) index of gachastats,
+# the comparison direction follows RANK_ORDERS
+GET_RANKINGS_SQL = """
+SELECT
+    (
+        SELECT COUNT(*) FROM gachastats g
+        WHERE g.game = $1 AND g.banner_type = $3 AND g.lifetime_pulls > me.lifetime_pulls
+    ) + 1 AS lifetime_pulls,
+    (
+        SELECT COUNT(*) FROM gachastats g
+        WHERE g.game = $1 AND g.banner_type = $3 AND g.avg_5star_pulls < me.avg_5star_pulls
+    ) + 1 AS avg_5star_pulls,
+    (
+        SELECT COUNT(*) FROM gachastats g
+        WHERE g.game = $1 AND g.banner_type = $3 AND g.avg_4star_pulls < me.avg_4star_pulls
+    ) + 1 AS avg_4star_pulls,
+    (
+        SELECT COUNT(*) FROM gachastats g
+        WHERE g.game = $1 AND g.banner_type = $3 AND g.avg_3star_pulls < me.avg_3star_pulls
+    ) + 1 AS avg_3star_pulls,
+    (
+        SELECT COUNT(*) FROM gachastats g
+        WHERE g.game = $1 AND g.banner_type = $3 AND g.win_rate > me.win_rate
+    ) + 1 AS win_rate,
+    (SELECT COUNT(*) FROM gachastats WHERE game = $1 AND banner_type = $3) AS total_rows
+FROM gachastats me
+WHERE me.game = $1 AND me.account_id = $2 AND me.banner_type = $3;
+"""
 
 
-async def get_ranking(
-    pool: asyncpg.Pool,
-    *,
-    game: Game,
-    row: GlobalStat,
-    order: Literal["ASC", "DESC"],
-    account_id: int,
-    banner_type: int,
-) -> tuple[int, int]:
-    async with pool.acquire() as conn:
-        return await conn.fetchrow(
-            GET_RANKING_SQL.format(row=row, order=order), game.value, account_id, banner_type
-        )
+async def get_rankings(
+    pool: asyncpg.Pool, *, game: Game, account_id: int, banner_type: int
+) -> tuple[dict[GlobalStat, int], int]:
+    """Return the account's rank for every global stat and the number of ranked accounts."""
+    async with acquire(pool) as conn:
+        row = await conn.fetchrow(GET_RANKINGS_SQL, game.value, account_id, banner_type)
+
+    if row is None:
+        return {}, 0
+    return {stat: row[stat] for stat in RANK_ORDERS}, row["total_rows"]
 
 
 class ViewGachaLogView(View):
@@ -117,15 +129,11 @@ class ViewGachaLogView(View):
             return False
         return gacha.item_id in await get_standard_items(self.account.game)
 
-    async def get_ranking_str(self, pool: asyncpg.Pool, *, stat: GlobalStat) -> str:
-        rank, total = await get_ranking(
-            pool,
-            game=self.account.game,
-            row=stat,
-            order=RANK_ORDERS[stat],
-            account_id=self.account.id,
-            banner_type=self.banner_type,
-        )
+    def get_ranking_str(
+        self, rankings: tuple[dict[GlobalStat, int], int], *, stat: GlobalStat
+    ) -> str:
+        ranks, total = rankings
+        rank = ranks.get(stat, 0)
 
         if rank == 0 or total == 0:
             return "N/A"
@@ -213,6 +221,9 @@ class ViewGachaLogView(View):
             avg_3star_pulls=three_star_avg_pulls,
             banner_type=self.banner_type,
         )
+        rankings = await get_rankings(
+            pool, game=self.account.game, account_id=self.account.id, banner_type=self.banner_type
+        )
 
         embed = DefaultEmbed(
             self.locale,
@@ -308,7 +319,7 @@ class ViewGachaLogView(View):
         global_stats_parts.append(
             LocaleStr(
                 key="gacha_log_global_stats_lifetime",
-                lifetime=await self.get_ranking_str(pool, stat="lifetime_pulls"),
+                lifetime=self.get_ranking_str(rankings, stat="lifetime_pulls"),
             ).translate(self.locale)
         )
 
@@ -317,7 +328,7 @@ class ViewGachaLogView(View):
                 LocaleStr(
                     key="gacha_log_global_stats_luck",
                     rarity=5,
-                    luck=await self.get_ranking_str(pool, stat="avg_5star_pulls"),
+                    luck=self.get_ranking_str(rankings, stat="avg_5star_pulls"),
                 ).translate(self.locale)
             )
 
@@ -326,7 +337,7 @@ class ViewGachaLogView(View):
                 LocaleStr(
                     key="gacha_log_global_stats_luck",
                     rarity=4,
-                    luck=await self.get_ranking_str(pool, stat="avg_4star_pulls"),
+                    luck=self.get_ranking_str(rankings, stat="avg_4star_pulls"),
                 ).translate(self.locale)
             )
 
@@ -335,7 +346,7 @@ class ViewGachaLogView(View):
                 LocaleStr(
                     key="gacha_log_global_stats_luck",
                     rarity=3,
-                    luck=await self.get_ranking_str(pool, stat="avg_3star_pulls"),
+                    luck=self.get_ranking_str(rankings, stat="avg_3star_pulls"),
                 ).translate(self.locale)
             )
 
@@ -354,7 +365,7 @@ class ViewGachaLogView(View):
             global_win_rate_stats = LocaleStr(
                 key="win_rate_global_stats",
                 title=title,
-                win_rate=await self.get_ranking_str(pool, stat="win_rate"),
+                win_rate=self.get_ranking_str(rankings, stat="win_rate"),
             ).translate(self.locale)
             global_stats += f"\n{global_win_rate_stats}"
 
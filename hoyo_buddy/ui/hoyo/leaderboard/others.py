@@ -23,6 +23,7 @@ class LbPaginator(PaginatorView):
         embed: DefaultEmbed,
         you: Leaderboard | None,
         *,
+        you_rank: int,
         lb_size: int,
         order: Literal["ASC", "DESC"],
         process_value: Callable[[float], Any],
@@ -36,6 +37,7 @@ class LbPaginator(PaginatorView):
 
         self.lb_embed = embed
         self.you = you
+        self.you_rank = you_rank
         self.lb_size = lb_size
         self.order = order
         self.process_value = process_value
@@ -47,7 +49,7 @@ class LbPaginator(PaginatorView):
         self.lbs: list[Leaderboard] = []
         self._max_page = math.ceil(lb_size / 10)
 
-    def get_lb_line(self, lb: Leaderboard) -> str:
+    def get_lb_line(self, lb: Leaderboard, rank: int) -> str:
         value = self.process_value(lb.value)
 
         if self.character_names:
@@ -57,29 +59,34 @@ class LbPaginator(PaginatorView):
         else:
             name = ""
 
-        return f"{lb.rank}. {lb.username} ({blur_uid(lb.uid, arterisk='x')}) - {name}**{value}**"
+        return f"{rank}. {lb.username} ({blur_uid(lb.uid, arterisk='x')}) - {name}**{value}**"
 
     def get_page_embed(self, lbs: list[Leaderboard]) -> DefaultEmbed:
         embed = self.lb_embed.copy()
 
         if self.you is not None:
             top_percent = LocaleStr(
-                key="top_percent", percent=round(self.you.rank / self.lb_size * 100, 1)
+                key="top_percent", percent=round(self.you_rank / self.lb_size * 100, 1)
             ).translate(self.locale)
             you_str = LocaleStr(key="akasha_you").translate(self.locale)
 
             embed.add_field(
-                name=f"{you_str} ({top_percent})", value=self.get_lb_line(self.you), inline=False
+                name=f"{you_str} ({top_percent})",
+                value=self.get_lb_line(self.you, self.you_rank),
+                inline=False,
             )
 
+        start = self._current_page * 10 + 1
         return embed.add_field(
-            name="---", value="\n".join(self.get_lb_line(lb) for lb in lbs), inline=False
+            name="---",
+            value="\n".join(self.get_lb_line(lb, rank) for rank, lb in enumerate(lbs, start)),
+            inline=False,
         )
 
     async def fetch_page(self) -> Page:
         self.lbs = (
             await Leaderboard.filter(game=self.game, type=self.lb_type)
-            .order_by(f"{'rank' if self.order == 'DESC' else '-rank'}")
+            .order_by("-value" if self.order == "DESC" else "value")
             .limit(10)
             .offset(self._current_page * 10)
         )
@@ -299,6 +299,7 @@ class NotesReminderMixin:
         notify.est_time = None
         notify.last_notif_time = None
         notify.last_check_time = None
+        notify.next_check_at = None
         notify.current_notif_count = 0
 
     @staticmethod
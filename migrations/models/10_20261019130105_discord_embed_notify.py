@@ -0,0 +1,110 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "discordembed" ADD "attempts" INT NOT NULL DEFAULT 0;
+        CREATE OR REPLACE FUNCTION notify_discord_embed() RETURNS trigger AS $$ BEGIN PERFORM pg_notify('discord_embed', NEW.user_id::text); RETURN NEW; END; $$ LANGUAGE plpgsql;
+        CREATE TRIGGER "discordembed_notify" AFTER INSERT ON "discordembed" FOR EACH ROW EXECUTE FUNCTION notify_discord_embed();"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "discordembed_notify" ON "discordembed";
+        DROP FUNCTION IF EXISTS notify_discord_embed();
+        ALTER TABLE "discordembed" DROP COLUMN "attempts";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf2kXyBWJndcGhwNkW0l8m9iB5bTbNgVBS7StjR5ePZI6e/3fj9TD1o"
+    "NSJPklC/zQIhY5lPQbajgznBn+09AMGanWJ16SDEe3+4atTERk24o+tRpX3D8NHWoI/5HZ"
+    "74hrwPl81YtcsOFYdQmhR6ETCitMMbZsE0o27jOBqoXwJRlZkqnMbcXQ8VXdUVVy0ZBwR0"
+    "y1uuToyt8OArYxRfYMmbjh+w98WdFl9BNZwc/5M5goSJUjr+E/DVBk8gxuO7AXc7etp9vX"
+    "LgG56xhIhupoepJovrBnhr6kUnSbXJ0iHZnQRnLofcjj+jAEl7xHxxds00HLZ5ZXF2Q0gY"
+    "5qh95/DFbXGgD0ByMgCiMAGgUQkwydoI2f1ePqlDzCv5onpxenl63z00vcxX3M5ZWLX96t"
+    "Vwh5hC5O/VHjl9sObej1cEFfoewyewEwStIMSc+KDiZQUR0TJUFvG4aKoE4HPnOcGB/GeK"
+    "AyjAgurDixmo4B7AFvtsCKDJzbg8EdGVmzrL9V90JvRH4b+LPxvq3+431bGH48+Y1cxp0U"
+    "G4UZlMUQy5EkZFlrMyQ0DmNIfoZoimYAG1rPJRlBpWcMKMOAcqKJSs8YUJABY2exzgcQI2"
+    "fwl4B/jekfI2fwF4RfNuHrOtM/Ts8YUIYBa3wAcXrGgPwMMJGMkFZy+ieJGfSFoS838ZPE"
+    "DPoyhhhxKmhzqJdVgN4ZiTFlPaas67CgjsSYkp8pr2gM0Asi9yzGgyjhDiFfXjkozImrdP"
+    "IccuORC2MoPb9CUwaJFqNpUF1+vo80yauBjkYG/s9lVg+/FNQl2sfgO5hvjYXBr8Y6KLfq"
+    "r2AqBldX93cVRd8bHfMnYwzwmyOPJx1e7PBdofErwoUo6KRJa2rxK1CHU/eVycORRwlc9o"
+    "5tjKD1PESW97ZJp360x1GmOx/3JW4Pc9V3o4787+GZ5PpX3AnyI6+Dv5BjP69D32diZSfe"
+    "tv35Kz4ksO3MoEkHN0IUwxg//Lak8DZh1uBPoCJ9as8ItscZmH7mh51bfvixefxbTBb7LU"
+    "23KbrklVME96P0bV+Mblm/IOoZkboygJRVq4vhshUN0SGP08Zwl33iT8Ef9WLCqHcviCP+"
+    "/iHCiS4/EkhL0726iF39eB77DpaDcF96o1uO/OS+DfqCC6dh2VPTveOq3+hbgzwTWX+Abr"
+    "wCKIcxCS4HlyKsrsym777l1waWiYS6mEMFvDZMpEz1P9BiN0pgNT6dzauB7yjjm1MZO3iE"
+    "rCiQSHumuijhntuL+vjekLD6gYdDpo+iYyFPsyAPzJTGfSqNcdbk1RvjdDVUHS9zaI6XqY"
+    "rjZVxvlKH5DMjHV1BzjNAx3bGA7uhYtqEBRcPik6Ku/1cc9FPmdpwwrjkqks39j1MVa2sL"
+    "X+P7j8buwSeQRMAPpvPHe/7P+Ezv3A3acT2QDNCms2FuYjzNBYHZMAtJmhT6UhLHF91V+R"
+    "CiAidLkgeMuEgVOBdxgSM5pomI5kLmcRLxEfqZsnYmCOsAdZapJPw5yp72S0vpbtC/CbrH"
+    "vwU6+jaCWnkWRKkZH4rzwUbaXMXoFHKKhWh2p9g0ZuOTbQn9qKBpNXNImlYzVdSQpphTbI"
+    "aNfRPqz0XdYmE6tvGWX7lxgbMcbKhBG5iGqhZ2SFIHYCzIz4KZMp2p+J8NrDmSFKgCgmVR"
+    "PmSMwphRihnenC6k8dOpmdq/htrvWAhoLQBNiqsx84OIErLIgAIfgetPo+o5gu5oCbduBP"
+    "aAtsI6ZuNG6Iu3vf4Vd4N0a6boXE+bQ8l+0sURPxzyvbsr7tbQn6FyxYk2NLkhVNQn/XbQ"
+    "/4PvBU0+Ddcy5Sf927dvV9w3pKvIsrhvho7wD9N40keD0RU3QtC0OGPCjWZIU1yJsH9Fi7"
+    "hOqa66tjJNdYaGiOq0RfJ7s9lqXTSPW+eXZ6cXF2eXx0vvaLIpy7hu927IxxRhwrsbKYET"
+    "e81dlMfAF35YLMi7fRKaepXaO5lBlXyl6Bav5oa5aND2T+J9jjL3UILes1DvDe+jOB6QFo"
+    "IWBtP7sbwvC8HZ/26KU1gyb1cq7wHbHQjliB0c/hZyzuYITZ0WxDXndSjWOlWRTImorr7y"
+    "WNJVdn6aQ4M7P03V4EhTzDEcFdgl1fXkKFXegW2ID70hfwf49ldRxMr5XDGhysHxwrKe9P"
+    "tB54q7RxpeNIm2jd/MwFcfHocCuO51Rr0BVvgfHBNxE2yA4/GedP6hA8Rbvjv4csXxc0OC"
+    "6gLfSeKsGZSN1ye9d38DRrcCPxKGV5yiTQFeQiHZq1ahiREbq4b0DGzFVhE2HW57Xx9BV7"
+    "jGtoWAH22mLBwOvxe2MHArL4r84x02Bt7e3vDbQlldAGhZ5KWxYcEPuwCz+e5O6N9g2hlR"
+    "S5aMwcT9wT1/9/WKg7qhQUJpjhU801xQKmFNkIWMtmDp0Fyk7UZ7FHG7fGF7W6WH9a1nLT"
+    "++n2NplmMY270+P/xK341oU/wi7a8jgY8vWNgwtUEQb1gknjFKyaIZKx3NiHS5FJPDdIzF"
+    "lWaxCvGLFlCSgv71U5LOcqxLZ6nL0ll8VfqLaOf0pSndhR8hWstzXzGod+24n8OFakCqHZ"
+    "uuFoSIDk0zaLypyvhfJFkAg2IhmSOgEEUUK42cCV+5pUbHkel1xJlorkIJWdxyyn1q7E21"
+    "WCsxcIP+NDdIq+cGqtBcaaHmo0wvmttxGfCyq0Bkx1SZ52y/xeiYx8FfTE+O86Ss4V6pC6"
+    "rbFts2MtUkuunhZ373OoC787g/FlC/o4B6thXKtkKrwIID3wrt3mOhpOtIpSluq8ZMtU3W"
+    "pFC3vdQMLioI6lYmeCf7bhk7n0wY71UY70l2KJZkmLKgjVH0a6S1Z0sQryda9qyMEGGm3Z"
+    "qmXVFP3kaceFUTDbv24rFiMDspBlMY4fqCu+nsRZNs2Zeq+xKhrOEmWgO/oDzQ1YW/UBzI"
+    "ppq/prEiMHsI6GLq+d4iFKFN0klp+UjpEzpEsjvkj4vB3ug7WFk3yU4ZKZ6KZA4r9coLMh"
+    "dc8Pzuvlhkry0nzW5LIjH31UbcVxQ5vgFUWZWp/boHr6GpuQeJUXMkQq1HWeb9BPfTV/3Y"
+    "qWJHdbX2kU5em6ZpZCV9hqhY1nP+hE/coOGpWSjXOUzDMpwLuljW8ruyOtw7WRrXWu5uoD"
+    "SDGUmBkfbMJW9Kem4xGfBVsWY+KEHudmhajcl2nEnPCfye1hH/DEb9wXzku1w1Q8zMb5+H"
+    "iJh9Xto+N6Gp2IsCc3pFUCfUN+ZqKpP1wDIe9u2czZXx4KuOReT/ioJ9LJSPJbb65kQ1Rs"
+    "WQTUe20GyN0JRCtWLBrxvPC3e0AnD6vXc3PU8OB0ZgKdiyAyq0KFZgFqIxQgZuZYpg7Uii"
+    "sipYFXLlJll8aFZpxr5YhTdxauGo2tkejuu0Et2ylmkuLTEoevmOQ2tZHHNLB8r56MU0XO"
+    "pBId+X4jrWW1UmrrUI5g4pa4vJUrvClyk4I4UVcvY9LdC3lbPvq6ID8jUwn9tufW4VXkQO"
+    "2kiIfX75sU0SMnxpAUUxmZVcnlUDpk3fJG0M4wkhPkCUMyDsDh7bdwL3MBQ6PbHn7wQuHW"
+    "tuY3SjdSjwdxTQT9cA/ZSBXg701hqgt/YH+vGnguF0VcF8qY0UATtMxKZ2HpiZl6L+Xgrm"
+    "3N+qo2I/tnTYlUExpmOejnRreoY7hhwsWyoVHYgKN8SZVbhhtaHrn6MejesvWlcoTFPl9T"
+    "U/9Fte5JgiU39FRjKMZ4V2hmrGAYYrkipzdyNhPNsoI4XF0AstKyldcq0oagH41ktfoxdF"
+    "QgWLdEWI6lAdLYbyeR6U4xFoIZTPU1CezEug7BHVD+WTVg6UT1rp5f1acZRNNPVLypdZhV"
+    "fUVRYcjcFnYSgKvHjFkeMBOnhJFkjBfqlUKf084iRdmiSEia5Iz4UrWIZo6jfJNy+w585Y"
+    "VSSKCZWVV7YiYmll+dPKNEUzgKboiuZoYG4otBiQVLOVTlzZNPa9bePJ2E5YAGmGpGeFIr"
+    "szp3WCls3u/LPbDXE3kYwQJZg1E/YYJQO9oEhx8SNFpgriniRm0JeBfuxQ8pxyIu/TsvN4"
+    "SyEvm/C1NPQBMcO+iJSXyJEOUC+7xFLpGQdKccDEOBcPs0vQsoycLJBtY65IZVEOEzOYKT"
+    "GN0LIDQVDqXC/qABtId60Y7nXKdnVZ5q7CXl3UslxPDsH4fhh8xzrvmmwPj8C4fhhcJ+r2"
+    "mmyPDMH4Xnm+ez6d8kyP0TOOV57jIdW3LNOTQzC+V5nvkmOaiLaVkekHCFEx67+A9e+JRC"
+    "RjKGVa6FB6gcIkJStTuMZJEG7aLsDT2DLMQnxIEO6BDf+eOLpEEObGjqLaim59Irf9T12Y"
+    "4zl5VRVIKlTInC+zGqUOwtajKq9HrCb/TiPDMwpdsALweepbrHF+YWzz3XWG4S8JvwZlRW"
+    "r7Q1z/MUQqtOmxaT7kPB5uhEcbuoPVCPyIpHBPRVsTqfhRbHXEiRREpemaRXCKF/itI05u"
+    "Jf41ceobNrJWpf/rAlOh1MEYosBCNlZRpxnIBvW9c0g2LzfQRVgMjXuQ+lr2dCSHQ4D35m"
+    "R+5KJnUtQEr4JZqp5V575hIkV12XaUlZ/6l2Xok6AXO4xzx/rw1rJQC0epbzlFb6fYRtMw"
+    "jvOcBol7pSdiHCfOg2RnnR7CQRybqwZwh6CMzLGBB6KJ2nBzprRVYx03XA0gKCaxLAcQnP"
+    "BALacX9H6BqsOq0u1YQNOrheTL5EqpGVKtPC6+c9sTPgv3Qn90xWFjS0EvSEO6DdQxsBVb"
+    "RSS5SxBxo4SNufBlLCLA9bAn9Lvibe/hiiPifGIqSJetmTIPdeTbX0URdO9v8A3GC8sCsj"
+    "YNNY9uBX4kDL0O+CPBmJiRLo0SywnLrGeZ9cV57InYBJMzSm0tKVidrTx1tqpWdaWmznVW"
+    "dmXHggP9xDcDij4xipgbUaq1jI4yjpPGP78OeeO2IjZH2PNKsTlijtl0m0MnHbd1KOvK5g"
+    "iKnLHqY9UzKzCspa2KSi2JeOkXiSZ58qQTJeAedB6HQ6Hf+YoBxPpfGzwMvghDLIif9Jse"
+    "EP58ELpX3ClWJsVh8OvsSX/AauK526OLtU9Me+H18H9dksHxbUC3J3YGj8R++f1JFzq3Az"
+    "C4Bl/4IXEquX2E4WehC1a3PcHP1eZH2OjAw5w0XU01GPUEP5PYGfKjzi3o8EP8JCf4wT73"
+    "usIAiKPBUMAXyLPd8X1+CK57ovjoXjt39eT7Xp/HPy68IdvkqciY5FF73Ud8fzw1RHzh95"
+    "z6rjcNW82L8+UMJD+yJp94z9/dJdUAdhDwDqPt3IBUbxOqdDxrlJzFDlU5dmiVTrZmNhrj"
+    "90HwmzjCyjA6TMc4XGUOe4o4ts1sZL5ANcloUYOqmn4yXJK8yvpaUb14EwqJJ+/KApykZv"
+    "jGYpnhT1+HSDk2LBtgCvnuED6rPrx+Iso6EKcMUZvaXJuA2Z5hoT4zVIrhkg1uhLBGNRQ2"
+    "Aaq/OtE1mFwLW4oSw4B10XlF6FmGlOJOubANUTN4I/DODMe0wBhNDLPwxI3TMmgThWvY6X"
+    "ubcfxmpLZU+AzXSgTWHh3MIa7LIHDKnk84QDx9wyccnr6fkN5qpLxVYaNnJ3vy6dtBKsSP"
+    "mOBC+v580L9+hapP8kUBZwQBJ2OAzWdAPr+CWx8ROrb5kX/zY6oAiYhXG2mFzhmI0+0u8K"
+    "QxG580djK9Nx95MrPMcnAnCBneefB+e3srh3eCcKd4Nw8VbxtBzcOtrCBPGYGVjykg0704"
+    "ACAvitYKjxKyZbTQMlp2xsdJ2VQvgDtZF8sCn6BlyBdAnqyQZZFP0DLk30F+rfDZ94q1BO"
+    "nhOZ1ZZUu17NV1sJ1CLWs5pVwcKQ6pAN90Z1TAxurklmf5oJj7aaPuJ2KRgKK50hEiVosu"
+    "Iok3UYvODQp0A1ygFFTYKBxUGKNnMWdVjjmTFUtTLEvBQBeqDBmn20d9zg9aC0DT/nDEfS"
+    "BKMBEOzQ8HXbSzgH4Uigoibe/XHcpT0amD+xWoNHQoO3yxICrLNjSgaFidWRcud6geGamu"
+    "aLG6c/lw8jeN10SqnhvsZSuqbbKWWg3rpxW003hkKtKsQbHU/JajLFsNrvpUxlpjGaFrZo"
+    "S+INNKPTWcDm2IpIZJ+s2zsxx7SbhX+rngpC0W5jYvtGfnd68hulspt4bvaFOPdEi3XUIk"
+    "rOjaIRVA+PV/poI/bw=="
+)
@@ -0,0 +1,109 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "notesnotify" ADD "next_check_at" TIMESTAMPTZ;
+        CREATE INDEX IF NOT EXISTS "idx_notesnotify_enabled_f4ac99" ON "notesnotify" ("enabled", "next_check_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_notesnotify_enabled_f4ac99";
+        ALTER TABLE "notesnotify" DROP COLUMN "next_check_at";"""
+
+
+MODELS_STATE = (
+    "eJztXetzo7iy/1cof9k9VTlTeWc2depUYYckvpvYKePM7sxkSyWDbHPCw4dHMp6987/fFh"
+    "ibh2AAvzBXH2YqRmoBvxat7lZ36++WYalEdz6IimJ5ptuzXG0sE9fVzInTuhb+bpnYIPBH"
+    "br8joYVns1UvesHFI90nxAGFSSmcKMXIcW2suNBnjHWHwCWVOIqtzVzNMuGq6ek6vWgp0B"
+    "GoVpc8U/uvR5BrTYg7JTY0fP0LLmumSr4RJ/w5e0Vjjehq7DUWT4M0lT6D347c+cxv65ru"
+    "rU9A7zpCiqV7hpkmms3dqWUuqTTTpVcnxCQ2dokaeR/6uAsYwkvBo8MF1/bI8pnV1QWVjL"
+    "Gnu5H3H6HVtRZCvf4QydIQoVYJxBTLpGjDswZcndBH+OfpyfnV+cezy/OP0MV/zOWVqx/B"
+    "rVcIBYQ+Tr1h64ffjl0c9PBBX6HsM3uOACVlSpRXzURjrOmeTdKgty1LJ9hkA587ToIPIx"
+    "ioCiPCCytOrKZjCHvImy2wIgfndr//QEc2HOe/un+hO6S/Lfhsgm+r9/zYlga/nvyDXoZO"
+    "mkuiDMpjiOMpCnGctRkSGYczpDhDDM2wkIud14qMYNJzBlRhQDXRxKTnDCjJgJE3X+cDSJ"
+    "Bz+CvAv8b0T5Bz+EvCr9r4fZ3pn6TnDKjCgDU+gCQ9Z0BxBthEJcSoOP3TxBz60tBXm/hp"
+    "Yg59FUOMOhWMGTarKkA/GYkzZT2mrOuwYI7EmVKcKe9khMgbofcsx4M44Q4hX145KMypq3"
+    "T8GnHj0QsjrLy+Y1tFqRbr1GK6/BY+0jSv+iYZWvCfz6wuvBQ2FdbHsHAw31tzS1yNdVBu"
+    "1R/hVAyvru7vK4oLb3TCnwwYwJuTgCcdUe6IN1LrR4wLcdBpk3FqJK9gE0/8V6YPRx8ldN"
+    "l7rjXEzuuAOMHbpp368R5Hue586EvdHvaq70Yd+V+jM8n3r/gT5K+iDv5Sjv2iDv0FE2s7"
+    "8bbtz1/xIYVtZ4ptNrgxogTG8PDbksLbhNnA35BOzIk7pdge52D6SRx07sXBr6fH/0jI4k"
+    "XLqd8UX/KqKYL7Ufq2L0a3rF9Q9YxKXRVhxqp1A3C5mkHYkCdpE7irC+IP4R/NYsKw+yjJ"
+    "Q/HxKcaJG3Eo0ZZT/+o8cfXXy8R3sBxE+KM7vBfoT+FLvyf5cFqOO7H9O676Db+06DPR9Q"
+    "eZ1jvCahST8HJ4Kcbq2mz67lt+bWCZSKmLBVTAW8sm2sT8ncx3owTW49PZvBr4E2V8cypj"
+    "B0bIiwKJteeqiwr03F7Ux9eWAuoHDEfsBYqeQwLNgj4wVxr3qTQmWVNUb0zSNVB1/FhAc/"
+    "yYqTh+TOqNKrZfEf34SmqOMTquO5bQHT3HtQykGSA+Ger6/8j9XsbcThImNUdNcYX/FXTN"
+    "2drC1/r6V2v34FNIYuCH0/nXR/HP5EzvPPTbST2QDtBms2FmA572nMJs2aUkTQZ9JYmzEN"
+    "11+RDiAidPkoeMuMoUOFdJgaN4tk2o5kLncRrxIfmWsXamCJsAdZ6pJP05zJ/2S0vpod+7"
+    "C7snvwU2+i7BRnUWxKk5H8rzwSXGTAd0SjnFIjS7U2xa09HJtoR+XNCcnRaQNGenmaKGNi"
+    "WcYlMw9m1svpZ1i0Xp+MZbceXGB87xwFDDLrItXS/tkGQOwFlQnAVTbTLV4Z+LnBlRNKwj"
+    "imVZPuSMwplRiRnBnC6l8bOpudq/htrvOQQZZwjbDFdj7gcRJ+SRASU+At+fxtRzJNMzUm"
+    "7dGOwhbY11zNad1JPvu71r4Y6YzlQzha4xw4r7YspDcTAQuw/Xwr1lvmLtWpBdbAsDrOkv"
+    "5n2/97vYDZsWNMKZrb6YX758uRa+EFMnjiN8sUwCP2zrxRz2h9fCkGDbEayxMJwSQ/Mlwv"
+    "4VLeo6Zbrq2tok0xkaIWrSFslvp6dnZ1enx2eXHy/Or64uPh4vvaPppjzjut29ox9TjAk/"
+    "3UgJndhr7qI8h77ww2JB0e2TyNSr1d7JFOv0KyX3sJpb9rzF2j9J9jnK3UMJe08jvTe8j+"
+    "IFQDoEOwBm8GN5Xx6Cs//dFK+0ZN6uVN4DtjsQyjE7OPotFJzNMZomLYhrzutIrHWmIpkR"
+    "UV1/5bGiq+zyvIAGd3meqcHRpoRjOC6wK6rr6VHqvAPbkp+6A/EBie3PsgzK+UyzsS7g0d"
+    "xxXszHfudaeCQGLJpU24Y3s+Dq0/NAQrfdzrDbB4X/ybOJMAYDHMZ7McWnDpLvxZv+H9eC"
+    "OLMUrM/hTorgTLFqvb+Y3cc7NLyXxKE0uBY0Y4JgCcV0r1rHNiA20i3lFbmaqxMwHe67n5"
+    "/RjXQLtoUEjzbV5p4A7wUWBrSKsiw+P4Ax8P37d3hbrOpzhB2HvjQYFuLgBgGbHx6k3h3Q"
+    "TqlasmQMEPf6j+LD52sBm5aBKaU90mCm+aDUwpqgCxlrwTKxPc/ajQ4oknb53A22Sg/rW8"
+    "9bfhZ+jqVZDjC2uz1x8Jm9G9Fm+EXan4eSmFywwDB1URhvWCaeMU7JoxlrHc1ITLUSk6N0"
+    "nMW1ZrGO4UVLKElh/+YpSRcF1qWLzGXpIrkq/Ydq5+ylKduFHyNay3NfM6h37bif4bluYa"
+    "Ydm60WRIgOTTNofde10T9psgCA4hBVoKBQRRSURsHG78JSoxPo9DoSbDLTsUIcYTnlPrT2"
+    "plqslRi4QX+aH6TV9QNVWK60SPNRrhfN77gMeNlVILJn69xztt9idNzjsFhMT46LpKxBr8"
+    "wF1W9LbBvZehrd7PCzRfcmgLvzuD8eUL+jgHq+Fcq3QuvAggPfCr15BKFkmkRnKW6rxly1"
+    "TTWUSLe91AwuKwiaViZ4J/tuOTufXBjvVRjvSXZojmLZqmSMSPxrZLXnS5CgJ1n2rI0Q4a"
+    "bdmqZdWU/eRpx4dRMNu/bi8WIwOykGUxrh5oK76exFm27ZV6r7EqNs4CZaC15Q7Zv6fLFQ"
+    "HMim2mJN40Vg9hDQxdXzvUUoYpemk7LykbIndIRkd8gfl4O91fNAWbfpThktnkpUAZR67Y"
+    "3YcyF8fn9fLLbXVpBmtyWRuPtqI+4rhhzfAKq8ytR+3YO32Db8g8SYORKR1qM8834M/cxV"
+    "P36q2FFTrX1i0tdmaRp5SZ8RKp71XDzhExoMmJqlcp2jNDzDuaSLZS2/K6/DvZOlca3l7g"
+    "4rU5yTFBhrz13yJrTnFpMB3zVnugAlzN2OTKsR3Y6z2TmBX7M6ws9w1L+4j3yXq2aEmcXt"
+    "8wgRt88r2+c2tjV3XmJOrwiahPrGXE1Vsh54xsO+nbOFMh4WqmMZ+b+i4B8L42NJrL4FUU"
+    "1QcWSzkS01W2M0lVCtWfDrxvPCPaMEnIveu5ueJ4cDI3I0sOyQjh2GFZiHaIKQg1ubIlg7"
+    "kqi8ClaNXLlpFh+aVZqzL1bjTZxGOKp2tofjO61kv6xllktLDote/sShtSyOuaUD5RboJT"
+    "Rc5kEhX5fiOtFb18a+tYhmHi1rC2SZXfHbBF3QwgoF+56X6HtWsO+7ZiL6NXCf2259bjVe"
+    "RA7aSEh8fsWxTRNyfFkBRQmZlV6edQtnTd80bQLjMSU+QJRzILzpP7cfJOFpIHW6cnexE7"
+    "h0rPmN8Y3WgSQ+MEA/XwP0cw56NdDP1gD9bH+gH38oGU5XF8yX2kgZsKNEfGoXgZl7KZrv"
+    "peDO/a06KvZjS0ddGQxjOuHpyLamp9Ax4mDZUqnoUFT4Ic68wg2vDd38HPV4XH/ZukJRmj"
+    "qvr8Wh3/IixxWZ5isyimW9aqwzVHMOMFyR1Jm7Gwnj2UYZKRBDb6yspGzJtaJoBOBbL31N"
+    "3jSFlCzSFSNqQnW0BMqXRVBORqBFUL7MQHk8q4ByQNQ8lE/OCqB8cpZd3u8sibJNJouS8l"
+    "VW4RV1nQVHq/9JGsiSKF8L9HiADizJEi3Yr1QqpV9EnGRLk5QwMTXltXQFywhN8yb55gX2"
+    "zBvpmsIwofLyylZEPK2seFqZoRkWMjRTMzwDzSyNFQOSabayiWubxr63bTwV7IQ5UqZEed"
+    "UYsjt3Wqdo+ewuPrv9EHebqIQwgllzYU9QctBLihQfP1pkqiTuaWIOfRXoRx4jz6kg8gta"
+    "fh5vJeRVG79Xhj4k5tiXkfIKPdIBm1WXWCY950AlDtiAc/kwuxQtz8jJA9m1ZppSFeUoMY"
+    "eZEdOIHTcUBJXO9WIOsIF015rh3qRsV59l/ioc1EWtyvX0EJzvh8F30HnXZHt0BM71w+A6"
+    "VbfXZHtsCM732vM98OlUZ3qCnnO89hyPqL5VmZ4egvO9znxXPNsmrK2MXD9AhIpb/yWs/0"
+    "AkEhWgVFmhQ9kFCtOUvEzhGidB+Gm7CKaxY9ml+JAi3AMb/jX2TIUiLIw8TXc10/lAb/vv"
+    "pjAncPLqOlJ0rNE5X2U1yhyEr0d1Xo94Tf6dRobnFLrgBeCL1LdY4/zCxOa77wyDLwleg7"
+    "EitRdD3P4+IDp22bFpC8hFGG4Iow38wRoEfkxS+KeirYlU8ii2JuJEC6KydM0yOCUL/DYR"
+    "J78S/5o49SyXOKvS/02BqVTqYAJR5BAXVNRJDrJhfe8Cki3IDfQRliPjHqS+lj8d6eEQ6G"
+    "dzsjhy8TMpGoJXySzVwKrz3zCVorpsO8rLT/2PY5njsBc/jHPH+vDWslBLR6lvOUVvp9jG"
+    "0zCOi5wGCb2yEzGOU+dB8rNOD+Egjs1VA3ggWCX2yIKBWKI22pwrbfVExw1XAwiLSSzLAY"
+    "QnPDDL6YW937Du8ap0OxbQ7GohxTK5MmqG1CuPS+zcd6VP0qPUG14LYGxp5I0YxHSRPkKu"
+    "5uqEJndJMjQqYMxFL4OIQLeDrtS7ke+7T9cCFedjWyOm6ky1WaSj2P4sy+jm8Q5uMJo7Dl"
+    "KNSaR5eC+JQ2kQdICPBDCxY11aFZYTnlnPM+vL8zgQsSkm55TaWlLwOltF6mzVrepKQ53r"
+    "vOzKjgUH+QY3Q5o5tsqYG3GqtYyOKo6T1t8/DnnjtiY2R9TzyrA5Eo7ZbJvDpB23dSjryu"
+    "YIi5yl7Y3IoZ8mzMwgPB5hl5scdTA5ANbKFketlktQC2SqZZ68mFRBeESd58FA6nU+A4Cg"
+    "G7bRU/8PaQBC+sW86yLpzyfp5lo4B0VTHoS/Ll7MJ1AhL/0eN6CZAu1V0GPx6yMdHG6Dbr"
+    "pyp/9MbZvfXkypc99H/Vv0hzigDie/jzT4JN2g1W1P4Lna4hAMEhjm5NTXYsNRT+CZ5M5A"
+    "HHbuUUccwJOcwIN96t5IfSQP+wMJLtBnexB74gDddmX52b926evQj92eCD+ugiHb9KnomP"
+    "RRuzfPcH+YGjJc+K2gLhxMw7PTq8vlDKQ/8iaf/Cg+PKRVBH5I8A4j8fxg1WCDqnKsa5yc"
+    "xxXVOa5olWq2ZqYa5/dB8Js6yaowOkrHOVxnDgdKOthtLrHfsJ5mtGxgXc8+NS5NXmd9ra"
+    "xevAmFJJB3VQFOU3N8E3HO+NtCh8g4UiwfYAb57hC+qD+8iySVdSDOGKIxdbs2AbM7BaE+"
+    "tXSG4ZIPboywQfUVNgHqYnViazCFFrYMJYYD66PzTsirihmFnwphG6Hm8MbgnVqe7aARGV"
+    "t26YmbpOXQpora8JP5Nl/FJu5lT0Gbby6miA/GZmxJ2NY1MHcF+lg04kMIpJugYFMYEUGl"
+    "T9Gj8QIGwaZDf0OP9w9Jv+haAzXMPs1Jp6rxucG1COY+OpiDg5eJB4x9xmhSQvYmYzQlYj"
+    "9h5PVIs6zDBuJO4kCytxl1DI+Y4kJ2TEjYv3nF0U+KRZ7nBJ6n487tV0Q/v5JbajE6vqlW"
+    "fFNtoiGFileXGKXOtkjS7S7YqTUdnbR2Mr03H+00dexqcKcIOd5F8P7+/Xs1vFOEO8X79F"
+    "Dxdgk2AtyqCvKMEXjJohIyPYgvQeq8bH36OCFfRksto1VnfJKUT/USuNN1sSrwKVqOfAnk"
+    "6QpZFfkULUf+J8ivFbL9swJBYUmCgs6squWB9uo62E5xoLWcUj6ODIdUiG+2MypkY33qGe"
+    "T5oLj7aaPuJ2qRoLL5+TEiXv8wJok3Uf/QDzb1A6ewElZ1KR2smqA/mH2p/5exjKrmGJrj"
+    "aAB0qWqkSbp91IT9xThD2HZ/ORJ+oUowFQ6nvxx0odgS+lEk2oy2/bzWVZEqYh3oV6K61a"
+    "Hs8CWC8xzXMpBmgDqzLlz+UF06UlPR4rUOi+G02DReE6lmbrBXreK3yfp9DazZV9JOE4mt"
+    "KdMWw1JbtBzl2Wp41ac21hrPNF4z0/iN2E7mSfVsaCMkDSwMcXpxUWAvCXpln0VP2xLhk7"
+    "NSe3aL7g1Edysl/uCOLvMYkWzbJULCC/0dUtGNH/8HrogK9g=="
+)
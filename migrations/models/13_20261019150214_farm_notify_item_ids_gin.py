@@ -0,0 +1,114 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_farmnotify_item_ids" ON "farmnotify" USING GIN ("item_ids");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_farmnotify_item_ids";"""
+
+
+MODELS_STATE = (
+    "eJztXXlv4ziy/yqC/5lZINtInKsnWCygOEriN4kd2E7PdHcGBC3RtjY6vDqSds/r7/6KOm"
+    "wdlFqSL1mPwPQgFlmU9CuqWFWsKv7d0k2FaPYHUZZN13B6pqNOhsRxVGNqt66Ev1sG1gn8"
+    "kdvvSGjh+XzVi15w8FjzCLFPYVAKO0oxth0Lyw70mWDNJnBJIbZsqXNHNQ24ariaRi+aMn"
+    "QEqtUl11D/6xLkmFPizIgFDV//gsuqoZBvxA5/zl/RRCWaEnuN4GmQqtBn8NqRs5h7bV3D"
+    "ufUI6F3HSDY1VzfSRPOFMzONJZVqOPTqlBjEwg5RIu9DHzeAIbzkPzpccCyXLJ9ZWV1QyA"
+    "S7mhN5/zFaXWsh1OuP0FAaIdQqgZhsGhRteFafq1P6CP9sn5xdnn08vTj7CF28x1xeufzh"
+    "33qFkE/o4dQbtX547djBfg8P9BXKHrMXCFCSZ0R+VQ00warmWiQN+rVpagQbbOBzx0nwYQ"
+    "wDVWFEeGHFidV0DGEPebMFVuTgfN3vP9CRddv+r+Zd6I7obxM+G//b6j0/XkuDX0/+QS9D"
+    "J9UhUQblMcR2ZZnY9toMiYzDGVKcIbqqm8jB9mtFRjDpOQOqMKCaaGLScwaUZMDYXazzAS"
+    "TIOfwV4F9j+ifIOfwl4Vcs/L7O9E/ScwZUYcAaH0CSnjOgOAMsohCiV5z+aWIOfWnoq038"
+    "NDGHvoohRp0K+hwbVRWgn4zEmbIeU9Z1WDBH4kwpzpR3MkbkjdB7luNBnHCHkC+vHBTm1F"
+    "U6eY248eiFMZZf37GloFSL2TaZLr/AR5rmVd8gIxP+5zGrCy+FDZn1MQQO5ntzYYqrsQ7K"
+    "rfojnIrh1dX9PUUx8EYn/MmAAbw58XnSEYcd8UZq/YhxIQ46bdLbevIKNvDUe2X6cPRRQp"
+    "e965gjbL8OiO2/bdqpH+9xlOvOh77U7WGt+m7Ukf81OpM8/4o3Qf4q6uAv5dgv6tAPmFjb"
+    "ibdtf/6KDylsOzNsscGNESUwhofflhTeJsw6/oY0YkydGcX2OAfTT+Kgcy8Ofm0f/yMhi4"
+    "OWttcUX/KqKYL7Ufq2L0a3rF9Q9YxKXQVhxqp1A3A5qk7YkCdpE7grAfGH8I9mMWHUfZSG"
+    "I/HxKcaJG3Ek0Za2d3WRuPrrReI7WA4i/NEd3Qv0p/Cl35M8OE3bmVreHVf9Rl9a9Jno+o"
+    "MM8x1hJYpJeDm8FGN1bTZ99y2/NrBMpNTFAirgrWkRdWr8Tha7UQLr8elsXg38iTK+OZWx"
+    "AyPkRYHE2nPVRRl6bi/q42tLBvUDhiNWgKJrE1+zoA/MlcZ9Ko1J1hTVG5N0DVQdPxbQHD"
+    "9mKo4fk3qjgq1XRD++kppjjI7rjiV0R9d2TB2pOohPhrr+P8N+L2NuJwmTmqMqO8L/Cppq"
+    "b23ha339q7V78CkkMfDD6fzro/hncqZ3HvrXST2QDnDNZsPcAjytBYXZtEpJmgz6ShInEN"
+    "11+RDiAidPkoeMuMwUOJdJgSO7lkWo5kLncRrxEfmWsXamCJsAdZ6pJP05yp/2S0vpod+7"
+    "C7snvwU2+g7BenUWxKk5H8rzwSH6XAN0SjnFIjS7U2xas/HJtoR+XNCctgtImtN2pqihTQ"
+    "mn2AyMfQsbr2XdYlE6vvFWXLnxgLNdMNSwgyxT00o7JJkDcBYUZ8FMnc40+Ocge05kFWuI"
+    "YlmWDzmjcGZUYoY/p0tp/Gxqrvavofa7NkH6KcIWw9WY+0HECXlkQImPwPOnMfUcyXD1lF"
+    "s3BntIW2Mds3Un9Yb33d6VcEcMe6YaQlefY9l5MYYjcTAQuw9Xwr1pvGL1Shg62BIGWNVe"
+    "jPt+73exGzYFNMKppbwYX758uRK+EEMjti18MQ0CPyzzxRj1R1fCiGDLFsyJMJoRXfUkwv"
+    "4VLeo6ZbrqrtVppjM0QtSkLZLf2u3T08v28enFx/Ozy8vzj8dL72i6Kc+4vu7e0Y8pxoSf"
+    "bqSETuw1d1GeQ1/4YbGg6PZJZOrVau9khjX6lZJ7WM1Na9Fi7Z8k+xzl7qGEvWeR3hveR3"
+    "F9IG2CbQDT/7G8Lw/B2f9uiltaMm9XKu8B2x0I5ZgdHP0WCs7mGE2TFsQ153Uk1jpTkcyI"
+    "qK6/8ljRVXZxVkCDuzjL1OBoU8IxHBfYFdX19Ch13oFtDZ+6A/EBidefh0NQzueqhTUBjx"
+    "e2/WI89jtXwiPRYdGk2ja8mQlXn54HErrtdkbdPij8T65FhAkY4DDeiyE+ddDwXrzp/3El"
+    "iHNTxtoC7iQL9gwr5vuL0X28Q6N7SRxJgytB1acIllBM96o1bAFiY82UX5GjOhoB0+G++/"
+    "kZ3Ui3YFtI8GgzdeEK8F5gYUCrOByKzw9gDHz//h3eFivaAmHbpi8NhoU4uEHA5ocHqXcH"
+    "tDOqliwZA8S9/qP48PlKwIapY0ppjVWYaR4otbAm6ELGWrAMbC2ydqN9iqRdvnD8rdLD+t"
+    "bzlp/Az7E0ywHG625PHHxm70ZcM/wi159HkphcsMAwdVAYb1gmnjFOyaMZax3NSAylEpOj"
+    "dJzFtWaxhuFFSyhJYf/mKUnnBdal88xl6Ty5Kv2HaufspSnbhR8jWstzXzOod+24n+OFZm"
+    "KmHZutFkSIDk0zaH3X1PE/abIAgGITRaCgUEUUlEbBwu/CUqMT6PQ6Eiwy17BMbGE55T60"
+    "9qZarJUYuEF/mhek1fUCVViutEjzUa4Xzeu4DHjZVSCya2ncc7bfYnTc4xAspifHRVLWoF"
+    "fmguq1JbaNLC2Nbnb4WdC9CeDuPO6PB9TvKKCeb4XyrdA6sODAt0JvHkEoGQbRWIrbqjFX"
+    "bVN0OdJtLzWDywqCppUJ3sm+W87OJxfGexXGe5Idqi2bliLpYxL/Glnt+RLE70mWPWsjRL"
+    "hpt6ZpV9aTtxEnXt1Ew669eLwYzE6KwZRGuLngbjp70aJb9pXqvsQoG7iJ1oIXVPqGtggW"
+    "igPZVAvWNF4EZg8BXVw931uEInZoOikrHyl7QkdIdof8cTnYWz0XlHWL7pTR4qlEEUCpV9"
+    "+ItRDC5/f2xWJ7bQVpdlsSibuvNuK+YsjxDaDKq0zt1z14iy3dO0iMmSMRaT3KM+8n0M9Y"
+    "9eOnih011donBn1tlqaRl/QZoeJZz8UTPqFBh6lZKtc5SsMznEu6WNbyu/I63DtZGtda7u"
+    "6wPMM5SYGx9twlb0p7bjEZ8F21ZwEoYe52ZFqN6Xacxc4J/JrVEX6Go/7FfeS7XDUjzCxu"
+    "n0eIuH1e2T63sKU6ixJzekXQJNQ35mqqkvXAMx727ZwtlPEQqI5l5P+Kgn8sjI8lsfoWRD"
+    "VBxZHNRrbUbI3RVEK1ZsGvG88Ld/UScAa9dzc9Tw4HRmSrYNkhDdsMKzAP0QQhB7c2RbB2"
+    "JFF5FawauXLTLD40qzRnX6zGmziNcFTtbA/Hc1oNvbKWWS6tYVj08icOrWVxzC0dKBegl9"
+    "BwmQeFfF2K60RvTZ141iKau7SsLZBldsVvU3ROCysU7HtWou9pwb7vqoHo18B9brv1udV4"
+    "ETloIyHx+RXHNk3I8WUFFCVkVnp51kycNX3TtAmMJ5T4AFHOgfCm/3z9IAlPA6nTHXaDnc"
+    "ClY81rjG+0DiTxgQH62Rqgn3HQq4F+ugbop/sD/fhDyXC6umC+1EbKgB0l4lO7CMzcS9F8"
+    "LwV37m/VUbEfWzrqymAY0wlPR7Y1PYOOEQfLlkpFh6LCC3HmFW54bejm56jH4/rL1hWK0t"
+    "R5fS0O/ZYXOa7INF+RkU3zVWWdoZpzgOGKpM7c3UgYzzbKSIEYemNlJWVLrhVFIwDfeulr"
+    "8qbKpGSRrhhRE6qjJVC+KIJyMgItgvJFBsqTeQWUfaLmoXxyWgDlk9Ps8n6nSZQtMg1Kyl"
+    "dZhVfUdRYcrf4naTCUxOGVQI8H6MCSLNGC/XKlUvpFxEm2NEkJE0OVX0tXsIzQNG+Sb15g"
+    "z92xpsoMEyovr2xFxNPKiqeV6apuIl01VN3V0dxUWTEgmWYrm7i2aex728ZTwE5YIHlG5F"
+    "eVIbtzp3WKls/u4rPbC3G3iEIII5g1F/YEJQe9pEjx8KNFpkrinibm0FeBfuwy8pwKIh/Q"
+    "8vN4KyGvWPi9MvQhMce+jJSX6ZEO2Ki6xDLpOQcqccACnMuH2aVoeUZOHsiOOVflqihHiT"
+    "nMjJhGbDuhIKh0rhdzgA2ku9YM9yZlu3os81Zhvy5qVa6nh+B8Pwy+g867JtujI3CuHwbX"
+    "qbq9JttjQ3C+157vvk+nOtMT9Jzjted4RPWtyvT0EJzvdea77FoWYW1l5PoBIlTc+i9h/f"
+    "sikSgApcIKHcouUJim5GUK1zgJwkvbRTCNbdMqxYcU4R7Y8K+Ja8gUYWHsqpqjGvYHett/"
+    "N4U5vpNX05CsYZXO+SqrUeYgfD2q83rEa/LvNDI8p9AFLwBfpL7FGucXJjbfPWcYfEnwGo"
+    "wV6ToY4vb3AdGww45NCyAXYbgRjDbwBmsQ+DFJ4Z2KtiZSyaPYmogTLYjK0jXL4JQs8NtE"
+    "nLxK/Gvi1DMdYq9K/zcRJl9MuQaiVSzXhMsTUq7RdfzQoXrA1RINIchBFBxTmFumTHNSVL"
+    "gK/4FoFSgEAkCQPsmlOOmL8WIM5RlRXI1YgkXmmipjW/CUVcGDVnhXnZlAvs1VOroAxrhN"
+    "7CPBNgVMRxBkGHNMBBsoHfjDeScExnRmRIe7KQL8EYxjToBCtjCIASW8k4AtIsxV+RUuuX"
+    "MBT4HdggkLOaVTLf9u/s0J8/SZzLlSKs008fUhmzhgzkxzplVYC77AKugzwvsah5FxD1K3"
+    "z/8m6UEi6Gfyqzhy8fNLGoJXyYxm3wPgvWEqnXnZdpSXy/wf2zQmYS9+cOuObaetZSyXzm"
+    "jYcjrnTrGNp+wcFzk5FHplJ+0cp84O5efiHsKhLZurHPFAsEKssQkDsURttDlX2mqJjhuu"
+    "HBEWHlmWjghPA2GWXgx7v2HN5RUMdyyg2ZVlimX9ZdSXqVfOn9i570qfpEepN7oCc2Omkj"
+    "eiE8NB2hg5qqMRmggoDaER7As7ehlEBLoddKXezfC++3QlUHE+sVRiKPZMnUc6itefh0N0"
+    "83gHNxgvbBsp+jTSPLqXxJE08DvARwKYWLEuScNoP8lxvApD86sw+CI2xeScsmxLCl6TrU"
+    "hNtrpV6GnoRgwv0bNjwUG+wc2QakzMMuZGnGoto6OK46T1949D3uSvic0R9dIzbI6EEz/b"
+    "5jBox20d4LuyOcKCeGl7I3JArAEz00+lQNjhJkcdTA6AtbLFUavlEtSCIdUyT14MqiA8os"
+    "7zYCD1Op8BQNANr9FT/w9pAEL6xbjrIunPJ+nmSjgDRXM4CH+dvxhPoEJeeD1uQDMF2ku/"
+    "R/DrIx0cboNuusNO/5naNr+9GFLnvo/6t+gPcUAdTl4fafBJukGr257Ac12LIzBIYJiTtq"
+    "fFhqOewDMNOwNx1LlHHXEAT3ICD/apeyP10XDUH0hwgT7bg9gTB+i2Oxw+e9cuPB36sdsT"
+    "4celP+Q1fSo6Jn3U7s0z3B+mxhAu/FZQF/an4Wn78mI5A+mPvMk3fBQfHtIqAj9QeodRm1"
+    "5gs79BVTkuOk7OY9DqHIO2SktcM6uR8/sg+E2dZFUYHaXjHK4zh30lHew2h1hvWEszeqhj"
+    "Tcs+YTBNXmd9raxevAmFxJd3VQFOU3N8EzHx+FugQ2QcP5cPMIN8dwif1x/eIKFpHYgzhm"
+    "hMjbdNwOzMQKjPTI1huOSDGyNsUC2OTYAarE5sDabQwpahxHBgPXTeCXlVMKNIWCFsI9Qc"
+    "3hi8M9O1bDQmE9MqPXGTtBzaVAEkforj5isexb3sKWjzzcUU8cHYjC0JW5oK5q5AH8sLLf"
+    "elWxiErtCn6NF4AZ1gw6a/ocd7OkB+nYEaZp/mpN7V+IzpWgRzHx3MIdPLxAPGPmM0KSF7"
+    "kzGaErGfMPJ6pOTWYQNxJ3Eg2duMGoZHTHEhOyYk7N+8QvonxSLPcwLP03Hn1iuin1/JLb"
+    "UYHd9UK76pNlWRTMWrQ/RS56Ak6XYX7NSajU9aO5nem492mtlWNbhThBzvInh///69Gt4p"
+    "wp3i3T5UvB2CdR+3qoI8YwRe3qqETPfjS5CyKHuWQZyQL6OlltGqMz5Jyqd6CdzpulgV+B"
+    "QtR74E8nSFrIp8ipYj/xPk1wrZ/lkxqbAkQUFnVtVSUnt1HWynkNRaTikPR4ZDKsQ32xkV"
+    "srE+9QzyfFDc/bRR9xO1SFDZ/PwYEa+VGZPEm6iV6QWbeoFTWA6rupQOVk3QH8y+1P/LWE"
+    "ZFtXXVtlUAulTl2iTdPuoH/6KfImw5vxwJv1AlmAqH9i8HXVS4hH4UiTajbT+vdVWkhFoH"
+    "+pWobnUoO3yJ4DzbMXWk6qDOrAuXN1SXjtRUtHhdzGI4BZvGayLVzA32qlX8Nlm/r4E1+0"
+    "raaSKxVHnWYlhqQctRnq2GV31qY63xTOM1M43fiGUztfzsHaUISQMLQ7TPzwvsJUGvzM0k"
+    "ry0RPjkvtWcXdG8gulsp8Qd3dJhHzmTbLhESXujvMItuRGs9M1a0RCno7GUtVn+60OrGCz"
+    "ozCzoza454wPoVFDOrjvindgZ1K2wHO65dsuDIJpy2B6IJ7Nlnu+Jn0cVsRdHA9ezirMBy"
+    "dnGWuZrRpkTgSfRjKIpxjKiBMLeLaA3tbKWhndIZAjFTAuMVxQ4jqObEUFQ/6Hb7KOdJix"
+    "Dky0yML5MQeyuEgsaMRLecEOMoUfPijDcvLzzAULAOV0giYtHz/Zo679fIFq2Pq1TgdZxy"
+    "A1yu3aoBL6j0DW3RWvpnD4HtwceSy3Wegbk5hxjPlGtsptyP/wPIC/2D"
+)
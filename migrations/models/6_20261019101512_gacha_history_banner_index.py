@@ -0,0 +1,103 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_gachahistor_account_e21029" ON "gachahistory" ("account_id", "banner_type", "wish_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_gachahistor_account_e21029";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf2kXyBWJ89zgcIBsK4lvHTuwnHbTpiBoiba10cOrR1J3r//7kXrYel"
+    "CKJL9kgR9axCKHkn5DDWeGM8N/GpohI9X6xEuS4eh237CViYhsW9GnVuOa+6ehQw3hPzL7"
+    "HXENOJ+vepELNhyrLiH0KHRCYYUpxpZtQsnGfSZQtRC+JCNLMpW5rRg6vqo7qkouGhLuiK"
+    "lWlxxd+dtBwDamyJ4hEzd8+44vK7qMfiAr+Dl/ARMFqXLkNfynAYpMnsFtB/Zi7rZ1dfvG"
+    "JSB3HQPJUB1NTxLNF/bM0JdUim6Tq1OkIxPaSA69D3lcH4bgkvfo+IJtOmj5zPLqgowm0F"
+    "Ht0PuPwepaA4D+YAREYQRAowBikqETtPGzelydkkf4V/Pk7PLs6vTi7Ap3cR9zeeXyl3fr"
+    "FUIeoYtTf9T45bZDG3o9XNBXKLvMXgCMkjRD0ouigwlUVMdESdBbhqEiqNOBzxwnxocxHq"
+    "gMI4ILK06spmMAe8CbLbAiA+fWYNAjI2uW9bfqXuiOyG8Dfzbet9V/vG8Jw48nv5HLuJNi"
+    "ozCDshhiOZKELGtthoTGYQzJzxBN0QxgQ+ulJCOo9IwBZRhQTjRR6RkDCjJg7CzW+QBi5A"
+    "z+EvCvMf1j5Az+gvDLJnxbZ/rH6RkDyjBgjQ8gTs8YkJ8BJpIR0kpO/yQxg74w9OUmfpKY"
+    "QV/GECNOBW0O9bIK0DsjMaasx5R1HRbUkRhT8jPlDY0BekXknsV4ECXcIeTLKweFOXGVTl"
+    "5CbjxyYQyllzdoyiDRYjQNqsvP95EmeTXQ0cjA/7nM6uKXgrpE+xh8B/OdsTD41VgH5Vb9"
+    "FUzF4Orq/q6i6HujY/5kjAF+c+TxpM2Lbb4jNH5FuBAFnTRpTS1+Bepw6r4yeTjyKIHL3r"
+    "GNEbRehsjy3jbp1I/2OMp05+O+xO1hrvpu1JH/LTyTXP+KO0G+53XwF3Ls53Xo+0ys7MTb"
+    "tj9/xYcEtu0ZNOngRohiGOOH35YU3ibMGvwBVKRP7RnB9jgD08/8sH3HDz82j3+LyWK/pe"
+    "k2RZe8corgfpS+7YvRLesXRD0jUlcGkLJqdTBctqIhOuRx2hjusk/8KfijXkwYde8FccTf"
+    "P0Q40eFHAmlpulcXsasfL2LfwXIQ7kt3dMeRn9zXQV9w4TQse2q6d1z1G31tkGci6w/QjT"
+    "cA5TAmweXgUoTVldn03bf82sAykVAXc6iAN4aJlKn+B1rsRgmsxqezeTXwHWV8cypjG4+Q"
+    "FQUSac9UFyXcc3tRH98aElY/8HDI9FF0LORpFuSBmdK4T6Uxzpq8emOcroaq41UOzfEqVX"
+    "G8iuuNMjRfAPn4CmqOETqmOxbQHR3LNjSgaFh8UtT1/4qDfsrcjhPGNUdFsrn/capibW3h"
+    "a3z73tg9+ASSCPjBdP54z/8Zn+nt3qAV1wPJAC06G+YmxtNcEJgNs5CkSaEvJXF80V2VDy"
+    "EqcLIkecCIy1SBcxkXOJJjmohoLmQeJxEfoR8pa2eCsA5QZ5lKwp+j7Gm/tJR6g/5t0D3+"
+    "LdDRtxHUyrMgSs34UJwPNtLmKkankFMsRLM7xaYxG59sS+hHBc1pM4ekOW2mihrSFHOKzb"
+    "Cxb0L9pahbLEzHNt7yKzcucJaDDTVoA9NQ1cIOSeoAjAX5WTBTpjMV/7OBNUeSAlVAsCzK"
+    "h4xRGDNKMcOb04U0fjo1U/vXUPsdCwHtFECT4mrM/CCihCwyoMBH4PrTqHqOoDtawq0bgT"
+    "2grbCO2bgV+uJdt3/N3SLdmik619XmULKfdXHED4d8t3fN3Rn6C1SuOdGGJjeEivqs3w36"
+    "f/DdoMmn4U5N+Vn/+vXrNfcV6SqyLO6roSP8wzSe9dFgdM2NEDQtzphwoxnSFFci7F/RIq"
+    "5TqquupUxTnaEhojptkfzebJ6eXjaPTy+uzs8uL8+vjpfe0WRTlnHd6t6SjynChHc3UgIn"
+    "9pq7KI+BL/ywWJB3+yQ09Sq1dzKDKvlK0R1ezQ1z0aDtn8T7HGXuoQS9Z6HeG95HcTwgLQ"
+    "QtDKb3Y3lfFoKz/90Up7Bk3q5U3gO2OxDKETs4/C3knM0RmjotiGvO61CsdaoimRJRXX3l"
+    "saSr7OIshwZ3cZaqwZGmmGM4KrBLquvJUaq8A9sQH7pDvgf41pMoYuV8rphQ5eB4YVnP+v"
+    "2gfc3dIw0vmkTbxm9m4KsPj0MB3HTbo+4AK/wPjom4CTbA8XjPOv/QBuId3xl8ueb4uSFB"
+    "dYHvJHHWDMrG27Pevb8FozuBHwnDa07RpgAvoZDsVavQxIiNVUN6AbZiqwibDnfdp0fQEW"
+    "6wbSHgR5spC4fD74UtDNzKiyL/2MPGwM+fP/HbQlldAGhZ5KWxYcEPOwCzudcT+reYdkbU"
+    "kiVjMHF/cM/3nq45qBsaJJTmWMEzzQWlEtYEWchoC5YOzUXabrRHEbfLF7a3VXpY33rW8u"
+    "P7OZZmOYax1e3zwyf6bkSL4hdpPY0EPr5gYcPUBkG8YZF4xigli2asdDQj0uVSTA7TMRZX"
+    "msUqxC9aQEkK+tdPSTrPsS6dpy5L5/FV6S+indOXpnQXfoRoLc99xaDeheN+rfSyDXpl3F"
+    "CfrhvuQHPIhJqPMn0xbsdl2MSuwlkdU2X+l/2WNGN2qy+ST47zJD7hXqli2W2LbT6YahLd"
+    "9CAmv3sdwN159BgLy95RWDbbUGMbalVgwYFvqHXusVDSdaTSFLdVY6baJmtSqNteKs8WFQ"
+    "R1Kza7k92bjP0zJoz3Koz3JDsUSzJMWdDGKPo10tqzJYjXEy17VkaIMNNuTdOuqD9oI66g"
+    "qomGXQdxspIiOykpUhjh+oK76Rw4k2z8lqoeEqGs4VZMA7+gPNDVhb9QHMjWjL+msVIiew"
+    "gLYuo585VUgQUb85VQhMYGUGWFcfbri7qBpuaefUQN6w61HmXZkhPcT1/1YwchHdXVtEQ6"
+    "eW3aspaVpxaiYoma+XPUcIOGp2ah9MwwDUvK3GVsBysdvJOlca3l7hZKM5iRxxRpz1zypq"
+    "TnFvOX3hRr5oMSpJuGptWY7P2Y9DSmb2kd8c9g1O/MIbvLVTPEzPzGYIiIGYOlk55MaCr2"
+    "osCcXhHUCfWN+TXKBGqzIO19ewJzBWn7qmMR+b+iYB8L5WOJrb45UY1RMWTTkS00WyM0pV"
+    "CtWKTlxlNZHa0AnH7v3U3Pk8OBEVgKtuyACi2KFZiFaIyQgVuZuj07kqiscE+FXLlJFh+a"
+    "VZqxL1bhTZxaOKp2tofjOq1EtxJfmktLDOr0vePQWtbz29IZWD56MQ2XnW2wdw9VhUXuQa"
+    "vUqjJxXRtg7lDrzqZimyRk+FLwha9TcE6qPaQBfKMaMG36JmljGE8I8QGinAFhZ/DY6gnc"
+    "w1Bod8Wuv2+2dEO5jdFtyaHA9yign60B+hkDvRzop2uAfro/0I8/HR8m5m+KDkxqQfwMsM"
+    "NEbGrngZnZ9PW36ZkrfKtm/X4sz7DhTzE9Y36BdNtzhjuG3BFbqgUbiAo3IJiZm6z4a/3T"
+    "h6NR8EVLvoRpqry+5od+y4scU2Tqr8hIhvGi0A5JzDihbEVSZe5uJOhlGxV+sBh6peXwpE"
+    "uuFUUtAN96bVv0qkioYP2kCFEdClfFUL7Ig3I8XiuE8kUKypN5CZQ9ovqhfHKaA+WT0/TK"
+    "a6dxlE009WtGl1mFV9RVFhyNwWdhKAq8eM2R+t9tvCQLpCK3VKpWdh5xki5NEsJEV6SXws"
+    "UFQzT1m+SbF9hzZ6wqEsWEysrCWhGxJKz8SViaohlAU3RFczQwNxRaxESq2Uon3p0ba1t+"
+    "901v48nYTlgAaYakF4Uiu9859D1Gy2Z3/tntBoSbSEaIEvqZCXuMkoFeUKS4+JH6PwVxTx"
+    "Iz6MtAP3YoWUE5kfdp2YGbpZCXTfhWGvqAmGFfRMpLkqHNoV52iaXSMw6U4oCJcS4eZpeg"
+    "ZfkrWSDbxlyRyqIcJmYwU2IaoWUHgqDUwT3UATaQHFox3OuUG+qyzF2FvZKVZbmeHILx/T"
+    "D4jnXeNdkeHoFx/TC4TtTtNdkeGYLxvfJ893w65Zkeo2ccrzzHQ6pvWaYnh2B8rzLfJcc0"
+    "EW0rI9MPEKJi1n8B698TiUjGUMq00KH0cn5JSlbUb40i/W6SK8DT2DLMQnxIEO6BDf+eOL"
+    "p7qjc3dhTVVnTrE7ntf+rCHM/Jq6pAUqFC5nyZ1Sh1ELYeVXk9YuXSWbn0KrAgbzWINY6W"
+    "i22+u84w/CXh16CsSC1/iJs/hkiFNj02zYecx8ON8GhDd7AagR+RFO6BVWsiFT8lq444kf"
+    "KhNF2zCE7xcrh1xMmtW78mTn3DRtaqUH5dYCqUOhhDFFjIxirqNAPZoBp2Dsnm5Qa6CIuh"
+    "cQ9SX8uejuQoBfDenMyPXPQEh5rgVTBL1bPq3DdMpKgu246y8lP/sgx9EvRi5yTuWB/eWh"
+    "Zq4Sj1Lafo7RTbaBrGcZ6D+txj7o9SEjGOE0f1sWMoD+HYis1VA+ghKCNzbOCBaKI23Jwp"
+    "bdVYxw1XAwiKSSzLAQTnITA5vCc5TC8Kki9hK6U0SLXStfj2XVf4LNwL/dE1h20qBb0iDe"
+    "k2UMfAVmwVkRwuQcSNErbZwpexJAA3w67Q74h33YdrjkjtiakgXbZmyjzUkW89iSLo3N/i"
+    "G4wXlgVkbRpqHt0J/EgYeh3wt4AxMSNdGiVWDZZAzxLoi/P4FapOsYpaSwpWTitPOa2qFV"
+    "epqQ89esqMTsnjyThjRqdl7hw04hs9OZdVqtmyEEY/8M2Aok+MIhZalGotO62Mr6nxz69D"
+    "3uuuiJkWdlZTzLSYLzvdTNNJx22d+roy04K6cMxEq56JhmEtbaFVarHDapRItPKTZ50oVP"
+    "eg/TgcCv32EwYQ69It8DD4IgyxIH7Wb7tA+PNB6FxzZ1gxF4fBr/Nn/QGr3Bdujw7W5DHt"
+    "pdfD/3VFBse3AZ2u2B48Elvw92ddaN8NwOAGfOGHxA/n9hGGn4UOWN32BD9Xix9hAw4Pc9"
+    "J0tf5g1BP8TGJ7yI/ad6DND/GTnOAH+9ztCAMgjgZDAV8gz9bj+/wQ3HRF8dG9duHaHPfd"
+    "Po9/XHpDtshTkTHJo3Y7j/j+eGqI+MLvOW0HbxqeNi8vljOQ/MiafOI93+sl1QB20vAOAx"
+    "TdGF5v3650CHCUnIVbVTncapWBt2YCH+P3QfCbOBXLMDpMxzhcZQ57iji2zWxkvkI1yWhR"
+    "g6qafvRckrzK+lpRvXgTCokn78oCnKRm+MbCv+EPX4dIOZcsG2AK+e4QPq8+vH7uzjoQpw"
+    "xRm3Jmm4DZnmGhPjNUiuGSDW6EsEZlJzYBqr860TWYXAtbihLDgHXReUPoRYaUeli5sA1R"
+    "M3gj8M4Mx7TAGE0Ms/DEjdMyaBO1ftiBhZtx/GZkA1X4kNhKxCIfHcwpscu4ecqeTzimPn"
+    "3DJxzRv58o6GpkCVZho2cn8Q3p20EqxI+Y4EL6/nzQv361vU/yBU5nxE0nw6bNF0A+v4Jb"
+    "HxE6tvmRf/NjqgCJiFcbaYWOZojT7S7wpDEbnzR2Mr03H3kys8xycCcIGd558P7582c5vB"
+    "OEO8W7eah42whqHm5lBXnKCKziTgGZ7sUBAHlRtLx6lJAto4WW0bIzPk7KpnoB3Mm6WBb4"
+    "BC1DvgDyZIUsi3yCliH/DvJrhc++V98myKjP6cwqW91mr66D7dS2Wcsp5eJIcUgF+KY7ow"
+    "I2VicdP8sHxdxPG3U/EYsEFE0vjxCx8n0RSbyJ8n1uUKAb4AKloChJ4aDCGD2LOatyzJms"
+    "WJpiWQoGulAxzTjdPkqaftBOATTtD0fcB6IEE+HQ/HDQdU4L6EehqCDS9n6ppjxFsNq4X4"
+    "HiTIeywxcLorJsQwOKhtWZdeFyh+qSkeqKFivVlw8nf9N4TaTqucFetgjdJsvP1bDkXEE7"
+    "jUemIs0aFEvNbznKstXgqk9lrDWWEbpmRugrMq3Ug9bp0IZIapik3zw/z7GXhHulH6VO2m"
+    "JhbvNCe3Z+9xqiu5UKdfiONvUUjHTbJUTC6tQdUgGEX/8H1oZJtw=="
+)
@@ -0,0 +1,112 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_gachastats_game_505723" ON "gachastats" ("game", "banner_type", "lifetime_pulls");
+        CREATE INDEX IF NOT EXISTS "idx_gachastats_game_94c2dc" ON "gachastats" ("game", "banner_type", "avg_5star_pulls");
+        CREATE INDEX IF NOT EXISTS "idx_gachastats_game_f1f7fa" ON "gachastats" ("game", "banner_type", "avg_4star_pulls");
+        CREATE INDEX IF NOT EXISTS "idx_gachastats_game_89a478" ON "gachastats" ("game", "banner_type", "avg_3star_pulls");
+        CREATE INDEX IF NOT EXISTS "idx_gachastats_game_6729bd" ON "gachastats" ("game", "banner_type", "win_rate");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_gachastats_game_505723";
+        DROP INDEX IF EXISTS "idx_gachastats_game_94c2dc";
+        DROP INDEX IF EXISTS "idx_gachastats_game_f1f7fa";
+        DROP INDEX IF EXISTS "idx_gachastats_game_89a478";
+        DROP INDEX IF EXISTS "idx_gachastats_game_6729bd";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf2kXyBWJndcGhwNkW0l8m9iB5bSbNgVBS7StjR5ePZK6e/3fj9TD1o"
+    "NSJPklC/zQIiY5lPQbcjgzHA7/aWiGjFTrEy9JhqPbfcNWJiKybUWfWo0r7p+GDjWE/8hs"
+    "d8Q14Hy+akUKbDhWXULoUeiEwgpTjC3bhJKN20ygaiFcJCNLMpW5rRg6LtUdVSWFhoQbYq"
+    "pVkaMrfzsI2MYU2TNk4opv33GxosvoB7KCn/MXMFGQKkc+w38boMjkHdx6YC/mbl1Pt69d"
+    "AvLUMZAM1dH0JNF8Yc8MfUml6DYpnSIdmdBGcuh7yOv6MARF3qvjAtt00PKd5VWBjCbQUe"
+    "3Q94/BqqwBQH8wAqIwAqBRADHJ0Ana+F09rk7JK/yreXJ6cXrZOj+9xE3c11yWXPzyHr1C"
+    "yCN0ceqPGr/cemhDr4UL+gpll9kLgFGSZkh6UXQwgYrqmCgJetswVAR1OvCZ/cT4MMYdlW"
+    "FEULDixGo4BrAHvNkCKzJwbg8Gd6RnzbL+Vt2C3oj8NvC08eZW//G+LQw/nvxGinEjxUZh"
+    "BmUxxHIkCVnW2gwJ9cMYkp8hmqIZwIbWS0lGUOkZA8owoJxootIzBhRkwNhZrDMBYuQM/h"
+    "LwrzH8Y+QM/oLwyyZ8W2f4x+kZA8owYI0JEKdnDMjPABPJCGklh3+SmEFfGPpyAz9JzKAv"
+    "Y4gRp4I2h3pZBeidnhhT1mPKug4Lak+MKfmZ8obGAL0i8sxiPIgS7hDyZclBYU5cpZOXkB"
+    "uPFIyh9PIGTRkkaoymQXX5+T7SJK8GOhoZ+D+XWT38UVCXaJPBdzDfGguDX/V1UG7VX8FQ"
+    "DEpXz3cVRd8bHfMnYwzwlyOPJx1e7PBdofErwoUo6KRKa2rxEqjDqfvJ5OXIqwQue8c2Rt"
+    "B6GSLL+9qkUz/a4ijTnY/bEreHuWq7UUf+t/BIcv0r7gD5ntfBX8ixn9eh7zOxsgNv2/78"
+    "FR8S2HZm0KSDGyGKYYxffltSeJswa/AHUJE+tWcE2+MMTD/zw84tP/zYPP4tJov9mqZbFV"
+    "3yyimC+1H6ti9Gt6xfEPWMSF0ZQMqq1cVw2YqG6JDHaWO4yz7xp+CPejFh1LsXxBF//xDh"
+    "RJcfCaSm6ZYuYqUfz2PzYNkJ96U3uuXIT+7roC+4cBqWPTXdJ67ajb42yDuR9QfoxhuAch"
+    "iToDgoirC6Mpu++5ZfG1gmEupiDhXw2jCRMtX/QIvdKIHVmDqbVwPfUcY3pzJ2cA9ZUSCR"
+    "+kx1UcIttxf18a0hYfUDd4dMH0XHQp5mQV6YKY37VBrjrMmrN8bpaqg6XubQHC9TFcfLuN"
+    "4oQ/MFkMlXUHOM0DHdsYDu6Fi2oQFFw+KToq7/Vxz0U8Z2nDCuOSqSzf2PUxVrawtf49v3"
+    "xu7BJ5BEwA+G88d7/s/4SO/cDdpxPZB00KazYW5iPM0FgdkwC0maFPpSEscX3VWZCFGBky"
+    "XJA0ZcpAqci7jAkRzTRERzIeM4ifgI/UhZOxOEdYA6y1QS/hxlD/ulpXQ36N8EzeNzgY6+"
+    "jaBWngVRasaH4nywkTZXMTqFnGIhmt0pNo3Z+GRbQj8qaFrNHJKm1UwVNaQq5hSbYWPfhP"
+    "pLUbdYmI5tvOVXblzgLAcbatAGpqGqhR2S1A4YC/KzYKZMZyr+ZwNrjiQFqoBgWZQPGb0w"
+    "ZpRihjemC2n8dGqm9q+h9jsWAloLQJPiasycEFFCFhlQYBK4/jSqniPojpZw60ZgD2grrG"
+    "M2boS+eNvrX3E3SLdmis71tDmU7GddHPHDId+7u+JuDf0FKlecaEOTG0JFfdZvB/0/+F5Q"
+    "5dNwLVN+1r9+/XrFfUW6iiyL+2roCP8wjWd9NBhdcSMETYszJtxohjTFlQj7V7SI65Tqqm"
+    "sr01RnaIioTlskvzebrdZF87h1fnl2enFxdnm89I4mq7KM63bvhkymCBPe3UgJnNhr7qI8"
+    "Br7ww2JB3u2T0NCr1N7JDKpklqJbvJob5qJB2z+JtznK3EMJWs9CrTe8j+J4QFoIWhhM78"
+    "fyuSwEZ/+7KU5hybxdqbwHbHcglCN2cHgu5BzNEZo6LYhrjutQrHWqIpkSUV195bGkq+z8"
+    "NIcGd36aqsGRqphjOCqwS6rryV6qvAPbEB96Q/4O8O0nUcTK+VwxocrB8cKynvX7QeeKu0"
+    "caXjSJto2/zMClD49DAVz3OqPeACv8D46JuAk2wHF/zzr/0AHiLd8dfLni+LkhQXWBnyRx"
+    "1gzKxtuz3ru/AaNbgR8JwytO0aYAL6GQ7FWr0MSIjVVDegG2YqsImw63vadH0BWusW0h4F"
+    "ebKQuHw9+FLQxcy4si/3iHjYGfP3/ir4WyugDQsshHY8OCH3YBZvPdndC/wbQzopYsGYOJ"
+    "+4N7/u7pioO6oUFCaY4VPNJcUCphTZCFjLZg6dBcpO1GexRxu3xhe1ulhzXXs5Yf38+xNM"
+    "sxjO1enx8+0Xcj2hS/SPtpJPDxBQsbpjYI4g2LxDNGKVk0Y6WjGZEul2JymI6xuNIsViH+"
+    "0AJKUtC+fkrSWY516Sx1WTqLr0p/Ee2cvjSlu/AjRGt57isG9S4c92sdL9ugV8YN9em54Q"
+    "40h0yo+ijTF+M2XIZN7Cqc1TFV5n/Zb0ozZrf6IvnkOM/BJ9wqVSy7dbHNB1NNopsexOQ3"
+    "rwO4O48eY2HZOwrLZhtqbEOtCiw48A217j0WSrqOVJritqrMVNtkTQo120vm2aKCoG7JZn"
+    "eye5Oxf8aE8V6F8Z5kh2JJhikL2hhFZyOtPluCeC3RsmVlhAgz7dY07Yr6gzbiCqqaaNh1"
+    "ECdLKbKTlCKFEa4vuJs+A2eSjd9S2UMilDXcimngD5QHurrwF4oD2Zrx1zSWSmQPYUFMPW"
+    "e+kiqwYGO+EorQ2ACqLDHOfn1R19DU3LuPqGHdodqjLFtygtvpq3bsIqSjupqWSCefTVvW"
+    "ss6phajYQc38Z9RwhYaHZqHjmWEadihzl7EdLHXwTpbGtZa7GyjNYMY5pkh95pI3JS23eH"
+    "7pTbFmPijBcdPQsBqTvR+TfozpW1pD/DPo9TtzyO5y1QwxM78xGCJixmDpQ08mNBV7UWBM"
+    "rwjqhPrG/BplArVZkPa+PYG5grR91bGI/F9RsMlCmSyx1TcnqjEqhmw6soVGa4SmFKoVi7"
+    "Tc+FFWRysAp996d8Pz5HBgBJaCLTugQotiBWYhGiNk4FYmb8+OJCpL3FMhV26SxYdmlWbs"
+    "i1V4E6cWjqqd7eG4TivRzcSX5tISgzx97zi0lvn8tnQHlo9eTMOl3m3wbSmuY61VZeJai2"
+    "DukEycmCy1KXydgjNyFjxn29MCbVs5274pOiCzgfncdutzq/AictBGQmz65cc2ScjwpeAb"
+    "l1nJ5Vk1YNrwTdLGMJ4Q4gNEOQPC7uCxfSdwD0Oh0xN7/k7g0rHmVkY3WocCf0cB/XQN0E"
+    "8Z6OVAb60Bemt/oB9/Oj5MzJfaSBGww0RsaOeBmXkp6u+lYM79rToq9mNLh10ZFGM65ulI"
+    "t6ZnuGHIwbKl7LaBqHBDnFk6FZbOtv4HoqNx/UWT2IRpqry+5od+y4scU2Tqr8hIhvGi0K"
+    "59zLhzbUVSZe5uJIxnGzmLsBh6pZ1KSpdcK4paAL71bL3oVZFQwYxQEaI6pOKKoXyeB+V4"
+    "BFoI5fMUlCfzEih7RPVD+aSVA+WTVnouuVYcZRNN/SzYZVbhFXWVBUdj8FkYigIvXnEko3"
+    "kHL8kCyTEulcr+nUecpEuThDDRFemlcLrEEE39BvnmBfbcGauKRDGhss6VrYjYsbL8x8o0"
+    "RTOApuiK5mhgbii0GJBUs5VOvDs31rb87pvexpOxnbAA0gxJLwpFdr9zjX2Mlo3u/KPbDX"
+    "E3kYwQJZg1E/YYJQO9oEhx8SMZjQriniRm0JeBfuxQzjnlRN6nZVeIlkJeNuFbaegDYoZ9"
+    "ESkvSYY2h3rZJZZKzzhQigMmxrl4mF2Clp3IyQLZNuaKVBblMDGDmRLTCC07EASlriKidr"
+    "CB464Vw71Op11dlrmrsJeEsyzXk10wvh8G37HOuybbwz0wrh8G14m6vSbbI10wvlee755P"
+    "pzzTY/SM45XneEj1Lcv0ZBeM71Xmu+SYJqJtZWT6AUJUzPovYP17IhHJGEqZFjqUnqAwSc"
+    "nSFK5x7YB7bBfgYWwZZiE+JAj3wIZ/TxzdvaecGzuKaiu69Yk89j91YY7n5FVVIKlQIWO+"
+    "zGqU2glbj6q8HrEE8CwBfBVYkDe/xRqX5cU2311nGJ5J+DMoK1Lb7+L6jyFSoU2PTfMh53"
+    "F3I9zb0O2sRuBHJIV7BdeaSMXv/aojTiQhKk3XLIJTPMFvHXFyM/GviVPfsJG1Sv1fF5gK"
+    "HR2MIQosZGMVdZqBbJDfO4dk884GugiLoX4PUl/LHo7kcgjw3pjMj1z0Toqa4FXwlKpn1b"
+    "lfmDiiuqw7yjqf+pdl6JOgFbv5ccf68NZOoRaOUt/yEb2dYhs9hnGc5+pB3Cr9IMZx4vJB"
+    "drHmIVzEsblsAHcIysgcG7gjmqgNV2dKWzXWcMPZAIJkEst0AMEND0wO70kO05OC5DuwlZ"
+    "IapFrHtfjObU/4LNwL/dEVh20qBb0iDek2UMfAVmwVkTNcgogrJWyzhYuxJADXw57Q74q3"
+    "vYcrjkjtiakgXbZmyjzUkG8/iSLo3t/gB4wXlgVkbRqqHt0K/EgYeg3wXMCYmJEmjRKrBj"
+    "tAzw7QF+fxK1SdYhm1lhQsnVaedFpVS65SUx969N4cnXKOJ+PWHJ12cuegEd/oXcAsU82W"
+    "hTD6gR8GFH1iFLHQolRr2WllfE2Nf34d8l53Rcy0sLOaYqbFfNnpZppOGm7rHtuVmRbkhW"
+    "MmWvVMNAxraQutUosdVqNEopWfPOtEoboHncfhUOh3njCAWJdug4fBF2GIBfGzftMDwp8P"
+    "QveKO8WKuTgMfp096w9Y5T53W3SxJo9pL7wW/q9L0jl+DOj2xM7gkdiCvz/rQud2AAbX4A"
+    "s/JH44t40w/Cx0weqxJ/i92vwIG3C4m5Omq/UHvZ7gdxI7Q37UuQUdfojf5AS/2OdeVxgA"
+    "cTQYCriAvNsd3+eH4Lonio9u2blrc9z3+jz+ceF12SZvRfokr9rrPuLn46Eh4oLfc9oO3j"
+    "BsNS/OlyOQ/MgafOI9f3eXVAPY3ck7DFB0Y3i9fbvSIcBRchZuVeVwq9UJvDUP8DF+HwS/"
+    "iVOxDKPDdIzDVeawp4hj28xG5itUk4wWNaiq6ZfpJcmrrK8V1Ys3oZB48q4swElqhm8s/B"
+    "v+8HWIlJvWsgGmkO8O4bPqw+uf3VkH4pQuapPObBMw2zMs1GeGSjFcssGNENYo7cQmQPVX"
+    "J7oGk2thS1FiGLAuOm8IvciQkg8rF7YhagZvBN6Z4ZgWGKOJYRYeuHFaBm0i1w+7sHAzjt"
+    "+M00AVvva2ErHIRwdz7+0ybp6y5xOOqU/f8AlH9O8nCroapwSrsNGzk/iG9O0gFeJXTHAh"
+    "fX8+aF+/3N4n+QKnM+Kmk2HT5gsg06/g1keEjm1+5N/8mCpAIuLVRlqhqxnidLsLPGnMxi"
+    "eNnQzvzUeezCyzHNwJQoZ3Hrx//vxZDu8E4U7xbh4q3jaCmodbWUGe0gPLuFNApntxAEBe"
+    "FE2vHiVky2ihZbTsiI+TsqFeAHeyLpYFPkHLkC+APFkhyyKfoGXIv4P8WuGz7+W3CU7U53"
+    "Rmlc1us1fXwXZy26zllHJxpDikAnzTnVEBG6tzHD/LB8XcTxt1PxGLBBQ9Xh4hYun7IpJ4"
+    "E+n73KBAN8AFSkFSksJBhTF6FnNW5ZgzWbE0xbIUDHShZJpxun2kNP2gtQA07Q9H3AeiBB"
+    "Ph0Pxw0HlOC+hHoaggUvd+qqY8SbA6uF2B5EyHssMXC6KybEMDiobVmXXhcrvqkZ7qihZL"
+    "1ZcPJ3/TeE2k6rnBXjYJ3SbTz9Uw5VxBO41HpiLNGhRLza85yrLV4KpNZaw1diJ0zROhr8"
+    "i0Ui9ap0MbIqnhIf3m2VmOvSTcKv0qdVIXC3ObF9qz85vXEN2tZKjDT7Spt2Ck2y4hEpan"
+    "7pASIPz6P6CBj+0="
+)
@@ -0,0 +1,106 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "leaderboard" DROP COLUMN "rank";
+        CREATE INDEX IF NOT EXISTS "idx_leaderboard_game_2b6ac3" ON "leaderboard" ("game", "type", "value");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_leaderboard_game_2b6ac3";
+        ALTER TABLE "leaderboard" ADD "rank" INT NOT NULL DEFAULT 0;"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf2kXyBWJndcGhwNkW0l8m9iB5bSbNgVBS7StjR5ePZK6e/3fj9TD1o"
+    "NSJPklC/zQIiY5lPQbcjgzHA7/aWiGjFTrEy9JhqPbfcNWJiKybUWfWo0r7p+GDjWE/8hs"
+    "d8Q14Hy+akUKbDhWXULoUeiEwgpTjC3bhJKN20ygaiFcJCNLMpW5rRg6LtUdVSWFhoQbYq"
+    "pVkaMrfzsI2MYU2TNk4opv33GxosvoB7KCn/MXMFGQKkc+w38boMjkHdx6YC/mbl1Pt69d"
+    "AvLUMZAM1dH0JNF8Yc8MfUml6DYpnSIdmdBGcuh7yOv6MARF3qvjAtt00PKd5VWBjCbQUe"
+    "3Q94/BqqwBQH8wAqIwAqBRADHJ0Ana+F09rk7JK/yreXJ6cXrZOj+9xE3c11yWXPzyHr1C"
+    "yCN0ceqPGr/cemhDr4UL+gpll9kLgFGSZkh6UXQwgYrqmCgJetswVAR1OvCZ/cT4MMYdlW"
+    "FEULDixGo4BrAHvNkCKzJwbg8Gd6RnzbL+Vt2C3oj8NvC08eZW//G+LQw/nvxGinEjxUZh"
+    "BmUxxHIkCVnW2gwJ9cMYkp8hmqIZwIbWS0lGUOkZA8owoJxootIzBhRkwNhZrDMBYuQM/h"
+    "LwrzH8Y+QM/oLwyyZ8W2f4x+kZA8owYI0JEKdnDMjPABPJCGklh3+SmEFfGPpyAz9JzKAv"
+    "Y4gRp4I2h3pZBeidnhhT1mPKug4Lak+MKfmZ8obGAL0i8sxiPIgS7hDyZclBYU5cpZOXkB"
+    "uPFIyh9PIGTRkkaoymQXX5+T7SJK8GOhoZ+D+XWT38UVCXaJPBdzDfGguDX/V1UG7VX8FQ"
+    "DEpXz3cVRd8bHfMnYwzwlyOPJx1e7PBdofErwoUo6KRKa2rxEqjDqfvJ5OXIqwQue8c2Rt"
+    "B6GSLL+9qkUz/a4ijTnY/bEreHuWq7UUf+t/BIcv0r7gD5ntfBX8ixn9eh7zOxsgNv2/78"
+    "FR8S2HZm0KSDGyGKYYxffltSeJswa/AHUJE+tWcE2+MMTD/zw84tP/zYPP4tJov9mqZbFV"
+    "3yyimC+1H6ti9Gt6xfEPWMSF0ZQMqq1cVw2YqG6JDHaWO4yz7xp+CPejFh1LsXxBF//xDh"
+    "RJcfCaSm6ZYuYqUfz2PzYNkJ96U3uuXIT+7roC+4cBqWPTXdJ67ajb42yDuR9QfoxhuAch"
+    "iToDgoirC6Mpu++5ZfG1gmEupiDhXw2jCRMtX/QIvdKIHVmDqbVwPfUcY3pzJ2cA9ZUSCR"
+    "+kx1UcIttxf18a0hYfUDd4dMH0XHQp5mQV6YKY37VBrjrMmrN8bpaqg6XubQHC9TFcfLuN"
+    "4oQ/MFkMlXUHOM0DHdsYDu6Fi2oQFFw+KToq7/Vxz0U8Z2nDCuOSqSzf2PUxVrawtf49v3"
+    "xu7BJ5BEwA+G88d7/s/4SO/cDdpxPZB00KazYW5iPM0FgdkwC0maFPpSEscX3VWZCFGBky"
+    "XJA0ZcpAqci7jAkRzTRERzIeM4ifgI/UhZOxOEdYA6y1QS/hxlD/ulpXQ36N8EzeNzgY6+"
+    "jaBWngVRasaH4nywkTZXMTqFnGIhmt0pNo3Z+GRbQj8qaFrNHJKm1UwVNaQq5hSbYWPfhP"
+    "pLUbdYmI5tvOVXblzgLAcbatAGpqGqhR2S1A4YC/KzYKZMZyr+ZwNrjiQFqoBgWZQPGb0w"
+    "ZpRihjemC2n8dGqm9q+h9jsWAloLQJPiasycEFFCFhlQYBK4/jSqniPojpZw60ZgD2grrG"
+    "M2boS+eNvrX3E3SLdmis71tDmU7GddHPHDId+7u+JuDf0FKlecaEOTG0JFfdZvB/0/+F5Q"
+    "5dNwLVN+1r9+/XrFfUW6iiyL+2roCP8wjWd9NBhdcSMETYszJtxohjTFlQj7V7SI65Tqqm"
+    "sr01RnaIioTlskvzebrdZF87h1fnl2enFxdnm89I4mq7KM63bvhkymCBPe3UgJnNhr7qI8"
+    "Br7ww2JB3u2T0NCr1N7JDKpklqJbvJob5qJB2z+JtznK3EMJWs9CrTe8j+J4QFoIWhhM78"
+    "fyuSwEZ/+7KU5hybxdqbwHbHcglCN2cHgu5BzNEZo6LYhrjutQrHWqIpkSUV195bGkq+z8"
+    "NIcGd36aqsGRqphjOCqwS6rryV6qvAPbEB96Q/4O8O0nUcTK+VwxocrB8cKynvX7QeeKu0"
+    "caXjSJto2/zMClD49DAVz3OqPeACv8D46JuAk2wHF/zzr/0AHiLd8dfLni+LkhQXWBnyRx"
+    "1gzKxtuz3ru/AaNbgR8JwytO0aYAL6GQ7FWr0MSIjVVDegG2YqsImw63vadH0BWusW0h4F"
+    "ebKQuHw9+FLQxcy4si/3iHjYGfP3/ir4WyugDQsshHY8OCH3YBZvPdndC/wbQzopYsGYOJ"
+    "+4N7/u7pioO6oUFCaY4VPNJcUCphTZCFjLZg6dBcpO1GexRxu3xhe1ulhzXXs5Yf38+xNM"
+    "sxjO1enx8+0Xcj2hS/SPtpJPDxBQsbpjYI4g2LxDNGKVk0Y6WjGZEul2JymI6xuNIsViH+"
+    "0AJKUtC+fkrSWY516Sx1WTqLr0p/Ee2cvjSlu/AjRGt57isG9S4c92sdL9ugV8YN9em54Q"
+    "40h0yo+ijTF+M2XIZN7Cqc1TFV5n/Zb0ozZrf6IvnkOM/BJ9wqVSy7dbHNB1NNopsexOQ3"
+    "rwO4O48eY2HZOwrLZhtqbEOtCiw48A217j0WSrqOVJritqrMVNtkTQo120vm2aKCoG7JZn"
+    "eye5Oxf8aE8V6F8Z5kh2JJhikL2hhFZyOtPluCeC3RsmVlhAgz7dY07Yr6gzbiCqqaaNh1"
+    "ECdLKbKTlCKFEa4vuJs+A2eSjd9S2UMilDXcimngD5QHurrwF4oD2Zrx1zSWSmQPYUFMPW"
+    "e+kiqwYGO+EorQ2ACqLDHOfn1R19DU3LuPqGHdodqjLFtygtvpq3bsIqSjupqWSCefTVvW"
+    "ss6phajYQc38Z9RwhYaHZqHjmWEadihzl7EdLHXwTpbGtZa7GyjNYMY5pkh95pI3JS23eH"
+    "7pTbFmPijBcdPQsBqTvR+TfozpW1pD/DPo9TtzyO5y1QwxM78xGCJixmDpQ08mNBV7UWBM"
+    "rwjqhPrG/BplArVZkPa+PYG5grR91bGI/F9RsMlCmSyx1TcnqjEqhmw6soVGa4SmFKoVi7"
+    "Tc+FFWRysAp996d8Pz5HBgBJaCLTugQotiBWYhGiNk4FYmb8+OJCpL3FMhV26SxYdmlWbs"
+    "i1V4E6cWjqqd7eG4TivRzcSX5tISgzx97zi0lvn8tnQHlo9eTMOl3m3wbSmuY61VZeJai2"
+    "DukEycmCy1KXydgjNyFjxn29MCbVs5274pOiCzgfncdutzq/AictBGQmz65cc2ScjwpeAb"
+    "l1nJ5Vk1YNrwTdLGMJ4Q4gNEOQPC7uCxfSdwD0Oh0xN7/k7g0rHmVkY3WocCf0cB/XQN0E"
+    "8Z6OVAb60Bemt/oB9/Oj5MzJfaSBGww0RsaOeBmXkp6u+lYM79rToq9mNLh10ZFGM65ulI"
+    "t6ZnuGHIwbKl7LaBqHBDnFk6FZbOtv4HoqNx/UWT2IRpqry+5od+y4scU2Tqr8hIhvGi0K"
+    "59zLhzbUVSZe5uJIxnGzmLsBh6pZ1KSpdcK4paAL71bL3oVZFQwYxQEaI6pOKKoXyeB+V4"
+    "BFoI5fMUlCfzEih7RPVD+aSVA+WTVnouuVYcZRNN/SzYZVbhFXWVBUdj8FkYigIvXnEko3"
+    "kHL8kCyTEulcr+nUecpEuThDDRFemlcLrEEE39BvnmBfbcGauKRDGhss6VrYjYsbL8x8o0"
+    "RTOApuiK5mhgbii0GJBUs5VOvDs31rb87pvexpOxnbAA0gxJLwpFdr9zjX2Mlo3u/KPbDX"
+    "E3kYwQJZg1E/YYJQO9oEhx8SMZjQriniRm0JeBfuxQzjnlRN6nZVeIlkJeNuFbaegDYoZ9"
+    "ESkvSYY2h3rZJZZKzzhQigMmxrl4mF2Clp3IyQLZNuaKVBblMDGDmRLTCC07EASlriKidr"
+    "CB464Vw71Op11dlrmrsJeEsyzXk10wvh8G37HOuybbwz0wrh8G14m6vSbbI10wvlee755P"
+    "pzzTY/SM45XneEj1Lcv0ZBeM71Xmu+SYJqJtZWT6AUJUzPovYP17IhHJGEqZFjqUnqAwSc"
+    "nSFK5x7YB7bBfgYWwZZiE+JAj3wIZ/TxzdvaecGzuKaiu69Yk89j91YY7n5FVVIKlQIWO+"
+    "zGqU2glbj6q8HrEE8CwBfBVYkDe/xRqX5cU2311nGJ5J+DMoK1Lb7+L6jyFSoU2PTfMh53"
+    "F3I9zb0O2sRuBHJIV7BdeaSMXv/aojTiQhKk3XLIJTPMFvHXFyM/GviVPfsJG1Sv1fF5gK"
+    "HR2MIQosZGMVdZqBbJDfO4dk884GugiLoX4PUl/LHo7kcgjw3pjMj1z0Toqa4FXwlKpn1b"
+    "lfmDiiuqw7yjqf+pdl6JOgFbv5ccf68NZOoRaOUt/yEb2dYhs9hnGc5+pB3Cr9IMZx4vJB"
+    "drHmIVzEsblsAHcIysgcG7gjmqgNV2dKWzXWcMPZAIJkEst0AMEND9R0ekHrV6g6LCvdjg"
+    "U0PVtIvpNcKTlDqnWOi+/c9oTPwr3QH11x2NhS0CvSkG4DdQxsxVYROdwliLhSwsZcuBiL"
+    "CHA97An9rnjbe7jiiDifmArSZWumzEMN+faTKILu/Q1+wHhhWUDWpqHq0a3Aj4Sh1wBPEo"
+    "yJGWnSKLGcsJP17GR9cR57IjbB5IxUW0sKlmcrT56tqmVdqalznaVd2bHgQD/ww4CiT4wi"
+    "5kaUai2jo4zjpPHPr0PeuK2IzRH2vFJsjphjNt3m0EnDbV3KurI5giRnLPtY9cwKDGtpq6"
+    "JSSyJe+kWiSZ4860QJuAedx+FQ6HeeMIBY/2uDh8EXYYgF8bN+0wPCnw9C94o7xcqkOAx+"
+    "nT3rD1hNPHdbdLH2iWkvvBb+r0vSOX4M6PbEzuCR2C+/P+tC53YABtfgCz8kTiW3jTD8LH"
+    "TB6rEn+L3a/AgbHbibk6arqQa9nuB3EjtDftS5BR1+iN/kBL/Y515XGABxNBgKuIC82x3f"
+    "54fguieKj27Zuasn3/f6PP5x4XXZJm9F+iSv2us+4ufjoSHigt9z6rveMGw1L86XI5D8yB"
+    "p84j1/d5dUA9hFwDuMtnMDUr1NqNLxrFFyFjtU5dih1XGyNU+jMX4fBL+JI6wMo8N0jMNV"
+    "5rCniGPbzEbmK1STjBY1qKrpN8MlyausrxXVizehkHjyrizASWqGbyyWGf7wdYiUa8OyAa"
+    "aQ7w7hs+rD6x9EWQfilC5qk5trEzDbMyzUZ4ZKMVyywY0Q1iiHwiZA9VcnugaTa2FLUWIY"
+    "sC46bwi9yJCS3CkXtiFqBm8E3pnhmBYYo4lhFh64cVoGbSJxDbt9bzOO34yjLRW+w7USgb"
+    "VHB3OJ6zIInLLnEw4QT9/wCYen7yektxpH3qqw0bOTPfn07SAV4ldMcCF9fz5oX79E1Sf5"
+    "ooAzgoCTMcDmCyDTr+DWR4SObX7k3/yYKkAi4tVGWqF7BuJ0uws8aczGJ42dDO/NR57MLL"
+    "Mc3AlChncevH/+/FkO7wThTvFuHireNoKah1tZQZ7SA0sfU0Cme3EAQF4UzRUeJWTLaKFl"
+    "tOyIj5OyoV4Ad7IulgU+QcuQL4A8WSHLIp+gZci/g/xa4bPvJWsJjofndGaVTdWyV9fBdh"
+    "K1rOWUcnGkOKQCfNOdUQEbq3O2PMsHxdxPG3U/EYsEFD0rHSFiuegikngTuejcoEA3wAVK"
+    "QYaNwkGFMXoWc1blmDNZsTTFshQMdKHMkHG6feTn/KC1ADTtD0fcB6IEE+HQ/HDQSTsL6E"
+    "ehqCBS937eoTwZnTq4XYFMQ4eywxcLorJsQwOKhtWZdeFyu+qRnuqKFss7lw8nf9N4TaTq"
+    "ucFeNqPaJnOp1TB/WkE7jUemIs0aFEvNrznKstXgqk1lrDV2InTNE6GvyLRSbw2nQxsiqe"
+    "Eh/ebZWY69JNwq/V5wUhcLc5sX2rPzm9cQ3a2kW8NPtKlXOqTbLiESlnTtkBIg/Po/YKAv"
+    "8A=="
+)
@@ -0,0 +1,105 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "challengehistory" ADD "payload" BYTEA;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "challengehistory" DROP COLUMN "payload";"""
+
+
+MODELS_STATE = (
+    "eJztXetv2zgS/1cEf2kXyBWJndcGhwNkW0l8m9iB5bTbNgVBS7StjR5ePZI6e/3fj9TD1o"
+    "NSJPklC/zQIiY5lPQbcjgzHA7/aWiGjFTrEy9JhqPbfcNWJiKybUWfWo0r7p+GDjWE/8hs"
+    "d8Q14Hy+akUKbDhWXULoUeiEwgpTjC3bhJKN20ygaiFcJCNLMpW5rRg6LtUdVSWFhoQbYq"
+    "pVkaMrfzsI2MYU2TNk4orvP3CxosvoJ7KCn/NnMFGQKkc+w38boMjkHdx6YC/mbl1Pt69d"
+    "AvLUMZAM1dH0JNF8Yc8MfUml6DYpnSIdmdBGcuh7yOv6MARF3qvjAtt00PKd5VWBjCbQUe"
+    "3Q94/BqqwBQH8wAqIwAqBRADHJ0Ana+F09rk7JK/yreXJ6cXrZOj+9xE3c11yWXPzyHr1C"
+    "yCN0ceqPGr/cemhDr4UL+gpll9kLgFGSZkh6VnQwgYrqmCgJetswVAR1OvCZ/cT4MMYdlW"
+    "FEULDixGo4BrAHvNkCKzJwbg8Gd6RnzbL+Vt2C3oj8NvC08eZW//G+LQw/nvxGinEjxUZh"
+    "BmUxxHIkCVnW2gwJ9cMYkp8hmqIZwIbWc0lGUOkZA8owoJxootIzBhRkwNhZrDMBYuQM/h"
+    "LwrzH8Y+QM/oLwyyZ8XWf4x+kZA8owYI0JEKdnDMjPABPJCGklh3+SmEFfGPpyAz9JzKAv"
+    "Y4gRp4I2h3pZBeidnhhT1mPKug4Lak+MKfmZ8orGAL0g8sxiPIgS7hDyZclBYU5cpZPnkB"
+    "uPFIyh9PwKTRkkaoymQXX5+T7SJK8GOhoZ+D+XWT38UVCXaJPBdzDfGguDX/V1UG7VX8FQ"
+    "DEpXz3cVRd8bHfMnYwzwlyOPJx1e7PBdofErwoUo6KRKa2rxEqjDqfvJ5OXIqwQue8c2Rt"
+    "B6HiLL+9qkUz/a4ijTnY/bEreHuWq7UUf+9/BIcv0r7gD5kdfBX8ixn9eh7zOxsgNv2/78"
+    "FR8S2HZm0KSDGyGKYYxffltSeJswa/AnUJE+tWcE2+MMTD/zw84tP/zYPP4tJov9mqZbFV"
+    "3yyimC+1H6ti9Gt6xfEPWMSF0ZQMqq1cVw2YqG6JDHaWO4yz7xp+CPejFh1LsXxBF//xDh"
+    "RJcfCaSm6ZYuYqUfz2PzYNkJ96U3uuXIT+7boC+4cBqWPTXdJ67ajb41yDuR9QfoxiuAch"
+    "iToDgoirC6Mpu++5ZfG1gmEupiDhXw2jCRMtX/QIvdKIHVmDqbVwPfUcY3pzJ2cA9ZUSCR"
+    "+kx1UcIttxf18b0hYfUDd4dMH0XHQp5mQV6YKY37VBrjrMmrN8bpaqg6XubQHC9TFcfLuN"
+    "4oQ/MZkMlXUHOM0DHdsYDu6Fi2oQFFw+KToq7/Vxz0U8Z2nDCuOSqSzf2PUxVrawtf4/uP"
+    "xu7BJ5BEwA+G88d7/s/4SO/cDdpxPZB00KazYW5iPM0FgdkwC0maFPpSEscX3VWZCFGBky"
+    "XJA0ZcpAqci7jAkRzTRERzIeM4ifgI/UxZOxOEdYA6y1QS/hxlD/ulpXQ36N8EzeNzgY6+"
+    "jaBWngVRasaH4nywkTZXMTqFnGIhmt0pNo3Z+GRbQj8qaFrNHJKm1UwVNaQq5hSbYWPfhP"
+    "pzUbdYmI5tvOVXblzgLAcbatAGpqGqhR2S1A4YC/KzYKZMZyr+ZwNrjiQFqoBgWZQPGb0w"
+    "ZpRihjemC2n8dGqm9q+h9jsWAloLQJPiasycEFFCFhlQYBK4/jSqniPojpZw60ZgD2grrG"
+    "M2boS+eNvrX3E3SLdmis71tDmU7CddHPHDId+7u+JuDf0ZKlecaEOTG0JFfdJvB/0/+F5Q"
+    "5dNwLVN+0r99+3bFfUO6iiyL+2boCP8wjSd9NBhdcSMETYszJtxohjTFlQj7V7SI65Tqqm"
+    "sr01RnaIioTlskvzebrdZF87h1fnl2enFxdnm89I4mq7KM63bvhkymCBPe3UgJnNhr7qI8"
+    "Br7ww2JB3u2T0NCr1N7JDKpklqJbvJob5qJB2z+JtznK3EMJWs9CrTe8j+J4QFoIWhhM78"
+    "fyuSwEZ/+7KU5hybxdqbwHbHcglCN2cHgu5BzNEZo6LYhrjutQrHWqIpkSUV195bGkq+z8"
+    "NIcGd36aqsGRqphjOCqwS6rryV6qvAPbEB96Q/4O8O2vooiV87liQpWD44VlPen3g84Vd4"
+    "80vGgSbRt/mYFLHx6HArjudUa9AVb4HxwTcRNsgOP+nnT+oQPEW747+HLF8XNDguoCP0ni"
+    "rBmUjdcnvXd/A0a3Aj8Shlecok0BXkIh2atWoYkRG6uG9AxsxVYRNh1ue18fQVe4xraFgF"
+    "9tpiwcDn8XtjBwLS+K/OMdNgbe3t7w10JZXQBoWeSjsWHBD7sAs/nuTujfYNoZUUuWjMHE"
+    "/cE9f/f1ioO6oUFCaY4VPNJcUCphTZCFjLZg6dBcpO1GexRxu3xhe1ulhzXXs5Yf38+xNM"
+    "sxjO1enx9+pe9GtCl+kfbXkcDHFyxsmNogiDcsEs8YpWTRjJWOZkS6XIrJYTrG4kqzWIX4"
+    "QwsoSUH7+ilJZznWpbPUZeksvir9RbRz+tKU7sKPEK3lua8Y1Lt23M/hQjUg1Y5NVwtCRI"
+    "emGTTeVGX8L3JYAINiIZkjoBBFFCuNnAlfuaVGx5HhdcSZaK5CCVnccsh9auxNtVjrYOAG"
+    "/WlukFbPDVShudJC1UeZXjS34TLgZVeByI6pMs/ZfpPRMY+Dv5ieHOc5soZbpS6obl1s28"
+    "hUk+imh5/5zesA7s7j/lhA/Y4C6tlWKNsKrQILDnwrtHuPhZKuI5WmuK0qM9U2WZNCzfaS"
+    "M7ioIKhbmuCd7Ltl7HwyYbxXYbwn2aFYkmHKgjZG0dlIq8+WIF5LtGxZGSHCTLs1Tbuinr"
+    "yNOPGqJhp27cVjyWB2kgymMML1BXfTpxdNsmVfKu9LhLKGm2gN/IHyQFcX/kJxIJtq/prG"
+    "ksDsIaCLqefMV1IFFmzMV0IRGhtAlaU02q8v6hqamntrFTUgP1R7lGVLTnA7fdWOXWF1VF"
+    "fTEunks2nLWtYJwxAVO2Kb/3QhrtDw0Cx0sDZMw47TFrTn13LysaTPO1ka11rubqA0gxkn"
+    "0CL1mUvelLTc4smzV8Wa+aAEB4VDw2pM9n5M+gG072kN8c+g1x/MIbvLVTPEzPzGYIiIGY"
+    "MFt81Cl7pAU7EXBcb0iqBOqG/Mr1EmxJ6F1+/bE5grvN5XHYvI/xUFmyyUyRJbfXOiGqNi"
+    "yKYjW2i0RmhKoVqxSMuNH0J2tAJw+q13NzxPDgdGYCnYsgMqtChWYBaiMUIGbmUyLu1Ior"
+    "KUSxVy5SZZfGhWaca+WIU3cWrhqNrZHo7rtBLdHIppLi0xyLD4jkNrmYlxS7eX+ejFNFzq"
+    "rRTfl+I61lpVJq61COYOyaGKyVKbwpcpOCOn+HO2PS3QtpWz7auiAzIbmM9ttz63Ci8iB2"
+    "0kxKZffmyThAxfCr5xmZVcnlUDpg3fJG0M4wkhPkCUMyDsDh7bdwL3MBQ6PbHn7wQuHWtu"
+    "ZXSjdSjwdxTQT9cA/ZSBXg701hqgt/YH+vGn48PEfKmNFAE7TMSGdh6YmZei/l4K5tzfqq"
+    "NiP7Z02JVBMaZjno50a3qGG4YcLFvKSxyICjfEmaVTYYmI638gOhrXXzSJTZimyutrfui3"
+    "vMgxRab+ioxkGM8K7cLOjNvyViRV5u5Gwni2kbMIi6EX2qmkdMm1oqgF4FvPs4xeFAkVzA"
+    "gVIapDKq4Yyud5UI5HoIVQPk9BeTIvgbJHVD+UT1o5UD5ppeeSa8VRNtHUz19eZhVeUVdZ"
+    "cDQGn4WhKPDiFUdy0XfwkiyQ7PBSqbztecRJujRJCBNdkZ4Lp0sM0dRvkG9eYM+dsapIFB"
+    "Mq61zZiogdK8t/rExTNANoiq5ojgbmhkKLAUk1W+nEu3NjbcvvvultPBnbCQsgzZD0rFBk"
+    "d+awTtCy0Z1/dLsh7iaSEaIEs2bCHqNkoBcUKS5+JKNRQdyTxAz6MtCPHco5p5zI+7Ts8t"
+    "dSyMsmfC0NfUDMsC8i5SVyfwDUyy6xVHrGgVIcMDHOxcPsErTsRE4WyLYxV6SyKIeJGcyU"
+    "mEZo2YEgKHWJFLWDDRx3rRjudTrt6rLMXYW9JJxluZ7sgvH9MPiOdd412R7ugXH9MLhO1O"
+    "012R7pgvG98nz3fDrlmR6jZxyvPMdDqm9Zpie7YHyvMt8lxzQRbSsj0w8QomLWfwHr3xOJ"
+    "SMZQyrTQofQEhUlKlqZwjWsH3GO7AA9jyzAL8SFBuAc2/Hvi6O4N89zYUVRb0a1P5LH/qQ"
+    "tzPCevqgJJhQoZ82VWo9RO2HpU5fWIJYBnCeCrwIK8+S3WuCwvtvnuOsPwTMKfQVmR2n4X"
+    "138MkQptemyaDzmPuxvh3oZuZzUCPyIp3Cu41kQqfu9XHXEiCVFpumYRnOIJfuuIk5uJf0"
+    "2c+oaNrFXq/7rAVOjoYAxRYCEbq6jTDGSD/N45JJt3NtBFWAz1e5D6WvZwJJdDgPfGZH7k"
+    "ondS1ASvgqdUPavO/cLEEdVl3VHW+dS/LEOfBK3YzY871oe3dgq1cJT6lo/o7RTb6DGM4z"
+    "xXD+JW6QcxjhOXD7KLNQ/hIo7NZQO4Q1BG5tjAHdFEbbg6U9qqsYYbzgYQJJNYpgMIbnig"
+    "ptMLWr9A1WFZ6XYsoOnZQvKd5ErJGVKtc1x857YnfBbuhf7oisPGloJekIZ0G6hjYCu2is"
+    "jhLkHElRI25sLFWESA62FP6HfF297DFUfE+cRUkC5bM2Ueasi3v4oi6N7f4AeMF5YFZG0a"
+    "qh7dCvxIGHoN8CTBmJiRJo0Sywk7Wc9O1hfnsSdiE0zOSLW1pGB5tvLk2apa1pWaOtdZ2p"
+    "UdCw70Ez8MKPrEKGJuRKnWMjrKOE4a//w65I3bitgcYc8rxeaIOWbTbQ6dNNzWpawrmyNI"
+    "csayj1XPrMCwlrYqKrUk4qVfJJrkyZNOlIB70HkcDoV+5ysGEOt/bfAw+CIMsSB+0m96QP"
+    "jzQehecadYmRSHwa+zJ/0Bq4nnbosu1j4x7YXXwv91STrHjwHdntgZPBL75fcnXejcDsDg"
+    "Gnzhh8Sp5LYRhp+FLlg99gS/V5sfYaMDd3PSdDXVoNcT/E5iZ8iPOregww/xm5zgF/vc6w"
+    "oDII4GQwEXkHe74/v8EFz3RPHRLTt39eT7Xp/HPy68LtvkrUif5FV73Uf8fDw0RFzwe059"
+    "1xuGrebF+XIEkh9Zg0+85+/ukmoAuwh4h9F2bkCqtwlVOp41Ss5ih6ocO7Q6TrbmaTTG74"
+    "PgN3GElWF0mI5xuMoc9hRxbJvZyHyBapLRogZVNf1muCR5lfW1onrxJhQST96VBThJzfCN"
+    "xTLDn74OkXJtWDbAFPLdIXxWfXj9gyjrQJzSRW1yc20CZnuGhfrMUCmGSza4EcIa5VDYBK"
+    "j+6kTXYHItbClKDAPWRecVoWcZUpI75cI2RM3gjcA7MxzTAmM0MczCAzdOy6BNJK5ht+9t"
+    "xvGbcbSlwne4ViKw9uhgLnFdBoFT9nzCAeLpGz7h8PT9hPRW48hbFTZ6drInn74dpEL8ig"
+    "kupO/PB+3rl6j6JF8UcEYQcDIG2HwGZPoV3PqI0LHNj/ybH1MFSES82kgrdM9AnG53gSeN"
+    "2fiksZPhvfnIk5llloM7QcjwzoP329tbObwThDvFu3moeNsIah5uZQV5Sg8sfUwBme7FAQ"
+    "B5UTRXeJSQLaOFltGyIz5OyoZ6AdzJulgW+AQtQ74A8mSFLIt8gpYh/w7ya4XPvpesJTge"
+    "ntOZVTZVy15dB9tJ1LKWU8rFkeKQCvBNd0YFbKzO2fIsHxRzP23U/UQsElD0rHSEiOWii0"
+    "jiTeSic4MC3QAXKAUZNgoHFcboWcxZlWPOZMXSFMtSMNCFMkPG6faRn/OD1gLQtD8ccR+I"
+    "EkyEQ/PDQSftLKAfhaKCSN37eYfyZHTq4HYFMg0dyg5fLIjKsg0NKBpWZ9aFy+2qR3qqK1"
+    "os71w+nPxN4zWRqucGe9mMapvMpVbD/GkF7TQemYo0a1AsNb/mKMtWg6s2lbHW2InQNU+E"
+    "viDTSr01nA5tiKSGh/SbZ2c59pJwq/R7wUldLMxtXmjPzm9eQ3S3km4NP9GmXumQbruESF"
+    "jStUNKgPDr/2d2vm0="
+)
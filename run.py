@@ -5,7 +5,6 @@ import tracemalloc
 
 import aiohttp
 import aiohttp.http_websocket
-import asyncpg
 import discord
 from aiohttp_client_cache.backends.redis import RedisBackend
 from aiohttp_client_cache.backends.sqlite import SQLiteBackend
@@ -50,10 +49,9 @@ async def main() -> None:
         ),
     ):
         async with (
-            asyncpg.create_pool(CONFIG.db_url) as pool,
+            Database() as pool,
             aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session,
             CachedSession(cache=backend) as cache_session,
-            Database(),
             translator,
             HoyoBuddy(
                 session=session,
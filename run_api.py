@@ -5,6 +5,7 @@ import uvicorn
 
 from hoyo_buddy.api.app import app
 from hoyo_buddy.config import CONFIG
+from hoyo_buddy.hoyo.clients.gpy import GenshinClientFactory
 from hoyo_buddy.l10n import translator
 from hoyo_buddy.utils import setup_async_event_loop, setup_logging, setup_sentry, wrap_task_factory
 
@@ -24,7 +25,10 @@ async def main() -> None:
         app, host="localhost", port=CONFIG.api_port, log_config=None, log_level=None
     )
     server = uvicorn.Server(config)
-    await server.serve()
+    try:
+        await server.serve()
+    finally:
+        await GenshinClientFactory.close()
 
 
 if __name__ == "__main__":
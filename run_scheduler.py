@@ -4,6 +4,7 @@ import aiohttp
 
 from hoyo_buddy.config import CONFIG
 from hoyo_buddy.db.pgsql import Database
+from hoyo_buddy.hoyo.clients.gpy import GenshinClientFactory
 from hoyo_buddy.l10n import translator
 from hoyo_buddy.scheduler.main import Scheduler
 from hoyo_buddy.utils import setup_async_event_loop, setup_logging, setup_sentry, wrap_task_factory
@@ -24,6 +25,8 @@ async def main() -> None:
                 await asyncio.sleep(1)
         except (KeyboardInterrupt, asyncio.CancelledError):
             scheduler.shutdown()
+        finally:
+            await GenshinClientFactory.close()
 
 
 if __name__ == "__main__":